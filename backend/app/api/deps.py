@@ -5,6 +5,8 @@ from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 
 from app.core.config import settings
 from app.core.security import decode_access_token
+from app.db.s3 import S3_CLIENT_CONFIG
+from app.db.session import get_session
 from app.repositories.user_repository import UserRepository
 from app.models.user import User
 
@@ -18,9 +20,7 @@ async def get_dynamodb_resource() -> AsyncGenerator[Any, None]:
     Yields:
         DynamoDB resource from aioboto3
     """
-    import aioboto3
-
-    session = aioboto3.Session()
+    session = get_session()
     async with session.resource(
         'dynamodb',
         region_name=settings.dynamodb_region,
@@ -35,9 +35,7 @@ async def get_s3_client() -> AsyncGenerator[Any, None]:
     Yields:
         S3 client from aioboto3
     """
-    import aioboto3
-
-    session = aioboto3.Session()
+    session = get_session()
 
     async with session.client(
         's3',
@@ -45,6 +43,7 @@ async def get_s3_client() -> AsyncGenerator[Any, None]:
         endpoint_url=settings.s3_endpoint if settings.s3_endpoint else None,
         aws_access_key_id=settings.s3_access_key if settings.s3_access_key and settings.s3_secret_key else None,
         aws_secret_access_key=settings.s3_secret_key if settings.s3_access_key and settings.s3_secret_key else None,
+        config=S3_CLIENT_CONFIG,
     ) as s3:
         yield s3
 
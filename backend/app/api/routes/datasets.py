@@ -4,7 +4,13 @@ from fastapi import APIRouter, Depends, File, Form, HTTPException, Query, Upload
 
 from app.api.deps import get_current_user, get_dynamodb_resource, get_s3_client
 from app.api.response import api_response, paginated_response
-from app.models.dataset import Dataset, DatasetUpdate, ReimportRequest, S3ImportRequest
+from app.models.dataset import (
+    AUTO_DELIMITER,
+    Dataset,
+    DatasetUpdate,
+    ReimportRequest,
+    S3ImportRequest,
+)
 from app.models.user import User
 from app.repositories.dataset_repository import DatasetRepository
 from app.services.audit_service import AuditService
@@ -130,7 +136,7 @@ async def create_dataset(
         name: Dataset name
         description: Optional description
         encoding: Optional encoding (auto-detected if None)
-        delimiter: Column delimiter (default: comma)
+        delimiter: Column delimiter (default: comma; "auto" to detect it)
         partition_column: Optional column to partition by
         current_user: Authenticated user
         dynamodb: DynamoDB resource
@@ -169,7 +175,7 @@ async def create_dataset(
             dynamodb=dynamodb,
             s3_client=s3_client,
             encoding=encoding,
-            delimiter=delimiter,
+            delimiter=None if delimiter == AUTO_DELIMITER else delimiter,
             partition_column=partition_column,
         )
     except ValueError as e:
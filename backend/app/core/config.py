@@ -35,6 +35,13 @@ class Settings(BaseSettings):
     # File upload
     max_upload_size_bytes: int = 104857600  # 100MB
 
+    # CSV import (False falls back to the pandas reader in parse_full)
+    csv_arrow_reader_enabled: bool = True
+
+    # Parquet output (level is ignored by codecs without levels, e.g. snappy)
+    dataset_parquet_compression: str = "zstd"
+    dataset_parquet_compression_level: int | None = 1
+
     # Executor
     executor_url: str = "http://localhost:8001"
     executor_timeout_seconds: int = 10
@@ -1,5 +1,6 @@
 """Database connection module."""
 from app.db.dynamodb import get_dynamodb_resource
 from app.db.s3 import get_s3_client
+from app.db.session import get_session
 
-__all__ = ["get_dynamodb_resource", "get_s3_client"]
+__all__ = ["get_dynamodb_resource", "get_s3_client", "get_session"]
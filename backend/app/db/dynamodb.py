@@ -1,8 +1,8 @@
 """DynamoDB connection module using aioboto3."""
 from typing import AsyncGenerator, Any
-import aioboto3
 
 from app.core.config import settings
+from app.db.session import get_session
 
 
 async def get_dynamodb_resource() -> AsyncGenerator[Any, None]:
@@ -15,7 +15,7 @@ async def get_dynamodb_resource() -> AsyncGenerator[Any, None]:
     - endpoint_url: Optional custom endpoint (for local development)
     - region_name: AWS region
     """
-    session = aioboto3.Session()
+    session = get_session()
     async with session.resource(
         "dynamodb",
         endpoint_url=settings.dynamodb_endpoint,
@@ -1,9 +1,17 @@
 """S3 connection module using aioboto3."""
 from typing import AsyncGenerator, Any
 import os
-import aioboto3
+from botocore.config import Config
 
 from app.core.config import settings
+from app.db.session import get_session
+
+# Shared client config: reuse connections across concurrent transfers
+S3_CLIENT_CONFIG = Config(
+    max_pool_connections=64,
+    tcp_keepalive=True,
+    retries={'mode': 'standard', 'max_attempts': 5},
+)
 
 
 async def get_s3_client() -> AsyncGenerator[Any, None]:
@@ -22,13 +30,13 @@ async def get_s3_client() -> AsyncGenerator[Any, None]:
     access_key = settings.s3_access_key or os.environ.get('AWS_ACCESS_KEY_ID')
     secret_key = settings.s3_secret_key or os.environ.get('AWS_SECRET_ACCESS_KEY')
 
-    session = aioboto3.Session(
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-    )
+    session = get_session()
     async with session.client(
         "s3",
         endpoint_url=settings.s3_endpoint,
         region_name=settings.s3_region,
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        config=S3_CLIENT_CONFIG,
     ) as s3:
         yield s3
@@ -0,0 +1,17 @@
+"""Shared aioboto3 session."""
+from functools import lru_cache
+import aioboto3
+
+
+@lru_cache(maxsize=1)
+def get_session() -> aioboto3.Session:
+    """Return the process-wide aioboto3 session.
+
+    Creating a session loads botocore's service and endpoint data, so one
+    session is reused for every client and resource. Credentials and
+    endpoints are passed per client, not stored on the session.
+
+    Returns:
+        aioboto3 Session
+    """
+    return aioboto3.Session()
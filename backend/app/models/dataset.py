@@ -9,7 +9,7 @@ from app.models.schema_change import SchemaChange
 class ColumnSchema(BaseModel):
     """Schema definition for a dataset column."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     name: str
     data_type: str
@@ -54,8 +54,15 @@ class DatasetUpdate(BaseModel):
         return v
 
 
+# Delimiter value that asks the import to detect the delimiter from the file
+AUTO_DELIMITER = "auto"
+
+
 class S3ImportRequest(BaseModel):
-    """S3 CSV import request model."""
+    """S3 CSV import request model.
+
+    A delimiter of AUTO_DELIMITER is normalized to None (auto-detect).
+    """
 
     model_config = ConfigDict(from_attributes=True)
 
@@ -63,7 +70,7 @@ class S3ImportRequest(BaseModel):
     s3_bucket: str = Field(min_length=1)
     s3_key: str = Field(min_length=1)
     has_header: bool = True
-    delimiter: str = ","
+    delimiter: Optional[str] = ","
     encoding: Optional[str] = None
     partition_column: Optional[str] = None
 
@@ -75,6 +82,12 @@ class S3ImportRequest(BaseModel):
             raise ValueError("Name cannot be empty")
         return v
 
+    @field_validator("delimiter")
+    @classmethod
+    def normalize_delimiter(cls, v: Optional[str]) -> Optional[str]:
+        """Map AUTO_DELIMITER to None so the service detects the delimiter."""
+        return None if v == AUTO_DELIMITER else v
+
 
 class Dataset(TimestampMixin, BaseModel):
     """Dataset model."""
@@ -91,6 +104,8 @@ class Dataset(TimestampMixin, BaseModel):
     s3_path: Optional[str] = None
     partition_column: Optional[str] = None
     source_config: Optional[dict[str, Any]] = None
+    # sha256 of the last imported source CSV; internal, not part of API responses
+    source_hash: Optional[str] = Field(default=None, exclude=True)
     column_count: int = 0
     last_import_at: Optional[datetime] = None
     last_import_by: Optional[str] = None
@@ -17,7 +17,7 @@ class SchemaChangeType(str, Enum):
 class SchemaChange(BaseModel):
     """Represents a single schema change for a column."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     column_name: str
     change_type: SchemaChangeType
@@ -28,7 +28,7 @@ class SchemaChange(BaseModel):
 class SchemaCompareResult(BaseModel):
     """Result of comparing two schemas."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     has_changes: bool
     changes: list[SchemaChange]
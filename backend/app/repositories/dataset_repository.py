@@ -1,5 +1,8 @@
 """Dataset repository for DynamoDB operations."""
-from typing import Any
+import json
+from typing import Any, Optional
+
+from pydantic import BaseModel
 
 from app.core.config import settings
 from app.models.dataset import Dataset
@@ -20,6 +23,78 @@ class DatasetRepository(BaseRepository[Dataset]):
             model=Dataset
         )
 
+    def _to_dynamodb_item(self, data: dict[str, Any]) -> dict[str, Any]:
+        """Convert Python dict to DynamoDB item, storing schema as a JSON string.
+
+        Args:
+            data: Python dictionary with snake_case keys
+
+        Returns:
+            DynamoDB item with camelCase keys
+        """
+        return super()._to_dynamodb_item(self._encode_schema(data))
+
+    def _from_dynamodb_item(self, item: dict[str, Any]) -> dict[str, Any]:
+        """Convert DynamoDB item to Python dict, decoding a JSON schema string.
+
+        Items written before schema was stored as JSON keep a list of maps,
+        which the base conversion already handles.
+
+        Args:
+            item: DynamoDB item with camelCase keys
+
+        Returns:
+            Python dictionary with snake_case keys
+        """
+        python_dict = super()._from_dynamodb_item(item)
+        schema = python_dict.get('schema')
+        if isinstance(schema, str):
+            python_dict['schema'] = json.loads(schema)
+        return python_dict
+
+    async def update(
+        self,
+        item_id: str,
+        data: dict[str, Any],
+        dynamodb: Any
+    ) -> Optional[Dataset]:
+        """Update an existing dataset, storing schema as a JSON string.
+
+        Args:
+            item_id: Dataset ID
+            data: Fields to update (snake_case keys)
+            dynamodb: DynamoDB resource from aioboto3
+
+        Returns:
+            Updated Dataset instance, or None if not found
+        """
+        return await super().update(item_id, self._encode_schema(data), dynamodb)
+
+    @staticmethod
+    def _encode_schema(data: dict[str, Any]) -> dict[str, Any]:
+        """Return a copy of data with the column schema encoded as one JSON string.
+
+        A single string attribute avoids serializing every column as a
+        nested DynamoDB map on each write. Columns may be passed as
+        ColumnSchema instances so callers skip an intermediate dict copy;
+        each column is then dumped exactly once, here.
+
+        Args:
+            data: Dataset fields (snake_case keys)
+
+        Returns:
+            New dict with 'schema' as a JSON string, or data unchanged if
+            it has no schema list
+        """
+        schema = data.get('schema')
+        if not isinstance(schema, list):
+            return data
+        columns = [
+            col.model_dump() if isinstance(col, BaseModel) else col
+            for col in schema
+        ]
+        return {**data, 'schema': json.dumps(columns, separators=(',', ':'))}
+
     async def list_by_owner(self, owner_id: str, dynamodb: Any) -> list[Dataset]:
         """Retrieve all datasets owned by a specific user.
 
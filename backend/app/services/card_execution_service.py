@@ -9,11 +9,13 @@ from dataclasses import dataclass
 from typing import Any
 
 import httpx
+import pandas as pd
 from botocore.exceptions import ClientError
 
 from app.core.config import settings
 from app.exceptions import DatasetFileNotFoundError
 from app.repositories.dataset_repository import DatasetRepository
+from app.services import executor_arrow
 from app.services.parquet_storage import ParquetReader
 
 logger = logging.getLogger(__name__)
@@ -205,14 +207,14 @@ class CardExecutionService:
         self.dynamodb = dynamodb
         self.s3_client = s3_client
 
-    async def _get_dataset_rows(self, dataset_id: str) -> list[dict[str, Any]]:
-        """Fetch dataset rows from S3.
+    async def _get_dataset_df(self, dataset_id: str) -> pd.DataFrame:
+        """Fetch dataset data from S3.
 
         Args:
             dataset_id: Dataset identifier
 
         Returns:
-            List of row dictionaries
+            DataFrame with the dataset rows (empty if the dataset has no data)
         """
         # Get dataset metadata to find s3_path
         dataset_repo = DatasetRepository()
@@ -220,20 +222,20 @@ class CardExecutionService:
 
         if not dataset:
             logger.warning(f"Dataset not found: {dataset_id}")
-            return []
+            return pd.DataFrame()
 
         if not dataset.s3_path:
             logger.warning(f"S3 path not set for dataset: {dataset_id}")
-            return []
+            return pd.DataFrame()
 
         # Read from S3 using ParquetReader
         if not self.s3_client:
-            return []
+            return pd.DataFrame()
 
         reader = ParquetReader(self.s3_client, settings.s3_bucket_datasets)
 
         try:
-            df = await _maybe_await(reader.read_full(dataset.s3_path))
+            df: pd.DataFrame = await _maybe_await(reader.read_full(dataset.s3_path))
         except DatasetFileNotFoundError as e:
             # Enrich with dataset_id if not already set
             if e.dataset_id is None:
@@ -247,8 +249,7 @@ class CardExecutionService:
                 s3_path=dataset.s3_path, dataset_id=dataset_id
             ) from e
 
-        # Convert DataFrame to list of dicts
-        return df.to_dict(orient='records')
+        return df
 
     async def execute(
         self,
@@ -296,8 +297,8 @@ class CardExecutionService:
                     execution_time_ms=elapsed_ms,
                 )
 
-        # Fetch dataset rows from S3
-        dataset_rows = await self._get_dataset_rows(dataset_id)
+        # Fetch dataset from S3
+        dataset_df = await self._get_dataset_df(dataset_id)
 
         # Execute via Executor API with retry
         data = await self._execute_with_retry(
@@ -305,7 +306,7 @@ class CardExecutionService:
             code=code,
             filters=filters,
             dataset_id=dataset_id,
-            dataset_rows=dataset_rows,
+            dataset_df=dataset_df,
             params=params or {},
         )
 
@@ -328,11 +329,14 @@ class CardExecutionService:
         code: str,
         filters: dict[str, Any],
         dataset_id: str,
-        dataset_rows: list[dict[str, Any]] | None = None,
+        dataset_df: pd.DataFrame | None = None,
         params: dict[str, Any] | None = None,
     ) -> dict[str, Any]:
         """Execute card via Executor API with exponential backoff retry.
 
+        The dataset is sent to /execute/card/arrow as an Arrow IPC stream,
+        so it stays columnar instead of being expanded into JSON rows.
+
         Retries up to MAX_RETRIES times on transient errors (connection errors,
         5xx status codes). Non-retryable errors (4xx) are raised immediately.
 
@@ -341,7 +345,7 @@ class CardExecutionService:
             code: Python code for the card
             filters: Filter parameters
             dataset_id: Dataset identifier
-            dataset_rows: Dataset row data for executor
+            dataset_df: Dataset data for executor
 
         Returns:
             Response data dict from executor
@@ -351,21 +355,27 @@ class CardExecutionService:
         """
         last_error: Exception | None = None
 
+        # Encoded once; retries resend the same body
+        body = executor_arrow.encode_request(
+            {
+                "card_id": card_id,
+                "code": code,
+                "filters": filters,
+                "dataset_id": dataset_id,
+                "params": params or {},
+            },
+            dataset=dataset_df if dataset_df is not None else pd.DataFrame(),
+        )
+
         for attempt in range(MAX_RETRIES):
             try:
                 async with httpx.AsyncClient(
                     timeout=settings.executor_timeout_seconds
                 ) as client:
                     response = await client.post(
-                        f"{settings.executor_url}/execute/card",
-                        json={
-                            "card_id": card_id,
-                            "code": code,
-                            "filters": filters,
-                            "dataset_id": dataset_id,
-                            "dataset_rows": dataset_rows,
-                            "params": params or {},
-                        },
+                        f"{settings.executor_url}/execute/card/arrow",
+                        content=body,
+                        headers={"Content-Type": executor_arrow.ARROW_STREAM_MEDIA_TYPE},
                     )
                     response.raise_for_status()
                     return response.json()
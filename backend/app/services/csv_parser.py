@@ -1,11 +1,38 @@
 """CSV parsing service with encoding detection and flexible import options."""
 
-import io
 from dataclasses import dataclass, field
 from typing import Any, Optional
 
 import chardet
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
+
+from app.core.config import settings
+
+# Delimiters considered by detect_delimiter, in order of preference on ties
+DELIMITER_CANDIDATES = (",", "\t", ";", "|")
+
+# Sample size used for delimiter detection
+DELIMITER_SAMPLE_BYTES = 64 * 1024
+
+# pandas' default NA strings, so the Arrow reader nulls the same cells
+DEFAULT_NULL_VALUES = (
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+)
+
+# Strings read as booleans, matching pandas (Arrow also accepts 1/0)
+TRUE_VALUES = ("True", "TRUE", "true")
+FALSE_VALUES = ("False", "FALSE", "false")
+
+# Block size for the Arrow CSV reader; blocks are parsed in parallel
+ARROW_CSV_BLOCK_SIZE = 8 << 20
+
+# Arrow reads integers beyond int64 as float64; pandas keeps them exact
+INT64_LIMIT = 2 ** 63
 
 
 @dataclass(frozen=True)
@@ -13,11 +40,12 @@ class CsvImportOptions:
     """Options for CSV import configuration.
 
     This is an immutable dataclass to ensure thread safety and prevent
-    accidental modifications after creation.
+    accidental modifications after creation. A delimiter of None means the
+    delimiter is auto-detected, like encoding.
     """
 
     encoding: Optional[str] = None
-    delimiter: str = ","
+    delimiter: Optional[str] = ","
     has_header: bool = True
     null_values: list[str] = field(default_factory=list)
 
@@ -66,8 +94,110 @@ def detect_encoding(file_bytes: bytes) -> str:
     return encoding_lower
 
 
+def detect_delimiter(file_bytes: bytes) -> str:
+    """Detect the column delimiter of a CSV file.
+
+    Counts each candidate delimiter per line over the first 64KB of the file
+    and picks the one that occurs with the same count on the most lines.
+    Counting uses bytes.count, so the sample is scanned in C rather than
+    byte by byte in Python.
+
+    Args:
+        file_bytes: The raw bytes of the CSV file
+
+    Returns:
+        The detected delimiter (comma if nothing better is found)
+    """
+    sample = file_bytes[:DELIMITER_SAMPLE_BYTES]
+    lines = sample.splitlines()
+
+    # The last line of a truncated sample is usually incomplete
+    if len(file_bytes) > DELIMITER_SAMPLE_BYTES and len(lines) > 1:
+        lines = lines[:-1]
+    lines = [line for line in lines if line.strip()]
+
+    best_delimiter = ","
+    best_score = (0, 0)
+    for delimiter in DELIMITER_CANDIDATES:
+        counts = [line.count(delimiter.encode("ascii")) for line in lines]
+        if not counts or counts[0] == 0:
+            continue
+
+        # Rows agreeing with the header's field count, then field count itself
+        score = (counts.count(counts[0]), counts[0])
+        if score > best_score:
+            best_delimiter = delimiter
+            best_score = score
+
+    return best_delimiter
+
+
+def _open_buffer(file_bytes: bytes) -> pa.BufferReader:
+    """Wrap CSV bytes in a read-only file object without copying them.
+
+    Args:
+        file_bytes: The raw bytes of the CSV file
+
+    Returns:
+        A file-like reader over the same memory as file_bytes
+    """
+    return pa.BufferReader(pa.py_buffer(file_bytes))
+
+
+def _encode_marker(text: str, encoding: str) -> bytes:
+    """Encode a short marker as it appears inside a file of the given encoding.
+
+    Args:
+        text: The marker text
+        encoding: The file encoding
+
+    Returns:
+        The encoded marker without any byte order mark
+    """
+    return text.encode(encoding)[len("".encode(encoding)):]
+
+
+def _differs_from_pandas(table: pa.Table, file_bytes: bytes, encoding: str) -> bool:
+    """Check for numeric columns Arrow reads differently from pd.read_csv.
+
+    Arrow parses hex literals such as 0x1F as integers, integers outside
+    int64 as (rounded) float64 and signed integers such as +1 as float64,
+    while pandas keeps them as exact strings, uint64 or int64. None of these
+    can be detected from the values alone, so files where they may occur
+    are read with pandas instead.
+
+    Args:
+        table: The table read by Arrow
+        file_bytes: The raw bytes of the CSV file
+        encoding: The file encoding
+
+    Returns:
+        True if the file should be read with pandas
+    """
+    types = [column_field.type for column_field in table.schema]
+
+    if any(pa.types.is_integer(t) for t in types) and any(
+        _encode_marker(marker, encoding) in file_bytes for marker in ("0x", "0X")
+    ):
+        return True
+
+    has_plus = _encode_marker("+", encoding) in file_bytes
+    for column, column_type in zip(table.columns, types):
+        if pa.types.is_floating(column_type) and column.null_count < len(column):
+            largest = pc.max(pc.abs(column)).as_py()
+            if largest is not None and largest >= INT64_LIMIT:
+                return True
+            if has_plus and pc.all(
+                pc.equal(column, pc.floor(column)), skip_nulls=True
+            ).as_py():
+                return True
+
+    return False
+
+
 def _build_read_params(
     encoding: str,
+    delimiter: str,
     options: CsvImportOptions,
     extra_params: Optional[dict[str, Any]] = None,
 ) -> dict[str, Any]:
@@ -75,6 +205,7 @@ def _build_read_params(
 
     Args:
         encoding: The encoding to use
+        delimiter: The delimiter to use
         options: CSV import configuration
         extra_params: Additional parameters to merge
 
@@ -83,7 +214,7 @@ def _build_read_params(
     """
     params: dict[str, Any] = {
         "encoding": encoding,
-        "delimiter": options.delimiter,
+        "delimiter": delimiter,
         "header": 0 if options.has_header else None,
     }
 
@@ -96,6 +227,82 @@ def _build_read_params(
     return params
 
 
+def _read_csv_arrow(
+    file_bytes: bytes,
+    encoding: str,
+    delimiter: str,
+    options: CsvImportOptions,
+) -> pd.DataFrame:
+    """Parse CSV bytes with Arrow's multithreaded reader.
+
+    Results follow pd.read_csv: the same strings are read as null and as
+    booleans, and date/time-like columns stay strings (Arrow would infer
+    temporal types; those columns are re-read as strings).
+
+    Args:
+        file_bytes: The raw bytes of the CSV file
+        encoding: The encoding to use
+        delimiter: The delimiter to use
+        options: CSV import configuration
+
+    Returns:
+        A pandas DataFrame containing all the data
+
+    Raises:
+        pa.ArrowInvalid: If Arrow cannot parse the file (e.g. it is empty,
+            rows have differing field counts or column names repeat or are
+            empty), or if a numeric column would be read differently from
+            pandas
+    """
+    read_options = pa_csv.ReadOptions(
+        encoding=encoding,
+        block_size=ARROW_CSV_BLOCK_SIZE,
+        autogenerate_column_names=not options.has_header,
+    )
+    parse_options = pa_csv.ParseOptions(delimiter=delimiter)
+    convert_options = pa_csv.ConvertOptions(
+        null_values=[*DEFAULT_NULL_VALUES, *options.null_values],
+        strings_can_be_null=True,
+        true_values=list(TRUE_VALUES),
+        false_values=list(FALSE_VALUES),
+    )
+
+    def read() -> pa.Table:
+        return pa_csv.read_csv(
+            _open_buffer(file_bytes),
+            read_options=read_options,
+            parse_options=parse_options,
+            convert_options=convert_options,
+        )
+
+    table = read()
+    if len(set(table.column_names)) != table.num_columns:
+        raise pa.ArrowInvalid("CSV header has duplicate column names")
+    # pandas names empty header cells "Unnamed: {i}"; Arrow leaves them empty
+    if "" in table.column_names:
+        raise pa.ArrowInvalid("CSV header has empty column names")
+    if _differs_from_pandas(table, file_bytes, encoding):
+        raise pa.ArrowInvalid("CSV has hex or out-of-range integer values")
+
+    temporal = [f.name for f in table.schema if pa.types.is_temporal(f.type)]
+    if temporal:
+        convert_options.column_types = {name: pa.string() for name in temporal}
+        table = read()
+
+    # pandas reads all-empty columns as float64 NaN, or object if header-only
+    null_type = pa.float64() if table.num_rows else pa.string()
+    for i, column_field in enumerate(table.schema):
+        if pa.types.is_null(column_field.type):
+            table = table.set_column(
+                i, column_field.name, table.column(i).cast(null_type)
+            )
+
+    df = table.to_pandas()
+    if not options.has_header:
+        df.columns = pd.RangeIndex(len(df.columns))
+    return df
+
+
 def parse_preview(
     file_bytes: bytes,
     max_rows: int = 1000,
@@ -115,8 +322,11 @@ def parse_preview(
         options = CsvImportOptions()
 
     encoding = options.encoding or detect_encoding(file_bytes)
-    file_like = io.BytesIO(file_bytes)
-    read_params = _build_read_params(encoding, options, {"nrows": max_rows})
+    delimiter = options.delimiter or detect_delimiter(file_bytes)
+    file_like = _open_buffer(file_bytes)
+    read_params = _build_read_params(
+        encoding, delimiter, options, {"nrows": max_rows}
+    )
 
     try:
         df: pd.DataFrame = pd.read_csv(file_like, **read_params)
@@ -131,6 +341,10 @@ def parse_full(
 ) -> pd.DataFrame:
     """Parse the entire CSV file without row limits.
 
+    Uses Arrow's multithreaded CSV reader unless disabled by
+    settings.csv_arrow_reader_enabled, falling back to pandas for files
+    Arrow rejects.
+
     Args:
         file_bytes: The raw bytes of the CSV file
         options: Optional CSV import configuration
@@ -142,8 +356,19 @@ def parse_full(
         options = CsvImportOptions()
 
     encoding = options.encoding or detect_encoding(file_bytes)
-    file_like = io.BytesIO(file_bytes)
-    read_params = _build_read_params(encoding, options, {"low_memory": False})
+    delimiter = options.delimiter or detect_delimiter(file_bytes)
+
+    if settings.csv_arrow_reader_enabled:
+        try:
+            return _read_csv_arrow(file_bytes, encoding, delimiter, options)
+        except (pa.ArrowException, UnicodeError):
+            # Let pandas handle (or report) what Arrow rejects
+            pass
+
+    file_like = _open_buffer(file_bytes)
+    read_params = _build_read_params(
+        encoding, delimiter, options, {"low_memory": False}
+    )
 
     try:
         df: pd.DataFrame = pd.read_csv(file_like, **read_params)
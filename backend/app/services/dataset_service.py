@@ -1,19 +1,34 @@
 """Dataset service for CSV import and preview operations."""
+import asyncio
+import hashlib
 import inspect
-import uuid
+import secrets
+from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Awaitable, Callable
 
 import pandas as pd
+import pyarrow as pa
+from botocore.exceptions import ClientError
 
 from app.core.config import settings
 from app.models.dataset import Dataset
 from app.repositories.dataset_repository import DatasetRepository
-from app.services.csv_parser import CsvImportOptions, parse_full
+from app.services.csv_parser import CsvImportOptions, detect_delimiter, parse_full
 from app.services.parquet_storage import ParquetConverter, ParquetReader
-from app.services.schema_comparator import compare_schemas
+from app.services.schema_comparator import compare_schemas, schema_fingerprint
 from app.services.type_inferrer import infer_schema
 
+# Default number of datasets fetched and written back at a time in bulk reimport
+DEFAULT_REIMPORT_CONCURRENCY = 10
+
+# Default number of source CSVs fetched and saved at a time in bulk S3 import
+DEFAULT_IMPORT_CONCURRENCY = 16
+
+# Source CSVs are fetched in ranged GETs of this size, several at a time
+S3_FETCH_PART_SIZE = 8 << 20
+S3_FETCH_MAX_CONCURRENCY = 16
+
 
 async def _maybe_await(result: Any) -> Any:
     if inspect.isawaitable(result):
@@ -21,6 +36,49 @@ async def _maybe_await(result: Any) -> Any:
     return result
 
 
+@dataclass(frozen=True)
+class BulkImportResult:
+    """Outcome of one item of a bulk import or reimport.
+
+    Attributes:
+        key: Source S3 key (import) or dataset ID (reimport)
+        dataset: Created or updated dataset, None if the item failed
+        error: Exception that failed the item, None on success
+    """
+    key: str
+    dataset: Dataset | None = None
+    error: Exception | None = None
+
+
+async def _run_bulk(
+    jobs: list[tuple[str, Callable[[], Awaitable[Dataset]]]],
+    concurrency: int,
+) -> list[BulkImportResult]:
+    """Run bulk import jobs, at most `concurrency` at a time.
+
+    Each job fetches and commits one source inside the limit, so no more
+    than `concurrency` sources are held in memory. A failed job does not
+    stop the others; its exception is returned in its result.
+
+    Args:
+        jobs: (key, job) pairs
+        concurrency: Maximum number of jobs in flight
+
+    Returns:
+        One result per job, in the order of jobs
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(key: str, job: Callable[[], Awaitable[Dataset]]) -> BulkImportResult:
+        async with semaphore:
+            try:
+                return BulkImportResult(key=key, dataset=await job())
+            except Exception as e:
+                return BulkImportResult(key=key, error=e)
+
+    return list(await asyncio.gather(*(run(key, job) for key, job in jobs)))
+
+
 class DatasetService:
     """Service for dataset operations including CSV import and preview."""
 
@@ -32,7 +90,7 @@ class DatasetService:
         dynamodb: Any,
         s3_client: Any,
         encoding: str | None = None,
-        delimiter: str = ",",
+        delimiter: str | None = ",",
         partition_column: str | None = None,
     ) -> Dataset:
         """Import CSV file and save as Parquet to S3 with metadata in DynamoDB.
@@ -44,7 +102,7 @@ class DatasetService:
             dynamodb: DynamoDB resource
             s3_client: S3 client
             encoding: Optional encoding (auto-detected if None)
-            delimiter: Column delimiter (default: comma)
+            delimiter: Column delimiter (default: comma; auto-detected if None)
             partition_column: Optional column to partition by
 
         Returns:
@@ -79,7 +137,7 @@ class DatasetService:
         source_s3_client: Any,
         has_header: bool = True,
         encoding: str | None = None,
-        delimiter: str = ",",
+        delimiter: str | None = ",",
         partition_column: str | None = None,
     ) -> Dataset:
         """Import CSV file from S3 and save as Parquet.
@@ -94,7 +152,7 @@ class DatasetService:
             source_s3_client: S3 client for source CSV retrieval
             has_header: Whether CSV has header row
             encoding: Optional encoding (auto-detected if None)
-            delimiter: Column delimiter (default: comma)
+            delimiter: Column delimiter (default: comma; auto-detected if None)
             partition_column: Optional column to partition by
 
         Returns:
@@ -129,6 +187,82 @@ class DatasetService:
             },
         )
 
+    async def import_s3_csv_many(
+        self,
+        sources: list[tuple[str, str]],
+        s3_bucket: str,
+        owner_id: str,
+        dynamodb: Any,
+        s3_client: Any,
+        source_s3_client: Any,
+        has_header: bool = True,
+        encoding: str | None = None,
+        delimiter: str | None = ",",
+        partition_column: str | None = None,
+        concurrency: int = DEFAULT_IMPORT_CONCURRENCY,
+    ) -> list[BulkImportResult]:
+        """Import several CSV files from one S3 bucket.
+
+        At most `concurrency` sources are fetched, parsed and saved at a
+        time; each is processed as soon as it arrives, independently of
+        the others.
+
+        Args:
+            sources: (dataset name, source S3 object key) pairs
+            s3_bucket: Source S3 bucket name
+            owner_id: Owner user ID
+            dynamodb: DynamoDB resource
+            s3_client: S3 client for Parquet storage
+            source_s3_client: S3 client for source CSV retrieval
+            has_header: Whether CSVs have a header row
+            encoding: Optional encoding (auto-detected if None)
+            delimiter: Column delimiter (default: comma; auto-detected if None)
+            partition_column: Optional column to partition by
+            concurrency: Maximum number of sources imported at a time
+
+        Returns:
+            One result per source, in order: the created Dataset, or the
+            error (as raised by import_s3_csv) that stopped its import
+
+        Raises:
+            ValueError: If concurrency < 1, owner_id is empty, or any name
+                        is empty
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+        if not owner_id or not owner_id.strip():
+            raise ValueError("owner_id cannot be empty")
+        for name, _ in sources:
+            if not name or not name.strip():
+                raise ValueError("name cannot be empty")
+
+        def job(name: str, s3_key: str) -> Callable[[], Awaitable[Dataset]]:
+            async def run() -> Dataset:
+                file_bytes = await self._fetch_s3_csv(
+                    source_s3_client, s3_bucket, s3_key
+                )
+                return await self._process_and_save_csv(
+                    file_bytes=file_bytes,
+                    name=name.strip(),
+                    owner_id=owner_id,
+                    dynamodb=dynamodb,
+                    s3_client=s3_client,
+                    encoding=encoding,
+                    delimiter=delimiter,
+                    partition_column=partition_column,
+                    source_type='s3_csv',
+                    source_config={
+                        's3_bucket': s3_bucket,
+                        's3_key': s3_key,
+                    },
+                )
+            return run
+
+        return await _run_bulk(
+            [(s3_key, job(name, s3_key)) for name, s3_key in sources],
+            concurrency,
+        )
+
     async def get_column_values(
         self,
         dataset: Dataset,
@@ -236,18 +370,18 @@ class DatasetService:
         Returns:
             Dataset ID (e.g., ds_a1b2c3d4e5f6)
         """
-        return f"ds_{uuid.uuid4().hex[:12]}"
+        return f"ds_{secrets.token_hex(6)}"
 
     def _build_csv_options(
         self,
         encoding: str | None,
-        delimiter: str,
+        delimiter: str | None,
     ) -> CsvImportOptions:
         """Build CSV import options.
 
         Args:
             encoding: Optional encoding
-            delimiter: Delimiter character
+            delimiter: Delimiter character (auto-detected if None)
 
         Returns:
             CsvImportOptions instance
@@ -299,6 +433,7 @@ class DatasetService:
         dynamodb: Any,
         source_type: str = 'csv',
         source_config: dict[str, Any] | None = None,
+        source_hash: str | None = None,
     ) -> Dataset:
         """Save dataset metadata to DynamoDB.
 
@@ -313,6 +448,7 @@ class DatasetService:
             dynamodb: DynamoDB resource
             source_type: Source type identifier (default: 'csv')
             source_config: Optional source configuration dict
+            source_hash: Optional content hash of the source CSV
 
         Returns:
             Created Dataset instance
@@ -325,11 +461,12 @@ class DatasetService:
             'description': None,
             'source_type': source_type,
             'row_count': len(df),
-            'schema': [col.model_dump() for col in schema],
+            'schema': schema,
             'owner_id': owner_id,
             's3_path': storage_result.s3_path,
             'partition_column': partition_column,
             'source_config': source_config,
+            'source_hash': source_hash,
             'column_count': len(df.columns),
             'last_import_at': now,
             'last_import_by': owner_id,
@@ -377,8 +514,10 @@ class DatasetService:
         Returns:
             Preview dictionary with rows as array of arrays
         """
-        # Convert DataFrame rows to list of lists for frontend compatibility
-        rows_as_lists = df.values.tolist()
+        # Convert column-wise through Arrow, then transpose to list of
+        # lists for frontend compatibility (missing values become None)
+        columns = pa.Table.from_pandas(df, preserve_index=False).to_pydict()
+        rows_as_lists = [list(row) for row in zip(*columns.values())]
         return {
             'columns': df.columns.tolist(),
             'rows': rows_as_lists,
@@ -394,7 +533,7 @@ class DatasetService:
         dynamodb: Any,
         s3_client: Any,
         encoding: str | None,
-        delimiter: str,
+        delimiter: str | None,
         partition_column: str | None,
         source_type: str = 'csv',
         source_config: dict[str, Any] | None = None,
@@ -408,10 +547,11 @@ class DatasetService:
             dynamodb: DynamoDB resource
             s3_client: S3 client
             encoding: Optional encoding
-            delimiter: Column delimiter
+            delimiter: Column delimiter (auto-detected if None)
             partition_column: Optional partition column
             source_type: Source type identifier (default: 'csv')
-            source_config: Optional source configuration dict
+            source_config: Optional source configuration dict; the
+                delimiter used is recorded in it for reimports
 
         Returns:
             Created Dataset instance
@@ -422,6 +562,12 @@ class DatasetService:
         # Generate dataset ID
         dataset_id = self._generate_dataset_id()
 
+        # Resolve the delimiter once so reimports parse the source the same way
+        if delimiter is None:
+            delimiter = detect_delimiter(file_bytes)
+        if source_config is not None:
+            source_config = {**source_config, 'delimiter': delimiter}
+
         # Parse CSV
         csv_options = self._build_csv_options(encoding, delimiter)
         df = parse_full(file_bytes, csv_options)
@@ -449,6 +595,7 @@ class DatasetService:
             dynamodb=dynamodb,
             source_type=source_type,
             source_config=source_config,
+            source_hash=self._hash_source(file_bytes),
         )
 
     async def reimport_dry_run(
@@ -519,17 +666,112 @@ class DatasetService:
             ValueError: If dataset not found, not s3_csv type, S3 file not found,
                         or schema changes detected without force=True
         """
-        dataset, df, new_schema = await self._prepare_reimport(
+        dataset, file_bytes = await self._load_reimport_source(
             dataset_id, dynamodb, source_s3_client
         )
 
-        # Compare schemas
-        old_schema = dataset.columns or []
-        compare_result = compare_schemas(old_schema, new_schema)
+        return await self._commit_reimport(
+            dataset, file_bytes, user_id, dynamodb, s3_client, force
+        )
+
+    async def reimport_execute_many(
+        self,
+        dataset_ids: list[str],
+        user_id: str,
+        dynamodb: Any,
+        s3_client: Any,
+        source_s3_client: Any,
+        force: bool = False,
+        concurrency: int = DEFAULT_REIMPORT_CONCURRENCY,
+    ) -> list[BulkImportResult]:
+        """Execute reimport for several datasets.
+
+        At most `concurrency` datasets are fetched and written back at a
+        time. Each dataset is validated and committed as in
+        reimport_execute, independently of the others.
+
+        Args:
+            dataset_ids: Dataset IDs to reimport
+            user_id: User performing the reimport
+            dynamodb: DynamoDB resource
+            s3_client: S3 client for Parquet storage
+            source_s3_client: S3 client for source CSV retrieval
+            force: If True, proceed even with schema changes
+            concurrency: Maximum number of datasets reimported at a time
+
+        Returns:
+            One result per dataset ID, in order: the updated Dataset, or the
+            error (as raised by reimport_execute) that stopped its reimport
+
+        Raises:
+            ValueError: If concurrency < 1
+        """
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        def job(dataset_id: str) -> Callable[[], Awaitable[Dataset]]:
+            return lambda: self.reimport_execute(
+                dataset_id, user_id, dynamodb, s3_client, source_s3_client, force
+            )
+
+        return await _run_bulk(
+            [(dataset_id, job(dataset_id)) for dataset_id in dataset_ids],
+            concurrency,
+        )
+
+    async def _commit_reimport(
+        self,
+        dataset: Dataset,
+        file_bytes: bytes,
+        user_id: str,
+        dynamodb: Any,
+        s3_client: Any,
+        force: bool,
+    ) -> Dataset:
+        """Parse the source CSV, check schema changes, then write data and metadata.
+
+        If the source CSV is byte-identical to the one last imported, the
+        Parquet data is left as is and only the import timestamp is updated.
+
+        Args:
+            dataset: Existing dataset
+            file_bytes: Source CSV bytes
+            user_id: User performing the reimport
+            dynamodb: DynamoDB resource
+            s3_client: S3 client for Parquet storage
+            force: If True, proceed even with schema changes
+
+        Returns:
+            Updated Dataset instance
+
+        Raises:
+            ValueError: If schema changes detected without force=True,
+                        or dataset disappears during update
+        """
+        dataset_id = dataset.id
+        repo = DatasetRepository()
+        now = datetime.now(timezone.utc)
+
+        # Unchanged source: skip parse, encode and upload
+        source_hash = self._hash_source(file_bytes)
+        if dataset.source_hash == source_hash:
+            touched_dataset = await repo.update(
+                dataset_id,
+                {'last_import_at': now, 'last_import_by': user_id},
+                dynamodb,
+            )
+            if not touched_dataset:
+                raise ValueError("Dataset not found after update")
+            return touched_dataset
 
-        # Check for schema changes
-        if compare_result.has_changes and not force:
-            raise ValueError("Schema changes detected. Use force=True to proceed.")
+        df, new_schema = self._parse_reimport_source(dataset, file_bytes)
+
+        # Check for schema changes (identical fingerprints cannot differ)
+        old_schema = dataset.columns or []
+        if not force and schema_fingerprint(old_schema) != schema_fingerprint(new_schema):
+            compare_result = compare_schemas(old_schema, new_schema)
+            if compare_result.has_changes:
+                raise ValueError("Schema changes detected. Use force=True to proceed.")
 
         # Save to S3 (overwrite existing path)
         storage_result = await self._save_to_s3(
@@ -537,19 +779,18 @@ class DatasetService:
         )
 
         # Update metadata in DynamoDB (preserve created_at via update)
-        repo = DatasetRepository()
-        now = datetime.now(timezone.utc)
         updated_data = {
             'name': dataset.name,
             'description': dataset.description,
             'source_type': dataset.source_type,
             'row_count': len(df),
             'column_count': len(df.columns),
-            'schema': [col.model_dump() for col in new_schema],
+            'schema': new_schema,
             'owner_id': dataset.owner_id,
             's3_path': storage_result.s3_path,
             'partition_column': dataset.partition_column,
             'source_config': dataset.source_config,
+            'source_hash': source_hash,
             'last_import_at': now,
             'last_import_by': user_id,
         }
@@ -575,6 +816,32 @@ class DatasetService:
         Returns:
             Tuple of (Dataset, DataFrame, new_schema)
 
+        Raises:
+            ValueError: If dataset not found, not s3_csv type, or S3 file not found
+        """
+        dataset, file_bytes = await self._load_reimport_source(
+            dataset_id, dynamodb, source_s3_client
+        )
+        df, new_schema = self._parse_reimport_source(dataset, file_bytes)
+
+        return dataset, df, new_schema
+
+    async def _load_reimport_source(
+        self,
+        dataset_id: str,
+        dynamodb: Any,
+        source_s3_client: Any,
+    ) -> tuple[Dataset, bytes]:
+        """Fetch a reimportable dataset and its source CSV bytes.
+
+        Args:
+            dataset_id: Dataset ID to reimport
+            dynamodb: DynamoDB resource
+            source_s3_client: S3 client for source CSV retrieval
+
+        Returns:
+            Tuple of (Dataset, CSV bytes)
+
         Raises:
             ValueError: If dataset not found, not s3_csv type, or S3 file not found
         """
@@ -599,7 +866,23 @@ class DatasetService:
             source_s3_client, s3_bucket, s3_key
         )
 
-        # Parse CSV and infer schema
+        return dataset, file_bytes
+
+    def _parse_reimport_source(
+        self,
+        dataset: Dataset,
+        file_bytes: bytes,
+    ) -> tuple[pd.DataFrame, list[Any]]:
+        """Parse source CSV bytes with the dataset's import options.
+
+        Args:
+            dataset: Dataset being reimported
+            file_bytes: Source CSV bytes
+
+        Returns:
+            Tuple of (DataFrame, new_schema)
+        """
+        source_config = dataset.source_config or {}
         csv_options = self._build_csv_options(
             source_config.get('encoding'),
             source_config.get('delimiter', ','),
@@ -607,7 +890,19 @@ class DatasetService:
         df = parse_full(file_bytes, csv_options)
         new_schema = infer_schema(df)
 
-        return dataset, df, new_schema
+        return df, new_schema
+
+    @staticmethod
+    def _hash_source(file_bytes: bytes) -> str:
+        """Compute the content hash used to detect unchanged source files.
+
+        Args:
+            file_bytes: Source CSV bytes
+
+        Returns:
+            Hex-encoded SHA-256 digest
+        """
+        return hashlib.sha256(file_bytes).hexdigest()
 
     async def _fetch_s3_csv(
         self,
@@ -617,30 +912,99 @@ class DatasetService:
     ) -> bytes:
         """Fetch CSV file from S3.
 
+        The first part is fetched with a ranged GET whose Content-Range
+        reveals the object size; remaining parts of S3_FETCH_PART_SIZE are
+        then fetched concurrently (up to S3_FETCH_MAX_CONCURRENCY at a time)
+        and pinned to the first part's ETag. Each part is copied into a
+        buffer of the object size as soon as it arrives, so peak memory is
+        the object plus the parts in flight.
+
         Args:
             source_s3_client: S3 client for source bucket
             s3_bucket: S3 bucket name
             s3_key: S3 object key
 
         Returns:
-            CSV file bytes
+            CSV file bytes (a bytearray when fetched in several parts)
 
         Raises:
             ValueError: If S3 file not found
         """
-        try:
+        async def get_range(start: int, end: int, **extra: Any) -> dict[str, Any]:
             # Handle both sync and async get_object
-            get_object_result = source_s3_client.get_object(
-                Bucket=s3_bucket, Key=s3_key
-            )
-            response = await _maybe_await(get_object_result)
-            body = response['Body']
+            return await _maybe_await(source_s3_client.get_object(
+                Bucket=s3_bucket, Key=s3_key, Range=f"bytes={start}-{end}", **extra
+            ))
+
+        async def read_body(response: dict[str, Any]) -> bytes:
             # Handle both sync and async read
-            read_result = body.read()
-            read_bytes = await _maybe_await(read_result)
-            return read_bytes
+            return await _maybe_await(response['Body'].read())
+
+        try:
+            try:
+                first = await get_range(0, S3_FETCH_PART_SIZE - 1)
+            except ClientError as e:
+                # S3 rejects any range on a zero-byte object
+                if e.response.get('Error', {}).get('Code') == 'InvalidRange':
+                    return b""
+                raise
+            head = await read_body(first)
+
+            total_size = self._parse_content_range_size(first.get('ContentRange'))
+            if total_size is None or total_size <= len(head):
+                return head
+
+            etag = first.get('ETag')
+            extra = {'IfMatch': etag} if etag else {}
+            semaphore = asyncio.Semaphore(S3_FETCH_MAX_CONCURRENCY)
+
+            # A bytearray works wherever the CSV bytes are used, and returning
+            # it avoids a second full-size copy
+            buffer = bytearray(total_size)
+            head_size = len(head)
+            buffer[:head_size] = head
+            del head
+
+            async def fetch_part(start: int) -> None:
+                end = min(start + S3_FETCH_PART_SIZE, total_size) - 1
+                async with semaphore:
+                    part = await read_body(await get_range(start, end, **extra))
+                if len(part) != end - start + 1:
+                    raise ValueError(
+                        f"short read for bytes {start}-{end}: got {len(part)} bytes"
+                    )
+                buffer[start:end + 1] = part
+
+            tasks = [
+                asyncio.create_task(fetch_part(start))
+                for start in range(head_size, total_size, S3_FETCH_PART_SIZE)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                raise
+            return buffer
         except Exception as e:
             error_str = str(e)
             if 'NoSuchKey' in error_str or 'Not Found' in error_str or '404' in error_str:
                 raise ValueError(f"S3 file not found: s3://{s3_bucket}/{s3_key}")
             raise ValueError(f"S3 error retrieving s3://{s3_bucket}/{s3_key}: {error_str}")
+
+    @staticmethod
+    def _parse_content_range_size(content_range: str | None) -> int | None:
+        """Extract the total object size from a Content-Range header.
+
+        Args:
+            content_range: Header value such as 'bytes 0-99/1234'
+
+        Returns:
+            Total size in bytes, or None if the header is absent or the size
+            is unknown ('*')
+        """
+        if not content_range or '/' not in content_range:
+            return None
+        size = content_range.rsplit('/', 1)[1]
+        return int(size) if size.isdigit() else None
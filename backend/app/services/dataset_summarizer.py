@@ -1,10 +1,13 @@
 """Dataset summarizer service for generating dataset metadata and statistics."""
+from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Any
+import copy
 import logging
 
 import pandas as pd
-import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
 
 from app.services.parquet_storage import ParquetReader
 
@@ -13,6 +16,13 @@ logger = logging.getLogger(__name__)
 DEFAULT_SAMPLE_ROWS = 5
 GENERATE_SUMMARY_PREVIEW_ROWS = 1000
 TOP_VALUES_LIMIT = 10
+SUMMARY_CACHE_MAXSIZE = 128
+
+SummaryCacheKey = tuple[str, str, str, tuple[str, ...] | None]
+
+# generate_summary results per (bucket, s3_path, ETag, columns). Kept at module
+# scope because callers create a DatasetSummarizer per request.
+_summary_cache: OrderedDict[SummaryCacheKey, dict[str, Any]] = OrderedDict()
 
 
 @dataclass
@@ -38,13 +48,20 @@ class DatasetSummary:
 class DatasetSummarizer:
     """Generates a DatasetSummary by reading data through a ParquetReader."""
 
-    def __init__(self, parquet_reader: ParquetReader) -> None:
+    def __init__(
+        self,
+        parquet_reader: ParquetReader,
+        summary_cache: OrderedDict[SummaryCacheKey, dict[str, Any]] | None = None,
+    ) -> None:
         """Initialize DatasetSummarizer.
 
         Args:
             parquet_reader: ParquetReader instance for reading datasets from S3.
+            summary_cache: LRU cache for generate_summary results. Defaults to
+                the module-level cache shared by all instances.
         """
         self.parquet_reader = parquet_reader
+        self._summary_cache = _summary_cache if summary_cache is None else summary_cache
 
     async def summarize(
         self,
@@ -64,9 +81,11 @@ class DatasetSummarizer:
         """
         df = await self.parquet_reader.read_full(s3_path)
 
-        schema = self._build_schema(df)
-        sample_rows = self._build_sample_rows(df, max_sample_rows)
-        statistics = self._build_statistics(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
+
+        schema = self._build_schema(df, table)
+        sample_rows = self._build_sample_rows(table, max_sample_rows)
+        statistics = self._build_statistics(df, table)
 
         return DatasetSummary(
             name=name,
@@ -77,7 +96,9 @@ class DatasetSummarizer:
             statistics=statistics,
         )
 
-    async def generate_summary(self, s3_path: str) -> dict[str, Any]:
+    async def generate_summary(
+        self, s3_path: str, columns: list[str] | None = None
+    ) -> dict[str, Any]:
         """Generate a dataset summary from a Parquet file in S3.
 
         Processing flow:
@@ -88,42 +109,74 @@ class DatasetSummarizer:
              - String/object: unique_count, top_values (top 10), null_count
              - Datetime: min, max (ISO strings), null_count
 
+        Results for single-file paths are cached per (bucket, s3_path, ETag)
+        across instances, so repeated calls for an unchanged file cost one
+        HEAD request instead of a download.
+
         Args:
             s3_path: S3 path to the Parquet file or directory.
+            columns: Columns to summarize (optional, all columns if None).
+                Only these columns are decoded from Parquet.
 
         Returns:
             Dict with keys: schema, statistics, row_count, column_count.
         """
+        etag = await self.parquet_reader.get_etag(s3_path)
+        cache_key = (
+            (
+                self.parquet_reader.bucket,
+                s3_path,
+                etag,
+                tuple(columns) if columns is not None else None,
+            )
+            if etag else None
+        )
+        if cache_key in self._summary_cache:
+            self._summary_cache.move_to_end(cache_key)
+            return copy.deepcopy(self._summary_cache[cache_key])
+
         df = await self.parquet_reader.read_preview(
-            s3_path, GENERATE_SUMMARY_PREVIEW_ROWS
+            s3_path, GENERATE_SUMMARY_PREVIEW_ROWS, columns=columns
         )
 
-        schema = self._build_generate_schema(df)
-        statistics = self._build_generate_statistics(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
 
-        return {
+        schema = self._build_generate_schema(df, table)
+        statistics = self._build_generate_statistics(df, table)
+
+        summary = {
             'schema': schema,
             'statistics': statistics,
             'row_count': len(df),
             'column_count': len(df.columns),
         }
 
+        if cache_key is not None:
+            self._summary_cache[cache_key] = copy.deepcopy(summary)
+            if len(self._summary_cache) > SUMMARY_CACHE_MAXSIZE:
+                self._summary_cache.popitem(last=False)
+
+        return summary
+
     # ------------------------------------------------------------------
     # Private helpers for generate_summary
     # ------------------------------------------------------------------
 
-    def _build_generate_schema(self, df: pd.DataFrame) -> list[dict[str, Any]]:
+    def _build_generate_schema(
+        self, df: pd.DataFrame, table: pa.Table
+    ) -> list[dict[str, Any]]:
         """Build schema information for generate_summary.
 
         Args:
             df: Source DataFrame.
+            table: Arrow table built from the same DataFrame.
 
         Returns:
             List of dicts with name, dtype, and nullable keys.
         """
         schema: list[dict[str, Any]] = []
-        for col in df.columns:
-            nullable = bool(df[col].isna().any()) if len(df) > 0 else False
+        for i, col in enumerate(df.columns):
+            nullable = table.column(i).null_count > 0
             schema.append({
                 'name': col,
                 'dtype': str(df[col].dtype),
@@ -131,7 +184,9 @@ class DatasetSummarizer:
             })
         return schema
 
-    def _build_generate_statistics(self, df: pd.DataFrame) -> dict[str, Any]:
+    def _build_generate_statistics(
+        self, df: pd.DataFrame, table: pa.Table
+    ) -> dict[str, Any]:
         """Compute per-column statistics for generate_summary.
 
         Dispatches to type-specific helpers based on column dtype:
@@ -141,106 +196,147 @@ class DatasetSummarizer:
 
         Args:
             df: Source DataFrame.
+            table: Arrow table built from the same DataFrame.
 
         Returns:
             Dict keyed by column name.
         """
-        stats: dict[str, Any] = {}
-        for col in df.columns:
+        statistics: dict[str, Any] = {}
+        for i, col in enumerate(df.columns):
+            column = table.column(i)
+            dtype = df.dtypes.iloc[i]
             col_stats: dict[str, Any] = {}
-            col_stats['null_count'] = int(df[col].isna().sum())
+            col_stats['null_count'] = column.null_count
 
-            if pd.api.types.is_numeric_dtype(df[col]):
-                col_stats.update(self._generate_numeric_stats(df[col]))
-            elif pd.api.types.is_datetime64_any_dtype(df[col]):
-                col_stats.update(self._generate_datetime_stats(df[col]))
+            if pd.api.types.is_numeric_dtype(dtype):
+                col_stats.update(self._generate_numeric_stats(column))
+            elif pd.api.types.is_datetime64_any_dtype(dtype):
+                col_stats.update(self._generate_datetime_stats(column))
             else:
-                col_stats.update(self._generate_string_stats(df[col]))
+                col_stats.update(self._generate_string_stats(column))
 
-            stats[col] = col_stats
-        return stats
+            statistics[col] = col_stats
+        return statistics
 
-    def _generate_numeric_stats(self, series: pd.Series) -> dict[str, Any]:
+    def _generate_numeric_stats(self, column: pa.ChunkedArray) -> dict[str, Any]:
         """Compute statistics for a numeric column.
 
         Args:
-            series: Numeric pandas Series.
+            column: Numeric (or boolean) Arrow column.
 
         Returns:
             Dict with min, max, mean, std.
         """
-        non_null = series.dropna()
-        if len(non_null) == 0:
+        if column.null_count == len(column):
             return {
                 'min': None,
                 'max': None,
                 'mean': None,
                 'std': None,
             }
+        min_max = pc.min_max(column)
+        # mean/stddev kernels have no boolean implementation
+        values = column.cast(pa.int8()) if pa.types.is_boolean(column.type) else column
         return {
-            'min': self._to_python_scalar(series.min()),
-            'max': self._to_python_scalar(series.max()),
-            'mean': self._to_python_scalar(series.mean()),
-            'std': self._to_python_scalar(series.std()),
+            'min': min_max['min'].as_py(),
+            'max': min_max['max'].as_py(),
+            'mean': pc.mean(values).as_py(),
+            'std': pc.stddev(values, ddof=1).as_py(),
         }
 
-    def _generate_datetime_stats(self, series: pd.Series) -> dict[str, Any]:
+    def _generate_datetime_stats(self, column: pa.ChunkedArray) -> dict[str, Any]:
         """Compute statistics for a datetime column.
 
         Args:
-            series: Datetime pandas Series.
+            column: Timestamp Arrow column.
 
         Returns:
             Dict with min and max as ISO-format strings (or None if all NaT).
         """
-        non_null = series.dropna()
-        if len(non_null) == 0:
+        if column.null_count == len(column):
             return {
                 'min': None,
                 'max': None,
             }
+        min_max = pc.min_max(column)
         return {
-            'min': non_null.min().isoformat(),
-            'max': non_null.max().isoformat(),
+            'min': min_max['min'].as_py().isoformat(),
+            'max': min_max['max'].as_py().isoformat(),
         }
 
-    def _generate_string_stats(self, series: pd.Series) -> dict[str, Any]:
+    def _generate_string_stats(self, column: pa.ChunkedArray) -> dict[str, Any]:
         """Compute statistics for a string/object column.
 
         Args:
-            series: String/object pandas Series.
+            column: Non-numeric, non-datetime Arrow column.
 
         Returns:
             Dict with unique_count and top_values (list of {value, count}).
         """
-        non_null = series.dropna()
-        unique_count = int(non_null.nunique())
-        value_counts = non_null.value_counts().head(TOP_VALUES_LIMIT)
+        if column.null_count == len(column):
+            return {
+                'unique_count': 0,
+                'top_values': [],
+            }
+        # One value_counts pass yields both the distinct count and the top N
+        value_counts = pc.value_counts(column.drop_null())
         top_values = [
-            {'value': str(val), 'count': int(cnt)}
-            for val, cnt in value_counts.items()
+            {'value': str(item['values']), 'count': item['counts']}
+            for item in value_counts.take(
+                self._top_k_indices(value_counts.field('counts'), TOP_VALUES_LIMIT)
+            ).to_pylist()
         ]
+        unique_count = len(value_counts)
         return {
             'unique_count': unique_count,
             'top_values': top_values,
         }
 
+    @staticmethod
+    def _top_k_indices(counts: pa.Array, k: int) -> pa.Array:
+        """Select the indices of the k largest counts.
+
+        A partial selection finds the top k without sorting every distinct
+        value; only those k are then ordered, by count descending and
+        first-seen position among equal counts.
+
+        Args:
+            counts: Per-value counts in first-seen order.
+            k: Number of indices to return.
+
+        Returns:
+            Up to k indices into counts.
+        """
+        if len(counts) > k:
+            indices = pc.select_k_unstable(
+                counts, k=k, sort_keys=[('counts', 'descending')]
+            )
+        else:
+            indices = pa.array(range(len(counts)), type=pa.uint64())
+        candidates = pa.table({'index': indices, 'count': counts.take(indices)})
+        order = pc.sort_indices(
+            candidates,
+            sort_keys=[('count', 'descending'), ('index', 'ascending')],
+        )
+        return indices.take(order)
+
     # ------------------------------------------------------------------
     # Private helpers for summarize (legacy)
     # ------------------------------------------------------------------
 
-    def _build_schema(self, df: pd.DataFrame) -> list[dict]:
+    def _build_schema(self, df: pd.DataFrame, table: pa.Table) -> list[dict]:
         """Build column schema information.
 
         Args:
             df: Source DataFrame.
+            table: Arrow table built from the same DataFrame.
 
         Returns:
             List of dicts with column_name, type, and nullable keys.
         """
         schema: list[dict] = []
-        for col in df.columns:
-            nullable = bool(df[col].isna().any()) if len(df) > 0 else False
+        for i, col in enumerate(df.columns):
+            nullable = table.column(i).null_count > 0
             schema.append({
                 'column_name': col,
                 'type': str(df[col].dtype),
@@ -249,69 +345,75 @@ class DatasetSummarizer:
         return schema
 
     def _build_sample_rows(
-        self, df: pd.DataFrame, max_rows: int
+        self, table: pa.Table, max_rows: int
     ) -> list[dict]:
         """Extract leading rows as list of dicts.
 
+        Converts only the leading slice of the Arrow table, so values come
+        back as native Python types and missing values as None.
+
         Args:
-            df: Source DataFrame.
+            table: Source Arrow table.
             max_rows: Maximum rows to return.
 
         Returns:
             List of row dicts.
         """
-        sample_df = df.head(max_rows)
-        return self._dataframe_to_records(sample_df)
+        return table.slice(0, max_rows).to_pylist()
 
-    def _build_statistics(self, df: pd.DataFrame) -> dict:
+    def _build_statistics(self, df: pd.DataFrame, table: pa.Table) -> dict:
         """Compute per-column statistics.
 
-        Numeric columns get min, max, mean, median, std.
+        Numeric columns get min, max, mean, median, std, computed with
+        Arrow compute kernels on the columnar table.
         Non-numeric columns get unique_count and top_values.
         All columns get null_count.
 
         Args:
             df: Source DataFrame.
+            table: Arrow table built from the same DataFrame.
 
         Returns:
             Dict keyed by column name with statistics dicts as values.
         """
         stats: dict = {}
-        for col in df.columns:
+        for i, col in enumerate(df.columns):
+            column = table.column(i)
             col_stats: dict = {}
-            col_stats['null_count'] = int(df[col].isna().sum())
+            col_stats['null_count'] = column.null_count
 
             if pd.api.types.is_numeric_dtype(df[col]):
-                col_stats.update(self._numeric_stats(df[col]))
+                col_stats.update(self._numeric_stats(column))
             else:
                 col_stats.update(self._categorical_stats(df[col]))
 
             stats[col] = col_stats
         return stats
 
-    def _numeric_stats(self, series: pd.Series) -> dict:
+    def _numeric_stats(self, column: pa.ChunkedArray) -> dict:
         """Compute statistics for a numeric column.
 
         Args:
-            series: Numeric pandas Series.
+            column: Numeric (or boolean) Arrow column.
 
         Returns:
             Dict with min, max, mean, median, std.
         """
-        if len(series.dropna()) == 0:
-            return {
-                'min': None,
-                'max': None,
-                'mean': None,
-                'median': None,
-                'std': None,
-            }
+        stats = self._generate_numeric_stats(column)
+        if stats['mean'] is None:
+            median = None
+        else:
+            # quantile kernel has no boolean implementation
+            values = (
+                column.cast(pa.int8()) if pa.types.is_boolean(column.type) else column
+            )
+            median = pc.quantile(values, q=0.5)[0].as_py()
         return {
-            'min': self._to_python_scalar(series.min()),
-            'max': self._to_python_scalar(series.max()),
-            'mean': self._to_python_scalar(series.mean()),
-            'median': self._to_python_scalar(series.median()),
-            'std': self._to_python_scalar(series.std()),
+            'min': stats['min'],
+            'max': stats['max'],
+            'mean': stats['mean'],
+            'median': median,
+            'std': stats['std'],
         }
 
     def _categorical_stats(self, series: pd.Series) -> dict:
@@ -323,58 +425,15 @@ class DatasetSummarizer:
         Returns:
             Dict with unique_count and top_values (by frequency).
         """
-        non_null = series.dropna()
-        unique_count = int(non_null.nunique())
-        top_values = (
-            non_null.value_counts()
-            .head(TOP_VALUES_LIMIT)
-            .index
-            .tolist()
-        )
+        if series.count() == 0:
+            return {
+                'unique_count': 0,
+                'top_values': [],
+            }
+        value_counts = series.value_counts(dropna=True)
+        unique_count = len(value_counts)
+        top_values = value_counts.head(TOP_VALUES_LIMIT).index.tolist()
         return {
             'unique_count': unique_count,
             'top_values': top_values,
         }
-
-    @staticmethod
-    def _to_python_scalar(value):
-        """Convert numpy/pandas scalar to native Python type.
-
-        Args:
-            value: A scalar value (possibly numpy).
-
-        Returns:
-            Native Python int, float, or the original value.
-        """
-        if isinstance(value, (np.integer,)):
-            return int(value)
-        if isinstance(value, (np.floating,)):
-            return float(value)
-        return value
-
-    @staticmethod
-    def _dataframe_to_records(df: pd.DataFrame) -> list[dict]:
-        """Convert a DataFrame to a list of plain-dict records.
-
-        Numpy scalars are converted to Python natives for JSON safety.
-
-        Args:
-            df: DataFrame to convert.
-
-        Returns:
-            List of dicts, one per row.
-        """
-        records: list[dict] = []
-        for row in df.to_dict(orient='records'):
-            clean: dict = {}
-            for k, v in row.items():
-                if isinstance(v, (np.integer,)):
-                    clean[k] = int(v)
-                elif isinstance(v, (np.floating,)):
-                    clean[k] = float(v)
-                elif isinstance(v, (np.bool_,)):
-                    clean[k] = bool(v)
-                else:
-                    clean[k] = v
-            records.append(clean)
-        return records
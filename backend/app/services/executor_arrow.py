@@ -0,0 +1,90 @@
+"""Arrow IPC encoding for Executor API requests and responses.
+
+The executor's /execute/*/arrow endpoints take a body of one or more
+concatenated Arrow IPC streams instead of JSON row lists:
+
+- The schema metadata key ``request`` of the first stream holds the
+  non-data request fields (code, filters, params, ...) as JSON
+- Transform inputs are streams carrying a ``dataset_id`` metadata key; with
+  no inputs, a single empty stream carries only the request fields
+
+Transform output is returned as one Arrow IPC stream when requested with
+``Accept: application/vnd.apache.arrow.stream``.
+"""
+import json
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+REQUEST_METADATA_KEY = b"request"
+DATASET_ID_METADATA_KEY = b"dataset_id"
+
+
+def _write_stream(table: pa.Table, metadata: dict[bytes, bytes]) -> bytes:
+    """Write a table as one Arrow IPC stream with extra schema metadata.
+
+    Args:
+        table: Table to write
+        metadata: Schema metadata entries to add
+
+    Returns:
+        Arrow IPC stream bytes
+    """
+    table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def encode_request(
+    fields: dict[str, Any],
+    datasets: dict[str, pd.DataFrame] | None = None,
+    dataset: pd.DataFrame | None = None,
+) -> bytes:
+    """Encode an executor request body as concatenated Arrow IPC streams.
+
+    Args:
+        fields: Non-data request fields, stored as JSON metadata
+        datasets: Transform inputs keyed by dataset ID (one stream each)
+        dataset: Card dataset, sent as the single stream
+
+    Returns:
+        Request body bytes
+    """
+    request = {REQUEST_METADATA_KEY: json.dumps(fields).encode()}
+
+    if dataset is not None:
+        return _write_stream(pa.Table.from_pandas(dataset, preserve_index=False), request)
+
+    if not datasets:
+        return _write_stream(pa.table({}), request)
+
+    streams = []
+    for i, (dataset_id, df) in enumerate(datasets.items()):
+        metadata = {DATASET_ID_METADATA_KEY: dataset_id.encode()}
+        if i == 0:
+            metadata.update(request)
+        streams.append(
+            _write_stream(pa.Table.from_pandas(df, preserve_index=False), metadata)
+        )
+    return b"".join(streams)
+
+
+def decode_dataframe(body: bytes) -> pd.DataFrame:
+    """Decode a single Arrow IPC stream into a DataFrame.
+
+    Args:
+        body: Arrow IPC stream bytes
+
+    Returns:
+        Decoded DataFrame
+
+    Raises:
+        pa.ArrowInvalid: If body is not an Arrow IPC stream
+    """
+    table = pa.ipc.open_stream(pa.BufferReader(body)).read_all()
+    return table.to_pandas(split_blocks=True, self_destruct=True)
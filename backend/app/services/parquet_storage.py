@@ -1,6 +1,8 @@
 """Parquet storage service for converting and storing DataFrames in S3."""
+from collections import deque
 from dataclasses import dataclass
 from typing import Any
+import asyncio
 import io
 import inspect
 import logging
@@ -9,10 +11,21 @@ import pyarrow as pa
 import pyarrow.parquet as pq
 from botocore.exceptions import ClientError
 
+from app.core.config import settings
 from app.exceptions import DatasetFileNotFoundError
 
 logger = logging.getLogger(__name__)
 
+# Number of partition files fetched ahead of the one being parsed
+PREFETCH_DEPTH = 2
+
+# Number of partitions sliced, encoded and uploaded at the same time
+PARTITION_SAVE_CONCURRENCY = 4
+
+# Row groups small enough that previews decode only the first one
+PARQUET_ROW_GROUP_SIZE = 64_000
+PARQUET_DATA_PAGE_SIZE = 1 << 20
+
 
 async def _maybe_await(result: Any) -> Any:
     if inspect.isawaitable(result):
@@ -96,8 +109,10 @@ class ParquetConverter:
         s3_path = f'datasets/{dataset_id}/data/part-0000.parquet'
 
         try:
-            # Convert and upload
-            parquet_bytes = self._convert_to_parquet_bytes(df)
+            # Convert off the event loop, then upload
+            parquet_bytes = await asyncio.to_thread(
+                self._convert_to_parquet_bytes, df
+            )
             await self._upload_to_s3(s3_path, parquet_bytes)
 
             logger.info(f"Saved non-partitioned data to {s3_path}")
@@ -113,7 +128,12 @@ class ParquetConverter:
             raise
 
     def _convert_to_parquet_bytes(self, df: pd.DataFrame) -> bytes:
-        """Convert DataFrame to Parquet bytes with snappy compression.
+        """Convert DataFrame to compressed Parquet bytes.
+
+        The codec and level come from settings.dataset_parquet_compression
+        and settings.dataset_parquet_compression_level (zstd level 1 by
+        default). Rows are split into row groups of PARQUET_ROW_GROUP_SIZE
+        with column statistics, so readers can stop after the leading groups.
 
         Args:
             df: DataFrame to convert
@@ -121,9 +141,24 @@ class ParquetConverter:
         Returns:
             Parquet data as bytes
         """
+        compression = settings.dataset_parquet_compression
+        compression_level = settings.dataset_parquet_compression_level
+        if compression.lower() == 'none' or not pa.Codec.supports_compression_level(
+            compression
+        ):
+            compression_level = None
+
         table = pa.Table.from_pandas(df)
         buffer = io.BytesIO()
-        pq.write_table(table, buffer, compression='snappy')
+        pq.write_table(
+            table,
+            buffer,
+            compression=compression,
+            compression_level=compression_level,
+            row_group_size=PARQUET_ROW_GROUP_SIZE,
+            data_page_size=PARQUET_DATA_PAGE_SIZE,
+            write_statistics=True,
+        )
         buffer.seek(0)
         return buffer.getvalue()
 
@@ -224,16 +259,32 @@ class ParquetConverter:
     ) -> None:
         """Save all partitions to S3.
 
+        At most PARTITION_SAVE_CONCURRENCY partitions are sliced, encoded
+        and uploaded at a time, so only that many partition copies are in
+        memory. If one fails, the remaining saves are cancelled.
+
         Args:
             df: DataFrame to partition
             base_path: Base S3 path
             partition_column: Column to partition by
             partition_values: List of partition values
         """
-        for partition_value in partition_values:
-            await self._save_single_partition(
-                df, base_path, partition_column, partition_value
-            )
+        semaphore = asyncio.Semaphore(PARTITION_SAVE_CONCURRENCY)
+
+        async def save(partition_value: str) -> None:
+            async with semaphore:
+                await self._save_single_partition(
+                    df, base_path, partition_column, partition_value
+                )
+
+        tasks = [asyncio.create_task(save(value)) for value in partition_values]
+        try:
+            await asyncio.gather(*tasks)
+        except BaseException:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
 
     async def _save_single_partition(
         self,
@@ -256,7 +307,9 @@ class ParquetConverter:
             f'part-0000.parquet'
         )
 
-        parquet_bytes = self._convert_to_parquet_bytes(partition_df)
+        parquet_bytes = await asyncio.to_thread(
+            self._convert_to_parquet_bytes, partition_df
+        )
         await self._upload_to_s3(s3_path, parquet_bytes)
 
 
@@ -288,24 +341,78 @@ class ParquetReader:
         else:
             return await self._read_single_file(s3_path)
 
-    async def read_preview(self, s3_path: str, max_rows: int) -> pd.DataFrame:
+    async def read_preview(
+        self,
+        s3_path: str,
+        max_rows: int,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
         """Read preview of Parquet dataset from S3.
 
+        Only the leading row groups needed for max_rows are decoded, and
+        for partitioned datasets, partition files are read in order and
+        reading stops as soon as max_rows rows have been collected.
+
         Args:
             s3_path: S3 path (can be file or directory)
             max_rows: Maximum number of rows to return
+            columns: Column names to decode (optional, all columns if None)
 
         Returns:
             DataFrame with limited rows
         """
-        df = await self.read_full(s3_path)
+        if s3_path.endswith('/'):
+            df = await self._read_partitioned(
+                s3_path, max_rows=max_rows, columns=columns
+            )
+        else:
+            df = await self._read_single_file(
+                s3_path, columns=columns, max_rows=max_rows
+            )
         return df.head(max_rows)
 
-    async def _read_single_file(self, s3_path: str) -> pd.DataFrame:
+    async def get_etag(self, s3_path: str) -> str | None:
+        """Get the ETag of a single Parquet file.
+
+        Args:
+            s3_path: S3 path (can be file or directory)
+
+        Returns:
+            ETag string, or None for partitioned (directory) paths
+
+        Raises:
+            DatasetFileNotFoundError: If the S3 key does not exist
+            Exception: If the S3 request fails
+        """
+        if s3_path.endswith('/'):
+            return None
+        try:
+            response = await _maybe_await(self.s3_client.head_object(
+                Bucket=self.bucket,
+                Key=s3_path
+            ))
+            etag: str | None = response.get('ETag')
+            return etag
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code in ('NoSuchKey', '404', 'NotFound'):
+                raise DatasetFileNotFoundError(s3_path=s3_path) from e
+            logger.error(f"Failed to read metadata for {s3_path}: {e}")
+            raise
+
+    async def _read_single_file(
+        self,
+        s3_path: str,
+        columns: list[str] | None = None,
+        max_rows: int | None = None,
+    ) -> pd.DataFrame:
         """Read single Parquet file from S3.
 
         Args:
             s3_path: S3 file path
+            columns: Column names to decode (optional, all columns if None)
+            max_rows: Decode only the row groups covering this many rows
+                (optional, all row groups if None)
 
         Returns:
             DataFrame
@@ -313,19 +420,32 @@ class ParquetReader:
         Raises:
             Exception: If S3 read or Parquet parsing fails
         """
+        parquet_data = await self._fetch_object(s3_path)
+        return self._parse_parquet(
+            s3_path, parquet_data, columns=columns, max_rows=max_rows
+        )
+
+    async def _fetch_object(self, s3_path: str) -> bytes:
+        """Download a Parquet file from S3.
+
+        Args:
+            s3_path: S3 file path
+
+        Returns:
+            Raw Parquet bytes
+
+        Raises:
+            DatasetFileNotFoundError: If the S3 key does not exist
+            Exception: If S3 read fails
+        """
         try:
             response = await _maybe_await(self.s3_client.get_object(
                 Bucket=self.bucket,
                 Key=s3_path
             ))
             read_result = response['Body'].read()
-            parquet_data = await _maybe_await(read_result)
-
-            parquet_file = pq.ParquetFile(io.BytesIO(parquet_data))
-            table = parquet_file.read()
-
-            result: pd.DataFrame = table.to_pandas()
-            return result
+            parquet_data: bytes = await _maybe_await(read_result)
+            return parquet_data
         except ClientError as e:
             error_code = e.response['Error']['Code']
             if error_code in ('NoSuchKey', '404', 'NotFound'):
@@ -336,11 +456,57 @@ class ParquetReader:
             logger.error(f"Failed to read file from {s3_path}: {e}")
             raise
 
-    async def _read_partitioned(self, base_path: str) -> pd.DataFrame:
+    def _parse_parquet(
+        self,
+        s3_path: str,
+        parquet_data: bytes,
+        columns: list[str] | None = None,
+        max_rows: int | None = None,
+    ) -> pd.DataFrame:
+        """Parse Parquet bytes into a DataFrame.
+
+        Args:
+            s3_path: S3 file path (for error reporting)
+            parquet_data: Raw Parquet bytes
+            columns: Column names to decode (optional, all columns if None)
+            max_rows: Decode only the row groups covering this many rows
+                (optional, all row groups if None)
+
+        Returns:
+            DataFrame
+
+        Raises:
+            Exception: If Parquet parsing fails
+        """
+        try:
+            parquet_file = pq.ParquetFile(io.BytesIO(parquet_data))
+            if max_rows is None:
+                table = parquet_file.read(columns=columns)
+            else:
+                table = parquet_file.read_row_groups(
+                    self._leading_row_groups(parquet_file.metadata, max_rows),
+                    columns=columns,
+                )
+
+            result: pd.DataFrame = table.to_pandas()
+            return result
+        except Exception as e:
+            logger.error(f"Failed to read file from {s3_path}: {e}")
+            raise
+
+    async def _read_partitioned(
+        self,
+        base_path: str,
+        max_rows: int | None = None,
+        columns: list[str] | None = None,
+    ) -> pd.DataFrame:
         """Read partitioned Parquet dataset from S3.
 
         Args:
             base_path: Base path for partitioned data
+            max_rows: Stop reading partitions once this many rows are
+                collected (optional, reads everything if None)
+            columns: Column names to decode (optional, all columns if None)
 
         Returns:
             DataFrame with all partitions combined
@@ -364,13 +530,96 @@ class ParquetReader:
                 logger.warning(f"No parquet files found at {base_path}")
                 return pd.DataFrame()
 
-            dfs = [await self._read_single_file(key) for key in parquet_files]
+            dfs = await self._read_files_with_prefetch(
+                parquet_files, max_rows, columns
+            )
 
             return pd.concat(dfs, ignore_index=True)
         except Exception as e:
             logger.error(f"Failed to read partitioned data from {base_path}: {e}")
             raise
 
+    async def _read_files_with_prefetch(
+        self,
+        keys: list[str],
+        max_rows: int | None = None,
+        columns: list[str] | None = None,
+    ) -> list[pd.DataFrame]:
+        """Read Parquet files in order, downloading upcoming files in the background.
+
+        Up to PREFETCH_DEPTH downloads are kept in flight while the current
+        file is parsed, so S3 latency overlaps with Parquet decoding.
+
+        Args:
+            keys: Parquet file keys in read order
+            max_rows: Stop once this many rows are collected (optional)
+            columns: Column names to decode (optional, all columns if None)
+
+        Returns:
+            List of DataFrames, one per file read
+        """
+        remaining = iter(keys)
+        pending: deque[tuple[str, asyncio.Task[bytes]]] = deque()
+
+        def schedule_next() -> None:
+            key = next(remaining, None)
+            if key is not None:
+                pending.append((key, asyncio.create_task(self._fetch_object(key))))
+
+        for _ in range(PREFETCH_DEPTH):
+            schedule_next()
+
+        dfs: list[pd.DataFrame] = []
+        total_rows = 0
+        try:
+            while pending:
+                key, fetch_task = pending.popleft()
+                parquet_data = await fetch_task
+                schedule_next()
+
+                # Parse off the event loop so the prefetches keep downloading
+                df = await asyncio.to_thread(
+                    self._parse_parquet,
+                    key,
+                    parquet_data,
+                    columns=columns,
+                    max_rows=None if max_rows is None else max_rows - total_rows,
+                )
+                dfs.append(df)
+                total_rows += len(df)
+                if max_rows is not None and total_rows >= max_rows:
+                    break
+        finally:
+            for _, fetch_task in pending:
+                fetch_task.cancel()
+            await asyncio.gather(
+                *(fetch_task for _, fetch_task in pending), return_exceptions=True
+            )
+
+        return dfs
+
+    @staticmethod
+    def _leading_row_groups(
+        metadata: pq.FileMetaData, max_rows: int
+    ) -> list[int]:
+        """Select the leading row groups that together hold max_rows rows.
+
+        Args:
+            metadata: Parquet file metadata
+            max_rows: Number of rows needed
+
+        Returns:
+            Row group indices in file order (at least one if any exist)
+        """
+        row_groups: list[int] = []
+        rows = 0
+        for i in range(metadata.num_row_groups):
+            row_groups.append(i)
+            rows += metadata.row_group(i).num_rows
+            if rows >= max_rows:
+                break
+        return row_groups
+
     def _filter_parquet_files(self, contents: list[dict[str, Any]]) -> list[str]:
         """Filter parquet files from S3 object list.
 
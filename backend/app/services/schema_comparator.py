@@ -8,9 +8,28 @@ __all__ = [
     "SchemaChangeType",
     "SchemaCompareResult",
     "compare_schemas",
+    "schema_fingerprint",
 ]
 
 
+def schema_fingerprint(
+    schema: list[ColumnSchema],
+) -> tuple[tuple[str, str, bool], ...]:
+    """Build a hashable fingerprint of a schema.
+
+    Two schemas with equal fingerprints have the same columns, in the same
+    order, with the same data types and nullability, so compare_schemas
+    would report no changes for them.
+
+    Args:
+        schema: List of ColumnSchema.
+
+    Returns:
+        Tuple of (name, data_type, nullable) per column.
+    """
+    return tuple((col.name, col.data_type, col.nullable) for col in schema)
+
+
 def compare_schemas(
     old_schema: list[ColumnSchema],
     new_schema: list[ColumnSchema],
@@ -24,6 +43,16 @@ def compare_schemas(
     Returns:
         SchemaCompareResult containing has_changes flag and list of changes.
     """
+    # Unchanged schemas (the common case on reimport) need no name maps,
+    # whether or not their columns were reordered
+    old_fingerprint = schema_fingerprint(old_schema)
+    new_fingerprint = schema_fingerprint(new_schema)
+    if old_fingerprint == new_fingerprint or (
+        len(old_fingerprint) == len(new_fingerprint)
+        and frozenset(old_fingerprint) == frozenset(new_fingerprint)
+    ):
+        return SchemaCompareResult(has_changes=False, changes=[])
+
     changes: list[SchemaChange] = []
 
     # Create mappings by column name
@@ -17,6 +17,7 @@ from app.models.transform import Transform
 from app.repositories.dataset_repository import DatasetRepository
 from app.repositories.transform_execution_repository import TransformExecutionRepository
 from app.repositories.transform_repository import TransformRepository
+from app.services import executor_arrow
 from app.services.parquet_storage import ParquetConverter, ParquetReader
 
 logger = logging.getLogger(__name__)
@@ -108,7 +109,7 @@ class TransformExecutionService:
             # Step 1: Get input datasets
             dataset_repo = DatasetRepository()
             input_datasets = []
-            input_dataframes = []
+            input_dataframes: dict[str, pd.DataFrame] = {}
 
             for input_dataset_id in transform.input_dataset_ids:
                 dataset = await dataset_repo.get_by_id(input_dataset_id, dynamodb)
@@ -122,16 +123,17 @@ class TransformExecutionService:
             parquet_reader = ParquetReader(s3, settings.s3_bucket_datasets)
             for dataset in input_datasets:
                 df = await _maybe_await(parquet_reader.read_full(dataset.s3_path))
-                input_dataframes.append(df)
+                input_dataframes[dataset.id] = df
 
             # Step 3: Call Executor API
-            executor_result = await self._execute_with_retry(
+            output_df = await self._execute_with_retry(
                 transform=transform,
                 datasets=input_dataframes,
             )
+            row_count = len(output_df)
+            column_names = [str(col) for col in output_df.columns]
 
             # Step 4 & 5: Save output and create Dataset record
-            output_df = pd.DataFrame(executor_result["output_rows"])
             output_dataset_id = str(uuid.uuid4())
 
             # Save to S3
@@ -145,7 +147,7 @@ class TransformExecutionService:
 
             # Build column schema from output DataFrame
             columns = []
-            for col_name in executor_result["column_names"]:
+            for col_name in column_names:
                 col_dtype = str(output_df[col_name].dtype)
                 columns.append(
                     ColumnSchema(
@@ -161,8 +163,8 @@ class TransformExecutionService:
                 "id": output_dataset_id,
                 "name": f"Transform Output: {transform.name}",
                 "source_type": "transform",
-                "row_count": executor_result["row_count"],
-                "schema": [col.model_dump() for col in columns],
+                "row_count": row_count,
+                "schema": columns,
                 "owner_id": transform.owner_id,
                 "s3_path": storage_result.s3_path,
                 "column_count": len(columns),
@@ -189,7 +191,7 @@ class TransformExecutionService:
                     "status": "success",
                     "finished_at": finished_at,
                     "duration_ms": elapsed_ms,
-                    "output_row_count": executor_result["row_count"],
+                    "output_row_count": row_count,
                     "output_dataset_id": output_dataset_id,
                 },
                 dynamodb,
@@ -198,8 +200,8 @@ class TransformExecutionService:
             return TransformExecutionResult(
                 execution_id=execution_id,
                 output_dataset_id=output_dataset_id,
-                row_count=executor_result["row_count"],
-                column_names=executor_result["column_names"],
+                row_count=row_count,
+                column_names=column_names,
                 execution_time_ms=elapsed_ms,
             )
 
@@ -222,33 +224,34 @@ class TransformExecutionService:
     async def _execute_with_retry(
         self,
         transform: Transform,
-        datasets: list[pd.DataFrame],
-    ) -> dict[str, Any]:
+        datasets: dict[str, pd.DataFrame],
+    ) -> pd.DataFrame:
         """Execute transform via Executor API with exponential backoff retry.
 
+        Inputs are sent to /execute/transform/arrow as Arrow IPC streams and
+        the output is requested as one too (Accept header), so data stays
+        columnar in both directions instead of being expanded into JSON rows.
+
         Retries up to MAX_RETRIES times on transient errors (connection errors,
         5xx status codes). Non-retryable errors (4xx) are raised immediately.
 
         Args:
             transform: Transform with code to execute
-            datasets: List of input DataFrames
+            datasets: Input DataFrames keyed by dataset ID
 
         Returns:
-            Response data dict from executor
+            Output DataFrame decoded from the executor's Arrow response
 
         Raises:
             RuntimeError: If all retries are exhausted or client error occurs
         """
         last_error: Exception | None = None
 
-        # Prepare datasets payload
-        datasets_payload = [
-            {
-                "data": df.to_dict(orient="records"),
-                "columns": df.columns.tolist(),
-            }
-            for df in datasets
-        ]
+        # Encoded once; retries resend the same body
+        body = executor_arrow.encode_request(
+            {"transform_id": transform.id, "code": transform.code},
+            datasets=datasets,
+        )
 
         for attempt in range(MAX_RETRIES):
             try:
@@ -256,16 +259,15 @@ class TransformExecutionService:
                     timeout=settings.executor_timeout_seconds
                 ) as client:
                     response = await client.post(
-                        f"{settings.executor_url}/execute/transform",
-                        json={
-                            "transform_id": transform.id,
-                            "code": transform.code,
-                            "input_datasets": datasets_payload,
+                        f"{settings.executor_url}/execute/transform/arrow",
+                        content=body,
+                        headers={
+                            "Content-Type": executor_arrow.ARROW_STREAM_MEDIA_TYPE,
+                            "Accept": executor_arrow.ARROW_STREAM_MEDIA_TYPE,
                         },
                     )
                     response.raise_for_status()
-                    result: dict[str, Any] = response.json()
-                    return result
+                    return executor_arrow.decode_dataframe(response.content)
 
             except httpx.HTTPStatusError as e:
                 # Don't retry client errors (4xx)
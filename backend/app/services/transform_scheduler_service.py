@@ -1,13 +1,15 @@
 """Background scheduler for periodic transform execution."""
 import asyncio
 import logging
-from datetime import datetime, timezone
-from typing import Any, Optional
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any, Optional, Tuple
 
-import aioboto3
 from croniter import croniter
 
 from app.core.config import settings
+from app.db.s3 import S3_CLIENT_CONFIG
+from app.db.session import get_session
 from app.repositories.transform_execution_repository import TransformExecutionRepository
 from app.repositories.transform_repository import TransformRepository
 from app.services.transform_execution_service import TransformExecutionService
@@ -15,6 +17,48 @@ from app.services.transform_execution_service import TransformExecutionService
 logger = logging.getLogger(__name__)
 
 
+def _parse_field(field: str, limit: int) -> Tuple[Optional[int], Optional[int]]:
+    """Parse a minute/hour field as (fixed value, step); both None if unsupported."""
+    if field == "*":
+        return None, 1
+    if field.startswith("*/") and field[2:].isdigit():
+        step = int(field[2:])
+        # Steps that do not divide the range restart each hour/day
+        return (None, step) if 0 < step <= limit and limit % step == 0 else (None, None)
+    if field.isdigit() and int(field) < limit:
+        return int(field), None
+    return None, None
+
+
+@lru_cache(maxsize=512)
+def _fixed_period(cron_expr: str) -> Optional[Tuple[int, int]]:
+    """Get (period, phase) in seconds for cron expressions that fire at a fixed interval.
+
+    Covers the common "every N minutes", "hourly at M" and "daily at H:M"
+    shapes. Their runs are evenly spaced from the Unix epoch in UTC, so
+    whether one is due can be answered with a modulo instead of croniter.
+
+    Returns:
+        (period_seconds, phase_seconds), or None if croniter is needed
+    """
+    fields = cron_expr.split()
+    if len(fields) != 5 or fields[2:] != ["*", "*", "*"]:
+        return None
+
+    minute, minute_step = _parse_field(fields[0], 60)
+    hour, hour_step = _parse_field(fields[1], 24)
+
+    if minute_step is not None and hour_step == 1:
+        return minute_step * 60, 0
+    if minute is None:
+        return None
+    if hour_step is not None:
+        return hour_step * 3600, minute * 60
+    if hour is not None:
+        return 86400, hour * 3600 + minute * 60
+    return None
+
+
 class TransformSchedulerService:
     """Asyncio-based background scheduler for transforms."""
 
@@ -50,7 +94,7 @@ class TransformSchedulerService:
 
     async def _check_and_execute(self) -> None:
         """Check scheduled transforms and execute if due."""
-        session = aioboto3.Session()
+        session = get_session()
         async with session.resource(
             'dynamodb',
             region_name=settings.dynamodb_region,
@@ -62,6 +106,7 @@ class TransformSchedulerService:
                 endpoint_url=settings.s3_endpoint if settings.s3_endpoint else None,
                 aws_access_key_id=settings.s3_access_key if settings.s3_access_key and settings.s3_secret_key else None,
                 aws_secret_access_key=settings.s3_secret_key if settings.s3_access_key and settings.s3_secret_key else None,
+                config=S3_CLIENT_CONFIG,
             ) as s3:
                 await self._execute_due_transforms(dynamodb, s3)
 
@@ -113,6 +158,13 @@ class TransformSchedulerService:
     @staticmethod
     def _is_due(cron_expr: str, now: datetime) -> bool:
         """Check if a cron expression is due within the scheduler interval."""
+        period = _fixed_period(cron_expr) if now.utcoffset() == timedelta(0) else None
+        if period is not None:
+            period_seconds, phase_seconds = period
+            # Like croniter.get_prev, a run exactly at now counts as the previous run
+            elapsed = (now.timestamp() - phase_seconds) % period_seconds or period_seconds
+            return elapsed < settings.scheduler_interval_seconds
+
         cron = croniter(cron_expr, now)
         prev_time = cron.get_prev(datetime)
         diff = (now - prev_time).total_seconds()
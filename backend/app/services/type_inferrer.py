@@ -1,7 +1,10 @@
 """Type inference service for dataset columns."""
+import re
+
+import numpy as np
 import pandas as pd
 from datetime import datetime
-from typing import Any, List
+from typing import Any, Dict, List, Optional
 from app.models.dataset import ColumnSchema
 
 
@@ -18,65 +21,133 @@ DATETIME_FORMATS = [
     "%Y/%m/%d %H:%M:%S",
 ]
 
+INT64_MAX = np.iinfo(np.int64).max
+
+# Largest magnitude up to which every whole number is exact in float64
+FLOAT_EXACT_INT_MAX = 2 ** 53
+
+# Shapes of the formats above, checked with one regex pass before any format
+# is parsed so that ordinary string columns are rejected cheaply. Values that
+# match are still validated by pd.to_datetime (e.g. month 13).
+_DATE_RE = re.compile(r"\d{4}(?:[-/]\d{1,2}[-/]\d{1,2}|年\d{1,2}月\d{1,2}日)")
+_DATETIME_RE = re.compile(r"\d{4}[-/]\d{1,2}[-/]\d{1,2}[ T]\d{1,2}:\d{1,2}:\d{1,2}")
+
+_BOOL_SET = frozenset({
+    "true", "false", "1", "0", "yes", "no",
+    "True", "False", "TRUE", "FALSE", "YES", "NO"
+})
+
+_BOOL_MAP = {
+    "true": True, "false": False,
+    "True": True, "False": False,
+    "TRUE": True, "FALSE": False,
+    "1": True, "0": False,
+    "yes": True, "no": False,
+    "YES": True, "NO": False,
+    "Yes": True, "No": False,
+}
+
+
+def _infer_from_dtype(series: "pd.Series[Any]") -> Optional[str]:
+    """Infer type from a dtype the CSV parser already assigned.
+
+    Columns parsed as bool/int/float can be classified with vectorized checks
+    instead of the per-value string checks below. Results match what those
+    checks would return for the same values.
+
+    Returns:
+        Inferred type, or None if the column needs value-level inspection
+    """
+    if pd.api.types.is_bool_dtype(series):
+        return "bool"
+
+    if pd.api.types.is_integer_dtype(series):
+        # 0/1 columns are treated as boolean flags, as _is_bool does
+        if series.isin([0, 1]).all():
+            return "bool"
+        # uint64 values above the int64 range cannot be stored as int64
+        return "int64" if series.max() <= INT64_MAX else "float64"
 
-def _is_integer(series: "pd.Series[Any]") -> bool:
-    """Check if series contains only integer values."""
+    if pd.api.types.is_float_dtype(series):
+        return _float_type(series.to_numpy(dtype="float64"))
+
+    return None
+
+
+def _float_type(values: np.ndarray) -> str:
+    """Classify float values as int64 if they convert to int64 exactly.
+
+    Whole numbers beyond 2**53 are already rounded as floats and would
+    overflow int64 past 2**63, so those columns stay float64.
+    """
+    if not bool(np.all(np.isfinite(values))):
+        return "float64"
+    if bool(np.all(values % 1 == 0)) and bool(np.all(np.abs(values) <= FLOAT_EXACT_INT_MAX)):
+        return "int64"
+    return "float64"
+
+
+def _to_numeric(series: "pd.Series[Any]") -> Optional["pd.Series[Any]"]:
+    """Parse series as numbers in one vectorized pass.
+
+    Returns:
+        Parsed values, or None if any value is not numeric
+    """
     try:
-        pd.to_numeric(series, errors="raise")
-        return all(float(x).is_integer() for x in series if pd.notna(x))
+        # "raise" rather than "coerce": integers beyond uint64 must not be
+        # rounded into floats
+        values = pd.to_numeric(series, errors="raise")
     except (ValueError, TypeError):
-        return False
+        return None
+    return values if bool(values.notna().all()) else None
 
 
-def _is_float(series: "pd.Series[Any]") -> bool:
-    """Check if series contains numeric values."""
+def _strptime_matches(value: str, fmt: str) -> bool:
+    """Check a single value against a strptime format."""
     try:
-        pd.to_numeric(series, errors="raise")
+        datetime.strptime(value, fmt)
         return True
-    except (ValueError, TypeError):
+    except ValueError:
         return False
 
 
 def _is_bool(series: "pd.Series[Any]") -> bool:
     """Check if series contains boolean-like values."""
-    bool_values = {
-        "true", "false", "1", "0", "yes", "no",
-        "True", "False", "TRUE", "FALSE", "YES", "NO"
-    }
-    unique_vals = set(str(x).strip() for x in series if pd.notna(x))
-    return len(unique_vals) > 0 and unique_vals.issubset(bool_values)
+    return bool(series.astype(str).str.strip().isin(_BOOL_SET).all())
 
 
-def _is_date(series: "pd.Series[Any]") -> bool:
-    """Check if series contains date values."""
-    sample = series.dropna()
-    if len(sample) == 0:
+def _matches_format(
+    series: "pd.Series[Any]", formats: List[str], pattern: "re.Pattern[str]"
+) -> bool:
+    """Check if every value parses with one of the given strptime formats."""
+    if len(series) == 0:
         return False
 
-    for fmt in DATE_FORMATS:
+    values = series.astype(str)
+    if not values.str.fullmatch(pattern).all():
+        return False
+
+    for fmt in formats:
         try:
-            for val in sample:
-                datetime.strptime(str(val), fmt)
-            return True
+            parsed = pd.to_datetime(values, format=fmt, errors="coerce")
         except (ValueError, TypeError):
             continue
+        # Timestamps only cover 1677-2262, so sentinels such as 9999-12-31
+        # come back as NaT; only those values are rechecked one by one
+        failed = values[parsed.isna()]
+        if all(_strptime_matches(value, fmt) for value in failed):
+            return True
     return False
 
 
+def _is_date(series: "pd.Series[Any]") -> bool:
+    """Check if series contains date values."""
+    return _matches_format(series.dropna(), DATE_FORMATS, _DATE_RE)
+
+
 def _is_datetime(series: "pd.Series[Any]") -> bool:
     """Check if series contains datetime values."""
-    sample = series.dropna()
-    if len(sample) == 0:
-        return False
-
-    for fmt in DATETIME_FORMATS:
-        try:
-            for val in sample:
-                datetime.strptime(str(val), fmt)
-            return True
-        except (ValueError, TypeError):
-            continue
-    return False
+    return _matches_format(series.dropna(), DATETIME_FORMATS, _DATETIME_RE)
 
 
 def infer_column_type(series: "pd.Series[Any]") -> str:
@@ -100,7 +171,13 @@ def infer_column_type(series: "pd.Series[Any]") -> str:
     if len(clean_series) > 1000:
         clean_series = clean_series.sample(n=1000, random_state=42)
 
-    # Check types in order of specificity
+    # Columns already typed by the parser need no per-value checks
+    dtype_type = _infer_from_dtype(clean_series)
+    if dtype_type is not None:
+        return dtype_type
+
+    # Check types in order of specificity; each check parses the whole
+    # sample with one vectorized pandas call
     if _is_datetime(clean_series):
         return "datetime"
 
@@ -110,11 +187,11 @@ def infer_column_type(series: "pd.Series[Any]") -> str:
     if _is_bool(clean_series):
         return "bool"
 
-    if _is_integer(clean_series):
-        return "int64"
-
-    if _is_float(clean_series):
-        return "float64"
+    numeric = _to_numeric(clean_series)
+    if numeric is not None:
+        if pd.api.types.is_integer_dtype(numeric):
+            return "int64" if numeric.max() <= INT64_MAX else "float64"
+        return _float_type(numeric.to_numpy(dtype="float64"))
 
     return "string"
 
@@ -152,6 +229,9 @@ def apply_types(df: pd.DataFrame, schema: List[ColumnSchema]) -> pd.DataFrame:
     """
     Apply inferred types to DataFrame.
 
+    Columns the parser already typed are cast together in a single astype
+    call; only string columns are parsed one by one.
+
     Args:
         df: pandas DataFrame to apply types to
         schema: List of ColumnSchema objects with type information
@@ -159,38 +239,39 @@ def apply_types(df: pd.DataFrame, schema: List[ColumnSchema]) -> pd.DataFrame:
     Returns:
         New DataFrame with types applied (immutable operation)
     """
-    # Create a copy to ensure immutability
-    result = df.copy()
+    if df.empty:
+        return df.copy()
 
-    if result.empty:
-        return result
+    dtype_map: Dict[str, str] = {}
+    parsed: Dict[str, "pd.Series[Any]"] = {}
 
     for col_schema in schema:
         col_name = col_schema.name
         data_type = col_schema.data_type
 
-        if col_name not in result.columns:
+        if col_name not in df.columns:
             continue
 
-        if data_type == "int64":
-            result[col_name] = pd.to_numeric(result[col_name], errors="coerce").astype("int64")
+        column = df[col_name]
+        is_typed = pd.api.types.is_bool_dtype(column) or pd.api.types.is_numeric_dtype(column)
+
+        if data_type in ("int64", "float64", "bool") and is_typed:
+            dtype_map[col_name] = data_type
+        elif data_type == "int64":
+            parsed[col_name] = pd.to_numeric(column, errors="coerce").astype("int64")
         elif data_type == "float64":
-            result[col_name] = pd.to_numeric(result[col_name], errors="coerce")
+            parsed[col_name] = pd.to_numeric(column, errors="coerce")
         elif data_type == "bool":
             # Convert string boolean values to actual booleans
-            bool_map = {
-                "true": True, "false": False,
-                "True": True, "False": False,
-                "TRUE": True, "FALSE": False,
-                "1": True, "0": False,
-                "yes": True, "no": False,
-                "YES": True, "NO": False,
-                "Yes": True, "No": False,
-            }
-            result[col_name] = result[col_name].map(bool_map).astype("bool")
+            parsed[col_name] = column.map(_BOOL_MAP).astype("bool")
         elif data_type == "date" or data_type == "datetime":
             # Try to parse with pandas to_datetime
-            result[col_name] = pd.to_datetime(result[col_name], errors="coerce")
+            parsed[col_name] = pd.to_datetime(column, errors="coerce")
         # string type: keep as object (default)
 
+    # astype always returns a new frame, so df is never mutated
+    result = df.astype(dtype_map)
+    for col_name, values in parsed.items():
+        result[col_name] = values
+
     return result
@@ -149,6 +149,24 @@ class TestCreateDataset:
             assert data["name"] == "Test Dataset"
             mock_import.assert_called_once()
 
+    def test_create_dataset_auto_delimiter(
+        self, authenticated_client: TestClient, mock_user: User, sample_dataset: Dataset
+    ) -> None:
+        """Test delimiter "auto" is passed to the service as None (auto-detect)."""
+        csv_content = b"id;name\n1;Alice\n2;Bob\n"
+
+        with patch('app.services.dataset_service.DatasetService.import_csv') as mock_import:
+            mock_import.return_value = sample_dataset
+
+            response = authenticated_client.post(
+                "/api/datasets",
+                files={"file": ("test.csv", io.BytesIO(csv_content), "text/csv")},
+                data={"name": "Test Dataset", "delimiter": "auto"},
+            )
+
+            assert response.status_code == 201
+            assert mock_import.call_args[1]["delimiter"] is None
+
     def test_create_dataset_no_file(
         self, authenticated_client: TestClient, mock_user: User
     ) -> None:
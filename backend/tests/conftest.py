@@ -1,4 +1,5 @@
 """Pytest configuration and shared fixtures."""
+import asyncio
 import os
 import sys
 import types
@@ -12,14 +13,24 @@ from unittest.mock import MagicMock
 from app.core.config import settings
 from app.api import deps
 
+try:
+    # Installed with uvicorn[standard] on POSIX, where uvicorn serves on it
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
 
 def pytest_configure(config):
-    """Setup vertexai stub before test collection begins.
+    """Setup the event loop policy and vertexai stub before collection.
 
     This hook runs before any test modules are imported, preventing import-time
     errors when chatbot_service tries to import vertexai.generative_models.
     The stub is installed once at the start of the test session.
     """
+    # Run async tests on the same event loop implementation as the server
+    if uvloop is not None:
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
     if "vertexai" not in sys.modules:
         vertexai = types.ModuleType("vertexai")
         gm = types.ModuleType("vertexai.generative_models")
@@ -1,7 +1,7 @@
 """Tests for S3 connection layer."""
 import pytest
 from moto import mock_aws
-from app.db.s3 import get_s3_client
+from app.db.s3 import S3_CLIENT_CONFIG, get_s3_client
 from app.core.config import settings
 
 
@@ -72,3 +72,13 @@ async def test_s3_client_is_async_generator():
     s3_gen = get_s3_client()
     # Verify it's an async generator
     assert hasattr(s3_gen, '__aenter__') or hasattr(s3_gen, '__anext__')
+
+
+@mock_aws
+@pytest.mark.asyncio
+async def test_s3_client_uses_shared_config():
+    """Test that the S3 client is created with the shared connection config."""
+    async for s3 in get_s3_client():
+        assert s3.meta.config.max_pool_connections == S3_CLIENT_CONFIG.max_pool_connections
+        assert s3.meta.config.tcp_keepalive is True
+        break
@@ -0,0 +1,14 @@
+"""Tests for the shared aioboto3 session."""
+import aioboto3
+
+from app.db.session import get_session
+
+
+def test_get_session_returns_aioboto3_session():
+    """Test that get_session returns an aioboto3 Session."""
+    assert isinstance(get_session(), aioboto3.Session)
+
+
+def test_get_session_is_shared():
+    """Test that repeated calls reuse one session."""
+    assert get_session() is get_session()
@@ -47,6 +47,14 @@ class TestColumnSchema:
                 nullable=False
             )
 
+    def test_column_schema_is_immutable_and_hashable(self):
+        """Test ColumnSchema is frozen and equal columns hash alike."""
+        column = ColumnSchema(name="age", data_type="int64", nullable=True)
+
+        with pytest.raises(ValidationError):
+            column.nullable = False
+        assert {column, column.model_copy()} == {column}
+
 
 class TestDatasetCreate:
     """Test DatasetCreate model."""
@@ -344,6 +352,25 @@ class TestDatasetExtendedFields:
         assert dataset.last_import_at == import_time
         assert dataset.last_import_by == "user-789"
 
+    def test_dataset_source_hash_not_serialized(self):
+        """Test the internal source_hash is kept on the model but not dumped."""
+        now = datetime.utcnow()
+        column = ColumnSchema(name="id", data_type="string", nullable=False)
+
+        dataset = Dataset(
+            id="dataset-123",
+            name="sales_data",
+            source_type="s3_csv",
+            schema=[column],
+            source_hash="abc123",
+            created_at=now,
+            updated_at=now
+        )
+
+        assert dataset.source_hash == "abc123"
+        assert "source_hash" not in dataset.model_dump()
+        assert "source_hash" not in dataset.model_dump_json()
+
     def test_dataset_create_with_partition_column(self):
         """Test DatasetCreate with partition_column field."""
         dataset_create = DatasetCreate(
@@ -40,6 +40,16 @@ class TestS3ImportRequest:
         assert req.encoding == "utf-8"
         assert req.partition_column == "date"
 
+    def test_auto_delimiter_normalized_to_none(self):
+        """Test that delimiter "auto" requests delimiter detection."""
+        req = S3ImportRequest(
+            name="auto-dataset",
+            s3_bucket="my-bucket",
+            s3_key="data/file.csv",
+            delimiter="auto",
+        )
+        assert req.delimiter is None
+
     def test_empty_name_fails(self):
         """Test that empty name raises ValidationError."""
         with pytest.raises(ValidationError):
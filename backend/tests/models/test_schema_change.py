@@ -157,6 +157,18 @@ class TestSchemaChange:
         assert change_dict["old_value"] == "int32"
         assert change_dict["new_value"] == "int64"
 
+    def test_schema_change_is_immutable(self):
+        """Test that SchemaChange is frozen and hashable."""
+        change = SchemaChange(
+            column_name="age",
+            change_type=SchemaChangeType.ADDED,
+            new_value="int64",
+        )
+
+        with pytest.raises(ValidationError):
+            change.column_name = "other"
+        assert hash(change) == hash(change.model_copy())
+
 
 class TestSchemaCompareResult:
     """Test SchemaCompareResult model."""
@@ -39,6 +39,53 @@ class TestDatasetRepository:
         assert isinstance(dataset.created_at, datetime)
         assert isinstance(dataset.updated_at, datetime)
 
+    async def test_create_stores_schema_as_json_string(
+        self, dynamodb_tables: tuple[dict[str, Any], Any]
+    ) -> None:
+        """Test schema is written as a single JSON string attribute."""
+        from app.repositories.dataset_repository import DatasetRepository
+
+        tables, dynamodb = dynamodb_tables
+        repo = DatasetRepository()
+
+        await repo.create({
+            'id': 'dataset-json',
+            'name': 'JSON Schema',
+            'source_type': 'csv',
+            'schema': [{'name': 'id', 'data_type': 'int64', 'nullable': False}],
+        }, dynamodb)
+
+        item = tables['datasets'].get_item(Key={'datasetId': 'dataset-json'})['Item']
+        assert isinstance(item['schema'], str)
+
+        dataset = await repo.get_by_id('dataset-json', dynamodb)
+        assert dataset is not None
+        assert dataset.columns[0].name == 'id'
+        assert dataset.columns[0].data_type == 'int64'
+
+    async def test_create_accepts_column_schema_instances(
+        self, dynamodb_tables: tuple[dict[str, Any], Any]
+    ) -> None:
+        """Test schema can be passed as ColumnSchema instances."""
+        from app.models.dataset import ColumnSchema
+        from app.repositories.dataset_repository import DatasetRepository
+
+        tables, dynamodb = dynamodb_tables
+        repo = DatasetRepository()
+        columns = [ColumnSchema(name='age', data_type='int64', nullable=True)]
+
+        created = await repo.create({
+            'id': 'dataset-models',
+            'name': 'Model Schema',
+            'source_type': 'csv',
+            'schema': columns,
+        }, dynamodb)
+        fetched = await repo.get_by_id('dataset-models', dynamodb)
+
+        assert created.columns == columns
+        assert fetched is not None
+        assert fetched.columns == columns
+
     async def test_get_by_id(self, dynamodb_tables: tuple[dict[str, Any], Any]) -> None:
         """Test retrieving dataset by ID."""
         from app.repositories.dataset_repository import DatasetRepository
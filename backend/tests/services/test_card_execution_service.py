@@ -1,9 +1,12 @@
 """Tests for card_execution_service module - TDD RED phase."""
+import json
 import logging
 import time
 from typing import Any
 from unittest.mock import MagicMock, AsyncMock, patch
 
+import pandas as pd
+import pyarrow as pa
 import pytest
 
 from app.exceptions import DatasetFileNotFoundError
@@ -430,7 +433,7 @@ def mock_s3_client() -> MagicMock:
 def execution_service(mock_dynamodb: Any) -> CardExecutionService:
     """Create CardExecutionService instance."""
     service = CardExecutionService(dynamodb=mock_dynamodb)
-    service._get_dataset_rows = AsyncMock(return_value=[])
+    service._get_dataset_df = AsyncMock(return_value=pd.DataFrame())
     return service
 
 
@@ -573,9 +576,11 @@ class TestCardExecutionService:
             assert result.html == executor_response["html"]
             mock_client.post.assert_called_once()
             call_args = mock_client.post.call_args
-            request_json = call_args[1]["json"]
-            assert "params" in request_json
-            assert request_json["params"] == params
+            assert call_args[0][0].endswith("/execute/card/arrow")
+            stream = pa.ipc.open_stream(call_args[1]["content"])
+            request_fields = json.loads(stream.schema.metadata[b"request"])
+            assert "params" in request_fields
+            assert request_fields["params"] == params
 
     @pytest.mark.asyncio
     async def test_execute_use_cache_false_bypasses_cache(
@@ -767,20 +772,20 @@ class TestCardExecutionService:
 
 
 # ============================================================================
-# _get_dataset_rows Error Propagation and Warning Log Tests
+# _get_dataset_df Error Propagation and Warning Log Tests
 # ============================================================================
 
 
-class TestGetDatasetRows:
-    """Test suite for _get_dataset_rows error handling."""
+class TestGetDatasetDf:
+    """Test suite for _get_dataset_df error handling."""
 
     @pytest.fixture
     def real_execution_service(self, mock_dynamodb: Any) -> CardExecutionService:
-        """Create CardExecutionService without mocking _get_dataset_rows."""
+        """Create CardExecutionService without mocking _get_dataset_df."""
         return CardExecutionService(dynamodb=mock_dynamodb, s3_client=MagicMock())
 
     @pytest.mark.asyncio
-    async def test_get_dataset_rows_propagates_dataset_file_not_found_error(
+    async def test_get_dataset_df_propagates_dataset_file_not_found_error(
         self,
         real_execution_service: CardExecutionService,
     ) -> None:
@@ -810,7 +815,7 @@ class TestGetDatasetRows:
         ):
             # When / Then: Must be converted to DatasetFileNotFoundError
             with pytest.raises(DatasetFileNotFoundError) as exc_info:
-                await real_execution_service._get_dataset_rows(dataset_id)
+                await real_execution_service._get_dataset_df(dataset_id)
 
             # Verify the converted error carries structured metadata
             assert exc_info.value.s3_path == s3_path
@@ -819,7 +824,7 @@ class TestGetDatasetRows:
             assert dataset_id in str(exc_info.value)
 
     @pytest.mark.asyncio
-    async def test_get_dataset_rows_warns_when_dataset_not_found(
+    async def test_get_dataset_df_warns_when_dataset_not_found(
         self,
         real_execution_service: CardExecutionService,
         caplog: pytest.LogCaptureFixture,
@@ -835,11 +840,11 @@ class TestGetDatasetRows:
             "app.services.card_execution_service.DatasetRepository",
             return_value=mock_dataset_repo,
         ), caplog.at_level(logging.WARNING):
-            # When: Calling _get_dataset_rows with nonexistent dataset
-            result = await real_execution_service._get_dataset_rows(dataset_id)
+            # When: Calling _get_dataset_df with nonexistent dataset
+            result = await real_execution_service._get_dataset_df(dataset_id)
 
-            # Then: Should return empty list AND emit a warning log
-            assert result == []
+            # Then: Should return an empty DataFrame AND emit a warning log
+            assert result.empty
             assert any(
                 "dataset" in record.message.lower()
                 and dataset_id in record.message
@@ -851,7 +856,7 @@ class TestGetDatasetRows:
             )
 
     @pytest.mark.asyncio
-    async def test_get_dataset_rows_warns_when_s3_path_not_set(
+    async def test_get_dataset_df_warns_when_s3_path_not_set(
         self,
         real_execution_service: CardExecutionService,
         caplog: pytest.LogCaptureFixture,
@@ -870,11 +875,11 @@ class TestGetDatasetRows:
             "app.services.card_execution_service.DatasetRepository",
             return_value=mock_dataset_repo,
         ), caplog.at_level(logging.WARNING):
-            # When: Calling _get_dataset_rows for dataset without s3_path
-            result = await real_execution_service._get_dataset_rows(dataset_id)
+            # When: Calling _get_dataset_df for dataset without s3_path
+            result = await real_execution_service._get_dataset_df(dataset_id)
 
-            # Then: Should return empty list AND emit a warning log
-            assert result == []
+            # Then: Should return an empty DataFrame AND emit a warning log
+            assert result.empty
             assert any(
                 "s3_path" in record.message.lower()
                 or "s3" in record.message.lower()
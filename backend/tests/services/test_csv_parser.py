@@ -1,12 +1,15 @@
 """Tests for CSV parser service."""
 
 from dataclasses import FrozenInstanceError
+from unittest.mock import patch
 
 import pandas as pd
+import pyarrow.csv as pa_csv
 import pytest
 
 from app.services.csv_parser import (
     CsvImportOptions,
+    detect_delimiter,
     detect_encoding,
     parse_full,
     parse_preview,
@@ -87,6 +90,40 @@ class TestDetectEncoding:
         assert encoding in ("utf-8", "ascii")
 
 
+class TestDetectDelimiter:
+    """Tests for delimiter detection."""
+
+    @pytest.mark.parametrize("delimiter", [",", "\t", ";", "|"])
+    def test_detect_candidate_delimiters(self, delimiter: str) -> None:
+        """Should detect each supported delimiter."""
+        csv_content = delimiter.join(["name", "age", "city"]) + "\n"
+        csv_content += delimiter.join(["john", "30", "Tokyo"]) + "\n"
+        file_bytes = csv_content.encode("utf-8")
+
+        assert detect_delimiter(file_bytes) == delimiter
+
+    def test_prefers_consistent_field_count(self) -> None:
+        """Should prefer the delimiter with a consistent per-row count."""
+        csv_content = "name;note\njohn;a,b,c\njane;d\nbob;e,f\n"
+        file_bytes = csv_content.encode("utf-8")
+
+        assert detect_delimiter(file_bytes) == ";"
+
+    def test_empty_file_defaults_to_comma(self) -> None:
+        """Should fall back to comma for empty input."""
+        assert detect_delimiter(b"") == ","
+
+    def test_auto_detect_in_parse_full(self) -> None:
+        """Should auto-detect the delimiter when options.delimiter is None."""
+        file_bytes = "name\tage\njohn\t30\njane\t25".encode("utf-8")
+        options = CsvImportOptions(delimiter=None)
+
+        df = parse_full(file_bytes, options)
+
+        assert list(df.columns) == ["name", "age"]
+        assert len(df) == 2
+
+
 class TestCsvImportOptions:
     """Tests for CsvImportOptions dataclass."""
 
@@ -267,3 +304,63 @@ class TestParseFull:
         df = parse_full(file_bytes)
 
         assert len(df) == 0
+
+    def test_arrow_reader_matches_pandas(self) -> None:
+        """Should read via Arrow with the same result as the pandas reader."""
+        csv_content = (
+            "id,name,joined,active,score,note\n"
+            "1,Alice,2024-01-01,true,1.5,NA\n"
+            "2,Bob,2024-01-02,False,,x\n"
+            "3,,2024-01-03,TRUE,2.0,\n"
+        )
+        file_bytes = csv_content.encode("utf-8")
+        options = CsvImportOptions(null_values=["x"])
+
+        with patch(
+            "app.services.csv_parser.pa_csv.read_csv", wraps=pa_csv.read_csv
+        ) as read_csv:
+            df = parse_full(file_bytes, options=options)
+        with patch("app.services.csv_parser.settings") as mock_settings:
+            mock_settings.csv_arrow_reader_enabled = False
+            expected = parse_full(file_bytes, options=options)
+
+        read_csv.assert_called()
+        assert df["joined"].tolist() == ["2024-01-01", "2024-01-02", "2024-01-03"]
+        assert df["note"].isna().all()
+        pd.testing.assert_frame_equal(df, expected, check_exact=True)
+
+    @pytest.mark.parametrize(
+        "csv_content",
+        [
+            "id,n\n99999999999999999999,1\n2,2\n",
+            "id,n\n9223372036854775808,1\n2,2\n",
+            "id,n\n-9223372036854775809,1\n2,2\n",
+            "code,n\n0x1F,1\n0x20,2\n",
+            "code,n\n0X1F,1\n32,2\n",
+            "id,n\n1e20,1\n2.5,2\n",
+            "a,b\n+1,-2\n3,4\n",
+            "a,b\n+1.5,2\n3,4\n",
+            "a,b,\n1,2,\n3,4,\n",
+            ",a\n1,2\n3,4\n",
+        ],
+    )
+    def test_arrow_reader_matches_pandas_on_edge_cases(
+        self, csv_content: str
+    ) -> None:
+        """Should read big ints, hex, signed ints and empty headers like pandas."""
+        file_bytes = csv_content.encode("utf-8")
+
+        df = parse_full(file_bytes)
+        with patch("app.services.csv_parser.settings") as mock_settings:
+            mock_settings.csv_arrow_reader_enabled = False
+            expected = parse_full(file_bytes)
+
+        pd.testing.assert_frame_equal(df, expected, check_exact=True)
+
+    def test_arrow_reader_falls_back_to_pandas(self) -> None:
+        """Should fall back to pandas for files Arrow rejects."""
+        file_bytes = b"a,a\n1,2\n"
+
+        df = parse_full(file_bytes)
+
+        assert list(df.columns) == ["a", "a.1"]
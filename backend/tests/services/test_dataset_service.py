@@ -7,7 +7,7 @@ import pandas as pd
 import pytest
 
 from app.models.dataset import ColumnSchema, Dataset
-from app.services.dataset_service import DatasetService
+from app.services.dataset_service import DatasetService, S3_FETCH_PART_SIZE
 
 
 @pytest.fixture
@@ -179,6 +179,31 @@ class TestDatasetServiceImportCSV:
         assert result.row_count == 2
         assert result.column_count == 3
 
+    @pytest.mark.asyncio
+    async def test_import_csv_detects_delimiter_when_none(
+        self,
+        mock_dynamodb: Any,
+        mock_s3_client: Any,
+    ) -> None:
+        """Test CSV import detects the delimiter when delimiter is None."""
+        # Arrange
+        service = DatasetService()
+        csv_bytes = "name;age\nAlice;25\nBob;30\n".encode('utf-8')
+
+        # Act
+        result = await service.import_csv(
+            file_bytes=csv_bytes,
+            name="Semicolon Delimited",
+            owner_id="user_123",
+            dynamodb=mock_dynamodb,
+            s3_client=mock_s3_client,
+            delimiter=None,
+        )
+
+        # Assert
+        assert result.row_count == 2
+        assert [c.name for c in result.columns] == ['name', 'age']
+
     @pytest.mark.asyncio
     async def test_import_csv_with_partition_column(
         self,
@@ -352,6 +377,49 @@ class TestDatasetServiceGetPreview:
         assert result['total_rows'] == 100
         assert result['preview_rows'] == 3
 
+    @pytest.mark.asyncio
+    async def test_get_preview_rows_are_lists_with_none_for_missing(
+        self,
+        mock_s3_client: Any,
+    ) -> None:
+        """Test get_preview returns row lists with native values and None."""
+        # Arrange
+        service = DatasetService()
+        dataset = Dataset(
+            id='ds_123456789abc',
+            name='Test Dataset',
+            source_type='csv',
+            schema=[
+                ColumnSchema(name='name', data_type='string', nullable=True),
+                ColumnSchema(name='score', data_type='float64', nullable=True),
+            ],
+            owner_id='user_123',
+            s3_path='datasets/ds_123456789abc/data/part-0000.parquet',
+            row_count=2,
+            column_count=2,
+            created_at=datetime.now(timezone.utc),
+            updated_at=datetime.now(timezone.utc),
+        )
+        sample_df = pd.DataFrame({
+            'name': ['Alice', None],
+            'score': [1.5, float('nan')],
+        })
+
+        with patch('app.services.dataset_service.ParquetReader') as mock_reader:
+            mock_reader_instance = MagicMock()
+            mock_reader.return_value = mock_reader_instance
+            mock_reader_instance.read_preview.return_value = sample_df
+
+            # Act
+            result = await service.get_preview(
+                dataset=dataset,
+                s3_client=mock_s3_client,
+                max_rows=100,
+            )
+
+        # Assert
+        assert result['rows'] == [['Alice', 1.5], [None, None]]
+
     @pytest.mark.asyncio
     async def test_get_preview_custom_max_rows(
         self,
@@ -990,6 +1058,159 @@ class TestReimportExecute:
             mock_repo.get_by_id.assert_called_once()
             mock_repo.update.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_reimport_execute_unchanged_source_skips_upload(
+        self,
+        existing_dataset: Dataset,
+        mock_dynamodb: Any,
+        mock_s3_client: Any,
+        mock_source_s3_client: Any,
+    ) -> None:
+        """Test reimport_execute only touches timestamps when source is unchanged."""
+        # Arrange
+        service = DatasetService()
+        csv_content = b"name,age\nAlice,30\nBob,25\n"
+        existing_dataset.source_hash = service._hash_source(csv_content)
+
+        with patch('app.services.dataset_service.DatasetRepository') as mock_repo_cls:
+            mock_repo = MagicMock()
+            mock_repo.get_by_id = AsyncMock(return_value=existing_dataset)
+            mock_repo.update = AsyncMock(return_value=existing_dataset)
+            mock_repo_cls.return_value = mock_repo
+
+            mock_source_s3_client.get_object.return_value = {
+                'Body': MagicMock(read=MagicMock(return_value=csv_content))
+            }
+
+            # Act
+            await service.reimport_execute(
+                dataset_id=existing_dataset.id,
+                user_id='user_123',
+                dynamodb=mock_dynamodb,
+                s3_client=mock_s3_client,
+                source_s3_client=mock_source_s3_client,
+            )
+
+            # Assert
+            mock_s3_client.put_object.assert_not_called()
+            update_data = mock_repo.update.call_args[0][1]
+            assert set(update_data) == {'last_import_at', 'last_import_by'}
+            assert update_data['last_import_by'] == 'user_123'
+
+    @pytest.mark.asyncio
+    async def test_reimport_execute_many_success(
+        self,
+        existing_dataset: Dataset,
+        mock_dynamodb: Any,
+        mock_s3_client: Any,
+        mock_source_s3_client: Any,
+    ) -> None:
+        """Test reimport_execute_many reimports every dataset in order."""
+        # Arrange
+        service = DatasetService()
+        new_csv_content = b"name,age\nAlice,30\nBob,25\n"
+        second_dataset = Dataset(
+            **{**existing_dataset.model_dump(by_alias=True), 'id': 'ds_second000000'}
+        )
+        datasets = {d.id: d for d in (existing_dataset, second_dataset)}
+
+        async def get_by_id(dataset_id: str, dynamodb: Any) -> Dataset:
+            return datasets[dataset_id]
+
+        async def update(dataset_id: str, data: dict, dynamodb: Any) -> Dataset:
+            return datasets[dataset_id]
+
+        with patch('app.services.dataset_service.DatasetRepository') as mock_repo_cls:
+            mock_repo = MagicMock()
+            mock_repo.get_by_id = AsyncMock(side_effect=get_by_id)
+            mock_repo.update = AsyncMock(side_effect=update)
+            mock_repo_cls.return_value = mock_repo
+
+            mock_source_s3_client.get_object.side_effect = lambda **kwargs: {
+                'Body': MagicMock(read=MagicMock(return_value=new_csv_content))
+            }
+
+            # Act
+            results = await service.reimport_execute_many(
+                dataset_ids=[existing_dataset.id, second_dataset.id],
+                user_id='user_123',
+                dynamodb=mock_dynamodb,
+                s3_client=mock_s3_client,
+                source_s3_client=mock_source_s3_client,
+                concurrency=2,
+            )
+
+            # Assert
+            assert [r.key for r in results] == [existing_dataset.id, second_dataset.id]
+            assert [r.dataset.id for r in results] == [existing_dataset.id, second_dataset.id]
+            assert all(r.error is None for r in results)
+            assert mock_source_s3_client.get_object.call_count == 2
+            assert mock_repo.update.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_reimport_execute_many_reports_each_failure(
+        self,
+        existing_dataset: Dataset,
+        mock_dynamodb: Any,
+        mock_s3_client: Any,
+        mock_source_s3_client: Any,
+    ) -> None:
+        """Test reimport_execute_many commits what it can and reports what failed."""
+        # Arrange
+        service = DatasetService()
+        new_csv_content = b"name,age\nAlice,30\nBob,25\n"
+
+        async def get_by_id(dataset_id: str, dynamodb: Any) -> Dataset | None:
+            return existing_dataset if dataset_id == existing_dataset.id else None
+
+        with patch('app.services.dataset_service.DatasetRepository') as mock_repo_cls:
+            mock_repo = MagicMock()
+            mock_repo.get_by_id = AsyncMock(side_effect=get_by_id)
+            mock_repo.update = AsyncMock(return_value=existing_dataset)
+            mock_repo_cls.return_value = mock_repo
+
+            mock_source_s3_client.get_object.side_effect = lambda **kwargs: {
+                'Body': MagicMock(read=MagicMock(return_value=new_csv_content))
+            }
+
+            # Act
+            results = await service.reimport_execute_many(
+                dataset_ids=['ds_missing00000', existing_dataset.id],
+                user_id='user_123',
+                dynamodb=mock_dynamodb,
+                s3_client=mock_s3_client,
+                source_s3_client=mock_source_s3_client,
+                concurrency=1,
+            )
+
+            # Assert
+            missing, updated = results
+            assert missing.key == 'ds_missing00000'
+            assert missing.dataset is None
+            assert isinstance(missing.error, ValueError)
+            assert updated.dataset is existing_dataset
+            assert updated.error is None
+
+    @pytest.mark.asyncio
+    async def test_reimport_execute_many_invalid_concurrency(
+        self,
+        mock_dynamodb: Any,
+        mock_s3_client: Any,
+        mock_source_s3_client: Any,
+    ) -> None:
+        """Test reimport_execute_many rejects a concurrency below 1."""
+        service = DatasetService()
+
+        with pytest.raises(ValueError, match="concurrency"):
+            await service.reimport_execute_many(
+                dataset_ids=['ds_123456789abc'],
+                user_id='user_123',
+                dynamodb=mock_dynamodb,
+                s3_client=mock_s3_client,
+                source_s3_client=mock_source_s3_client,
+                concurrency=0,
+            )
+
     @pytest.mark.asyncio
     async def test_reimport_execute_with_schema_changes_no_force(
         self,
@@ -1237,5 +1458,6 @@ class TestReimportExecute:
         assert result == csv_content
         async_get_object.assert_called_once_with(
             Bucket='test-bucket',
-            Key='data/test.csv'
+            Key='data/test.csv',
+            Range=f'bytes=0-{S3_FETCH_PART_SIZE - 1}',
         )
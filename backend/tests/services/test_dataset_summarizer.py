@@ -1,13 +1,17 @@
 """Tests for DatasetSummarizer service."""
+import asyncio
 import pytest
 import pandas as pd
 import numpy as np
+import pyarrow as pa
 from dataclasses import asdict, fields
+from unittest.mock import patch
 from moto import mock_aws
 import boto3
 
 from app.core.config import settings
 from app.services.parquet_storage import ParquetConverter, ParquetReader
+from app.services import dataset_summarizer
 from app.services.dataset_summarizer import DatasetSummarizer, DatasetSummary
 
 
@@ -15,9 +19,9 @@ from app.services.dataset_summarizer import DatasetSummarizer, DatasetSummary
 # Fixtures
 # ---------------------------------------------------------------------------
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def s3_client():
-    """Create mock S3 client with a test bucket."""
+    """Create mock S3 client with a test bucket, shared by the module."""
     with mock_aws():
         s3 = boto3.client('s3', region_name=settings.s3_region)
         s3.create_bucket(
@@ -27,19 +31,35 @@ def s3_client():
         yield s3
 
 
+@pytest.fixture(autouse=True)
+def _clear_summary_cache():
+    """Start every test with an empty module-level summary cache."""
+    dataset_summarizer._summary_cache.clear()
+
+
 @pytest.fixture
 def parquet_reader(s3_client):
     """Create ParquetReader backed by the mock S3 client."""
     return ParquetReader(s3_client, settings.s3_bucket_datasets)
 
 
+@pytest.fixture(scope="class")
+def summarizer(s3_client):
+    """Create a DatasetSummarizer shared by the tests of one class.
+
+    Tests that spy on the reader or need a cold cache build their own.
+    """
+    reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
+    return DatasetSummarizer(parquet_reader=reader)
+
+
 @pytest.fixture
 def parquet_converter(s3_client):
     """Create ParquetConverter backed by the mock S3 client."""
     return ParquetConverter(s3_client, settings.s3_bucket_datasets)
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_dataframe():
     """Create a sample DataFrame with various data types."""
     return pd.DataFrame({
@@ -51,7 +71,7 @@ def sample_dataframe():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_dataframe_with_nulls():
     """Create a sample DataFrame that contains NULL values."""
     return pd.DataFrame({
@@ -61,7 +81,7 @@ def sample_dataframe_with_nulls():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_dataframe():
     """Create an empty DataFrame with schema but no rows."""
     return pd.DataFrame({
@@ -71,7 +91,7 @@ def empty_dataframe():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def large_dataframe():
     """Create a larger DataFrame for sample_rows limiting tests."""
     return pd.DataFrame({
@@ -88,6 +108,51 @@ async def _save_and_get_path(converter, df, dataset_id):
     return result.s3_path
 
 
+@pytest.fixture(scope="module")
+def prewritten_paths(
+    s3_client,
+    sample_dataframe,
+    sample_dataframe_with_nulls,
+    empty_dataframe,
+    large_dataframe,
+    mixed_type_dataframe,
+    all_null_dataframe,
+):
+    """Write each shared DataFrame to mock S3 once and map it to its s3_path.
+
+    summarize() and generate_summary() only read, so tests can share these.
+    """
+    converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
+    frames = {
+        'sample': sample_dataframe,
+        'with_nulls': sample_dataframe_with_nulls,
+        'empty': empty_dataframe,
+        'large': large_dataframe,
+        'mixed': mixed_type_dataframe,
+        'all_null': all_null_dataframe,
+    }
+
+    async def save_all() -> dict[str, str]:
+        paths = await asyncio.gather(*(
+            _save_and_get_path(converter, df, f'shared-{key}')
+            for key, df in frames.items()
+        ))
+        return dict(zip(frames, paths))
+
+    return asyncio.run(save_all())
+
+
+# (row_count, column_count) of each prewritten_paths entry
+SHARED_SHAPES = {
+    'sample': (5, 5),
+    'with_nulls': (3, 3),
+    'empty': (0, 3),
+    'large': (100, 2),
+    'mixed': (5, 4),
+    'all_null': (3, 3),
+}
+
+
 # ===========================================================================
 # DatasetSummary dataclass tests
 # ===========================================================================
@@ -158,49 +223,37 @@ class TestDatasetSummarizerSummarize:
     """Test DatasetSummarizer.summarize() method."""
 
     async def test_returns_dataset_summary_type(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """summarize() returns a DatasetSummary instance."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-type-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='employees')
 
         assert isinstance(result, DatasetSummary)
 
     async def test_name_is_set(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """summarize() sets the name field to the provided name."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-name-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='my_dataset')
 
         assert result.name == 'my_dataset'
 
     async def test_row_count(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """summarize() reports the correct row count."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-rows-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert result.row_count == 5
 
     async def test_column_count(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """summarize() reports the correct column count."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-cols-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert result.column_count == 5
@@ -210,25 +263,19 @@ class TestDatasetSummarizerSummarize:
     # -----------------------------------------------------------------------
 
     async def test_schema_contains_all_columns(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """schema list has one entry per column."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-schema-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert len(result.schema) == 5
 
     async def test_schema_entry_keys(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Each schema entry contains column_name, type, and nullable keys."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-schema-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         for entry in result.schema:
@@ -237,39 +284,30 @@ class TestDatasetSummarizerSummarize:
             assert 'nullable' in entry
 
     async def test_schema_column_names_match(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """schema column_name values match the DataFrame columns."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-schema-003'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         schema_names = [e['column_name'] for e in result.schema]
         assert schema_names == ['id', 'name', 'age', 'salary', 'is_active']
 
     async def test_schema_types_are_strings(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """schema type values are human-readable strings (not dtype objects)."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-schema-004'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         for entry in result.schema:
             assert isinstance(entry['type'], str)
 
     async def test_schema_nullable_with_nulls(
-        self, parquet_reader, parquet_converter, sample_dataframe_with_nulls
+        self, summarizer, prewritten_paths
     ):
         """nullable is True for columns that actually contain NULLs."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe_with_nulls, 'sum-nullable-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['with_nulls']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         nullable_map = {e['column_name']: e['nullable'] for e in result.schema}
@@ -284,81 +322,80 @@ class TestDatasetSummarizerSummarize:
     # -----------------------------------------------------------------------
 
     async def test_sample_rows_returns_list_of_dicts(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """sample_rows is a list of dicts."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-sample-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert isinstance(result.sample_rows, list)
         assert all(isinstance(row, dict) for row in result.sample_rows)
 
     async def test_sample_rows_default_limit(
-        self, parquet_reader, parquet_converter, large_dataframe
+        self, summarizer, prewritten_paths
     ):
         """sample_rows defaults to at most 5 rows for datasets larger than 5."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, large_dataframe, 'sum-sample-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['large']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert len(result.sample_rows) == 5
 
     async def test_sample_rows_small_dataset_returns_all(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """When the dataset has fewer than 5 rows, all rows are returned."""
         small_df = pd.DataFrame({'x': [1, 2, 3]})
         s3_path = await _save_and_get_path(
             parquet_converter, small_df, 'sum-sample-003'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert len(result.sample_rows) == 3
 
     async def test_sample_rows_content(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """sample_rows contain the correct data from the first rows."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-sample-004'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         first_row = result.sample_rows[0]
         assert first_row['id'] == 1
         assert first_row['name'] == 'Alice'
 
+    async def test_sample_rows_missing_values_are_none(
+        self, summarizer, parquet_converter
+    ):
+        """Missing values in sample_rows are returned as None, not NaN."""
+        df = pd.DataFrame({'score': [1.5, None], 'label': ['a', None]})
+        s3_path = await _save_and_get_path(
+            parquet_converter, df, 'sum-sample-005'
+        )
+        result = await summarizer.summarize(s3_path=s3_path, name='test')
+
+        assert result.sample_rows == [
+            {'score': 1.5, 'label': 'a'},
+            {'score': None, 'label': None},
+        ]
+
     # -----------------------------------------------------------------------
     # Statistics tests
     # -----------------------------------------------------------------------
 
     async def test_statistics_is_dict(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """statistics is a dict."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-stats-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert isinstance(result.statistics, dict)
 
     async def test_statistics_numeric_columns_have_stats(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Numeric columns include min, max, mean, median, std."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-stats-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         # 'age' is numeric
@@ -368,13 +405,10 @@ class TestDatasetSummarizerSummarize:
             assert key in age_stats, f"Missing '{key}' in age statistics"
 
     async def test_statistics_numeric_values_correct(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Numeric statistics values are computed correctly."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-stats-003'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         age_stats = result.statistics['age']
@@ -383,14 +417,26 @@ class TestDatasetSummarizerSummarize:
         assert age_stats['mean'] == 35.0
         assert age_stats['median'] == 35.0
 
+    async def test_statistics_numeric_std_and_boolean_columns(
+        self, summarizer, sample_dataframe, prewritten_paths
+    ):
+        """std uses sample deviation and boolean columns get numeric stats."""
+        s3_path = prewritten_paths['sample']
+        result = await summarizer.summarize(s3_path=s3_path, name='test')
+
+        assert result.statistics['age']['std'] == pytest.approx(
+            sample_dataframe['age'].std()
+        )
+        active_stats = result.statistics['is_active']
+        assert active_stats['min'] is False
+        assert active_stats['max'] is True
+        assert active_stats['mean'] == pytest.approx(0.6)
+
     async def test_statistics_non_numeric_columns_have_unique_count(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Non-numeric (object/string) columns include unique_count and top_values."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'sum-stats-004'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         # 'name' is a string column
@@ -401,13 +447,10 @@ class TestDatasetSummarizerSummarize:
         assert 'top_values' in name_stats
 
     async def test_statistics_null_count(
-        self, parquet_reader, parquet_converter, sample_dataframe_with_nulls
+        self, summarizer, prewritten_paths
     ):
         """Statistics include null_count for columns with NULLs."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe_with_nulls, 'sum-stats-005'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['with_nulls']
         result = await summarizer.summarize(s3_path=s3_path, name='test')
 
         assert result.statistics['name']['null_count'] == 1
@@ -419,13 +462,10 @@ class TestDatasetSummarizerSummarize:
     # -----------------------------------------------------------------------
 
     async def test_empty_dataframe(
-        self, parquet_reader, parquet_converter, empty_dataframe
+        self, summarizer, prewritten_paths
     ):
         """summarize() handles an empty DataFrame gracefully."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, empty_dataframe, 'sum-empty-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['empty']
         result = await summarizer.summarize(s3_path=s3_path, name='empty')
 
         assert result.row_count == 0
@@ -434,13 +474,32 @@ class TestDatasetSummarizerSummarize:
         assert result.name == 'empty'
         # Schema should still list the columns
         assert len(result.schema) == 3
+        assert result.statistics['value']['mean'] is None
+        assert result.statistics['name'] == {
+            'null_count': 0, 'unique_count': 0, 'top_values': [],
+        }
+
+    async def test_concurrent_summaries(
+        self, summarizer, prewritten_paths
+    ):
+        """Concurrent summarize() calls on one summarizer stay independent."""
+        keys = list(SHARED_SHAPES)
+
+        results = await asyncio.gather(*(
+            summarizer.summarize(s3_path=prewritten_paths[key], name=key)
+            for key in keys
+        ))
+
+        for key, result in zip(keys, results):
+            assert result.name == key
+            assert (result.row_count, result.column_count) == SHARED_SHAPES[key]
 
 
 # ===========================================================================
 # Fixtures for generate_summary tests
 # ===========================================================================
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mixed_type_dataframe():
     """DataFrame with numeric, string, and datetime columns."""
     return pd.DataFrame({
@@ -453,17 +512,17 @@ def mixed_type_dataframe():
             '2024-03-20',
             '2024-04-10',
             '2024-05-05',
-        ]),
+        ], format='%Y-%m-%d'),
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def all_null_dataframe():
     """DataFrame where every column is entirely NULL."""
     return pd.DataFrame({
-        'null_int': pd.array([None, None, None], dtype=pd.Int64Dtype()),
-        'null_str': pd.array([None, None, None], dtype=pd.StringDtype()),
-        'null_float': pd.array([None, None, None], dtype=pd.Float64Dtype()),
+        'null_int': pd.arrays.ArrowExtensionArray(pa.nulls(3, pa.int64())),
+        'null_str': pd.arrays.ArrowExtensionArray(pa.nulls(3, pa.string())),
+        'null_float': pd.arrays.ArrowExtensionArray(pa.nulls(3, pa.float64())),
     })
 
 
@@ -487,25 +546,19 @@ class TestGenerateSummary:
     # -----------------------------------------------------------------------
 
     async def test_returns_dict(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """generate_summary returns a plain dict."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'gs-struct-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.generate_summary(s3_path)
 
         assert isinstance(result, dict)
 
     async def test_top_level_keys(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Result contains schema, statistics, row_count, column_count."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'gs-struct-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.generate_summary(s3_path)
 
         assert 'schema' in result
@@ -514,33 +567,28 @@ class TestGenerateSummary:
         assert 'column_count' in result
 
     async def test_row_and_column_counts(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """row_count and column_count match the DataFrame dimensions."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'gs-struct-003'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.generate_summary(s3_path)
 
         assert result['row_count'] == 5
         assert result['column_count'] == 5
 
     async def test_uses_read_preview_with_1000_rows(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, parquet_reader, prewritten_paths
     ):
         """generate_summary calls read_preview(s3_path, 1000)."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'gs-preview-001'
-        )
+        s3_path = prewritten_paths['sample']
 
         # Spy on read_preview
         original_read_preview = parquet_reader.read_preview
         call_args_log = []
 
-        async def spy_read_preview(path, max_rows):
+        async def spy_read_preview(path, max_rows, columns=None):
             call_args_log.append((path, max_rows))
-            return await original_read_preview(path, max_rows)
+            return await original_read_preview(path, max_rows, columns=columns)
 
         parquet_reader.read_preview = spy_read_preview
         summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
@@ -555,26 +603,20 @@ class TestGenerateSummary:
     # -----------------------------------------------------------------------
 
     async def test_schema_contains_all_columns(
-        self, parquet_reader, parquet_converter, mixed_type_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Schema lists every column."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, mixed_type_dataframe, 'gs-schema-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['mixed']
         result = await summarizer.generate_summary(s3_path)
 
         col_names = [c['name'] for c in result['schema']]
         assert col_names == ['id', 'name', 'score', 'created_at']
 
     async def test_schema_entry_keys(
-        self, parquet_reader, parquet_converter, mixed_type_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Each schema entry has name, dtype, and nullable."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, mixed_type_dataframe, 'gs-schema-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['mixed']
         result = await summarizer.generate_summary(s3_path)
 
         for entry in result['schema']:
@@ -583,13 +625,10 @@ class TestGenerateSummary:
             assert 'nullable' in entry
 
     async def test_schema_nullable_is_bool(
-        self, parquet_reader, parquet_converter, mixed_type_dataframe
+        self, summarizer, prewritten_paths
     ):
         """nullable is a boolean."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, mixed_type_dataframe, 'gs-schema-003'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['mixed']
         result = await summarizer.generate_summary(s3_path)
 
         for entry in result['schema']:
@@ -600,13 +639,10 @@ class TestGenerateSummary:
     # -----------------------------------------------------------------------
 
     async def test_numeric_stats_keys(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Numeric columns have min, max, mean, std, null_count."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'gs-numstat-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['sample']
         result = await summarizer.generate_summary(s3_path)
 
         age_stats = result['statistics']['age']
@@ -614,65 +650,89 @@ class TestGenerateSummary:
             assert key in age_stats, f"Missing '{key}' in numeric statistics"
 
     async def test_numeric_stats_values_correct(
-        self, parquet_reader, parquet_converter, sample_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Numeric statistics are computed correctly."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, sample_dataframe, 'gs-numstat-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
-        result = await summarizer.generate_summary(s3_path)
+        s3_path = prewritten_paths['sample']
+        result = await summarizer.generate_summary(s3_path, columns=['age'])
 
         age_stats = result['statistics']['age']
         assert age_stats['min'] == 25
         assert age_stats['max'] == 45
-        assert age_stats['mean'] == pytest.approx(35.0)
+        assert age_stats['mean'] == 35.0
         assert age_stats['null_count'] == 0
 
+    async def test_columns_limits_summary(
+        self, summarizer, prewritten_paths
+    ):
+        """Only the requested columns are read and summarized."""
+        s3_path = prewritten_paths['sample']
+        full = await summarizer.generate_summary(s3_path)
+        result = await summarizer.generate_summary(s3_path, columns=['name', 'age'])
+
+        assert [col['name'] for col in result['schema']] == ['name', 'age']
+        assert set(result['statistics']) == {'name', 'age'}
+        assert result['column_count'] == 2
+        assert result['row_count'] == 5
+        assert result['statistics']['age'] == full['statistics']['age']
+
     async def test_numeric_stats_std(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """std is computed correctly for numeric columns."""
         df = pd.DataFrame({'val': [1, 2, 3, 4, 5]})
         s3_path = await _save_and_get_path(
             parquet_converter, df, 'gs-numstat-003'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         expected_std = pd.Series([1, 2, 3, 4, 5]).std()
         assert result['statistics']['val']['std'] == pytest.approx(expected_std)
 
     async def test_numeric_stats_with_nulls(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """null_count reflects NaN values in numeric columns."""
         df = pd.DataFrame({'val': [1.0, None, 3.0, None, 5.0]})
         s3_path = await _save_and_get_path(
             parquet_converter, df, 'gs-numstat-004'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         stats = result['statistics']['val']
         assert stats['null_count'] == 2
-        assert stats['min'] == pytest.approx(1.0)
-        assert stats['max'] == pytest.approx(5.0)
-        assert stats['mean'] == pytest.approx(3.0)
+        assert stats['min'] == 1.0
+        assert stats['max'] == 5.0
+        assert stats['mean'] == 3.0
+
+    async def test_numeric_stats_boolean_column(
+        self, summarizer, parquet_converter
+    ):
+        """Boolean columns get numeric stats with native Python values."""
+        df = pd.DataFrame({'flag': [True, False, True, True, False]})
+        s3_path = await _save_and_get_path(
+            parquet_converter, df, 'gs-numstat-005'
+        )
+        result = await summarizer.generate_summary(s3_path)
+
+        stats = result['statistics']['flag']
+        assert stats['min'] is False
+        assert stats['max'] is True
+        assert stats['mean'] == pytest.approx(0.6)
+        assert stats['std'] == pytest.approx(df['flag'].astype(int).std())
 
     # -----------------------------------------------------------------------
     # String column statistics
     # -----------------------------------------------------------------------
 
     async def test_string_stats_keys(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """String columns have unique_count, top_values, null_count."""
         df = pd.DataFrame({'color': ['red', 'blue', 'red', 'green', 'blue']})
         s3_path = await _save_and_get_path(
             parquet_converter, df, 'gs-strstat-001'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         stats = result['statistics']['color']
@@ -681,27 +741,25 @@ class TestGenerateSummary:
         assert 'null_count' in stats
 
     async def test_string_stats_unique_count(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """unique_count counts distinct non-null values."""
         df = pd.DataFrame({'color': ['red', 'blue', 'red', 'green', 'blue', 'blue']})
         s3_path = await _save_and_get_path(
             parquet_converter, df, 'gs-strstat-002'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         assert result['statistics']['color']['unique_count'] == 3
 
     async def test_string_stats_top_values_format(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """top_values is list of {value, count} dicts sorted by count desc."""
         df = pd.DataFrame({'color': ['red', 'blue', 'red', 'green', 'blue', 'blue']})
         s3_path = await _save_and_get_path(
             parquet_converter, df, 'gs-strstat-003'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         top = result['statistics']['color']['top_values']
@@ -714,97 +772,107 @@ class TestGenerateSummary:
         assert top[1]['count'] == 2
 
     async def test_string_stats_top_values_limited_to_10(
-        self, parquet_reader, parquet_converter
+        self, summarizer, parquet_converter
     ):
         """top_values has at most 10 entries."""
         df = pd.DataFrame({'item': [f'item_{i}' for i in range(20)]})
         s3_path = await _save_and_get_path(
             parquet_converter, df, 'gs-strstat-004'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         assert len(result['statistics']['item']['top_values']) == 10
 
-    async def test_string_stats_null_count(
-        self, parquet_reader, parquet_converter
+    async def test_string_stats_top_values_selects_most_frequent(
+        self, summarizer, parquet_converter
     ):
-        """null_count reflects NaN values in string columns."""
-        df = pd.DataFrame({'name': ['Alice', None, 'Bob', None, 'Charlie']})
+        """With more than 10 distinct values, the 10 most frequent are kept."""
+        values = [f'item_{i:02d}' for i in range(15) for _ in range(i + 1)]
+        df = pd.DataFrame({'item': values})
         s3_path = await _save_and_get_path(
-            parquet_converter, df, 'gs-strstat-005'
+            parquet_converter, df, 'gs-strstat-007'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
-        assert result['statistics']['name']['null_count'] == 2
+        stats = result['statistics']['item']
+        assert stats['unique_count'] == 15
+        assert stats['top_values'] == [
+            {'value': f'item_{i:02d}', 'count': i + 1}
+            for i in range(14, 4, -1)
+        ]
 
-    # -----------------------------------------------------------------------
-    # Date/datetime column statistics
-    # -----------------------------------------------------------------------
-
-    async def test_datetime_stats_min_max(
-        self, parquet_reader, parquet_converter
+    async def test_string_stats_null_count(
+        self, summarizer, parquet_converter
     ):
-        """Datetime columns produce min and max as ISO-format strings."""
-        df = pd.DataFrame({
-            'ts': pd.to_datetime(['2024-01-15', '2024-06-30', '2024-03-10']),
-        })
+        """null_count reflects NaN values in string columns."""
+        df = pd.DataFrame({'name': ['Alice', None, 'Bob', None, 'Charlie']})
         s3_path = await _save_and_get_path(
-            parquet_converter, df, 'gs-datestat-001'
+            parquet_converter, df, 'gs-strstat-005'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
-        stats = result['statistics']['ts']
-        assert stats['min'] == '2024-01-15T00:00:00'
-        assert stats['max'] == '2024-06-30T00:00:00'
+        assert result['statistics']['name']['null_count'] == 2
 
-    async def test_datetime_stats_null_count(
-        self, parquet_reader, parquet_converter
+    async def test_string_stats_categorical_column(
+        self, summarizer, parquet_converter
     ):
-        """null_count reflects NaT values in datetime columns."""
+        """Categorical columns report plain values, ties in first-seen order."""
         df = pd.DataFrame({
-            'ts': pd.to_datetime(['2024-01-15', None, '2024-03-10']),
+            'grade': pd.Categorical(['b', 'a', None, 'a', 'b', 'c'])
         })
         s3_path = await _save_and_get_path(
-            parquet_converter, df, 'gs-datestat-002'
+            parquet_converter, df, 'gs-strstat-006'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
-        assert result['statistics']['ts']['null_count'] == 1
+        stats = result['statistics']['grade']
+        assert stats['null_count'] == 1
+        assert stats['unique_count'] == 3
+        assert stats['top_values'] == [
+            {'value': 'b', 'count': 2},
+            {'value': 'a', 'count': 2},
+            {'value': 'c', 'count': 1},
+        ]
 
-    async def test_datetime_stats_keys(
-        self, parquet_reader, parquet_converter
-    ):
-        """Datetime column stats include min, max, null_count."""
+    # -----------------------------------------------------------------------
+    # Date/datetime column statistics
+    # -----------------------------------------------------------------------
+
+    async def test_datetime_stats(self, summarizer, parquet_converter):
+        """Datetime columns produce ISO min/max and count NaT as null."""
         df = pd.DataFrame({
-            'ts': pd.to_datetime(['2024-01-15', '2024-06-30']),
+            'ts': pd.to_datetime(
+                ['2024-01-15', '2024-06-30', '2024-03-10'], format='%Y-%m-%d'
+            ),
+            'ts_with_null': pd.to_datetime(
+                ['2024-01-15', None, '2024-03-10'], format='%Y-%m-%d'
+            ),
         })
         s3_path = await _save_and_get_path(
-            parquet_converter, df, 'gs-datestat-003'
+            parquet_converter, df, 'gs-datestat-001'
         )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
         result = await summarizer.generate_summary(s3_path)
 
         stats = result['statistics']['ts']
-        assert 'min' in stats
-        assert 'max' in stats
-        assert 'null_count' in stats
+        assert set(stats) == {'min', 'max', 'null_count'}
+        assert stats['min'] == '2024-01-15T00:00:00'
+        assert stats['max'] == '2024-06-30T00:00:00'
+        assert stats['null_count'] == 0
+
+        null_stats = result['statistics']['ts_with_null']
+        assert null_stats['null_count'] == 1
+        assert null_stats['min'] == '2024-01-15T00:00:00'
+        assert null_stats['max'] == '2024-03-10T00:00:00'
 
     # -----------------------------------------------------------------------
     # Edge cases
     # -----------------------------------------------------------------------
 
     async def test_empty_dataframe_schema_preserved(
-        self, parquet_reader, parquet_converter, empty_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Empty DataFrame returns schema with zero rows."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, empty_dataframe, 'gs-edge-001'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['empty']
         result = await summarizer.generate_summary(s3_path)
 
         assert result['row_count'] == 0
@@ -812,28 +880,26 @@ class TestGenerateSummary:
         assert 'id' in col_names
         assert 'name' in col_names
         assert 'value' in col_names
+        assert result['statistics']['value']['min'] is None
+        assert result['statistics']['name'] == {
+            'null_count': 0, 'unique_count': 0, 'top_values': [],
+        }
 
     async def test_all_null_columns_no_exception(
-        self, parquet_reader, parquet_converter, all_null_dataframe
+        self, summarizer, prewritten_paths
     ):
         """All-null columns are handled gracefully."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, all_null_dataframe, 'gs-edge-002'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['all_null']
         result = await summarizer.generate_summary(s3_path)
 
         for col_name, col_stats in result['statistics'].items():
             assert col_stats['null_count'] == 3
 
     async def test_all_null_numeric_returns_none(
-        self, parquet_reader, parquet_converter, all_null_dataframe
+        self, summarizer, prewritten_paths
     ):
         """All-null numeric columns return None for min/max/mean/std."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, all_null_dataframe, 'gs-edge-003'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['all_null']
         result = await summarizer.generate_summary(s3_path)
 
         for col_name in ['null_int', 'null_float']:
@@ -844,13 +910,10 @@ class TestGenerateSummary:
             assert stats['std'] is None
 
     async def test_mixed_type_statistics_coverage(
-        self, parquet_reader, parquet_converter, mixed_type_dataframe
+        self, summarizer, prewritten_paths
     ):
         """Mixed-type DataFrame produces correct stat keys per column type."""
-        s3_path = await _save_and_get_path(
-            parquet_converter, mixed_type_dataframe, 'gs-edge-004'
-        )
-        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        s3_path = prewritten_paths['mixed']
         result = await summarizer.generate_summary(s3_path)
 
         stats = result['statistics']
@@ -868,3 +931,95 @@ class TestGenerateSummary:
         assert 'min' in stats['created_at']
         assert 'max' in stats['created_at']
         assert 'null_count' in stats['created_at']
+
+    async def test_concurrent_summaries(
+        self, summarizer, prewritten_paths
+    ):
+        """Concurrent generate_summary() calls on one summarizer stay independent."""
+        keys = list(SHARED_SHAPES)
+
+        results = await asyncio.gather(*(
+            summarizer.generate_summary(prewritten_paths[key]) for key in keys
+        ))
+
+        for key, result in zip(keys, results):
+            assert (result['row_count'], result['column_count']) == SHARED_SHAPES[key]
+
+    async def test_wide_table_statistics_keep_column_order(
+        self, summarizer, parquet_converter
+    ):
+        """Statistics for many columns come back complete and in order."""
+        df = pd.DataFrame({
+            f'c{i:02d}': [i, i + 1] if i % 2 else [f'v{i}', None]
+            for i in range(20)
+        })
+        s3_path = await _save_and_get_path(
+            parquet_converter, df, 'gs-edge-005'
+        )
+        result = await summarizer.generate_summary(s3_path)
+
+        assert list(result['statistics']) == list(df.columns)
+        assert result['statistics']['c01']['max'] == 2
+        assert result['statistics']['c02']['top_values'] == [
+            {'value': 'v2', 'count': 1}
+        ]
+
+    # -----------------------------------------------------------------------
+    # Caching
+    # -----------------------------------------------------------------------
+
+    async def test_repeated_call_served_from_cache(
+        self, parquet_reader, prewritten_paths
+    ):
+        """A second call for an unchanged file does not re-read it."""
+        s3_path = prewritten_paths['sample']
+        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        first = await summarizer.generate_summary(s3_path)
+
+        read_calls = []
+        original_read_preview = parquet_reader.read_preview
+
+        async def spy_read_preview(path, max_rows, columns=None):
+            read_calls.append(path)
+            return await original_read_preview(path, max_rows, columns=columns)
+
+        parquet_reader.read_preview = spy_read_preview
+        second = await summarizer.generate_summary(s3_path)
+
+        assert read_calls == []
+        assert second == first
+        assert second is not first
+
+    async def test_cache_shared_across_instances(
+        self, parquet_reader, prewritten_paths
+    ):
+        """A new summarizer per request still hits the cache."""
+        s3_path = prewritten_paths['sample']
+        first = await DatasetSummarizer(parquet_reader=parquet_reader).generate_summary(
+            s3_path
+        )
+
+        with patch.object(parquet_reader, 'read_preview') as read_preview:
+            second = await DatasetSummarizer(
+                parquet_reader=parquet_reader
+            ).generate_summary(s3_path)
+
+        read_preview.assert_not_called()
+        assert second == first
+
+    async def test_cache_invalidated_when_file_changes(
+        self, parquet_reader, parquet_converter, sample_dataframe
+    ):
+        """Rewriting the file produces a fresh summary."""
+        s3_path = await _save_and_get_path(
+            parquet_converter, sample_dataframe, 'gs-cache-002'
+        )
+        summarizer = DatasetSummarizer(parquet_reader=parquet_reader)
+        await summarizer.generate_summary(s3_path)
+
+        await _save_and_get_path(
+            parquet_converter, sample_dataframe.head(2), 'gs-cache-002'
+        )
+        result = await summarizer.generate_summary(s3_path)
+
+        assert result['row_count'] == 2
@@ -0,0 +1,80 @@
+"""Tests for executor_arrow module."""
+import json
+
+import pandas as pd
+import pyarrow as pa
+
+from app.services import executor_arrow
+
+
+def _read_streams(body: bytes) -> list[pa.Table]:
+    """Split concatenated Arrow IPC streams into tables."""
+    source = pa.BufferReader(body)
+    tables = []
+    while source.tell() < source.size():
+        tables.append(pa.ipc.open_stream(source).read_all())
+    return tables
+
+
+class TestEncodeRequest:
+    """Tests for encode_request."""
+
+    def test_card_dataset_is_single_stream_with_request(self) -> None:
+        # Given: a card dataset and request fields
+        df = pd.DataFrame({"a": [1, 2]})
+
+        # When
+        body = executor_arrow.encode_request({"card_id": "card-1"}, dataset=df)
+
+        # Then: one stream carrying the data and the request metadata
+        tables = _read_streams(body)
+        assert len(tables) == 1
+        assert tables[0].column("a").to_pylist() == [1, 2]
+        request = json.loads(tables[0].schema.metadata[executor_arrow.REQUEST_METADATA_KEY])
+        assert request == {"card_id": "card-1"}
+
+    def test_transform_inputs_are_streams_keyed_by_dataset_id(self) -> None:
+        # Given: two transform inputs
+        datasets = {
+            "ds-1": pd.DataFrame({"a": [1]}),
+            "ds-2": pd.DataFrame({"b": ["x"]}),
+        }
+
+        # When
+        body = executor_arrow.encode_request({"code": "x"}, datasets=datasets)
+
+        # Then: one stream per input; request fields only on the first
+        tables = _read_streams(body)
+        ids = [t.schema.metadata[executor_arrow.DATASET_ID_METADATA_KEY] for t in tables]
+        assert ids == [b"ds-1", b"ds-2"]
+        assert executor_arrow.REQUEST_METADATA_KEY in tables[0].schema.metadata
+        assert executor_arrow.REQUEST_METADATA_KEY not in tables[1].schema.metadata
+
+    def test_no_inputs_sends_empty_stream_with_request(self) -> None:
+        # When
+        body = executor_arrow.encode_request({"code": "x"}, datasets={})
+
+        # Then
+        tables = _read_streams(body)
+        assert len(tables) == 1
+        assert tables[0].num_columns == 0
+        request = json.loads(tables[0].schema.metadata[executor_arrow.REQUEST_METADATA_KEY])
+        assert request == {"code": "x"}
+
+
+class TestDecodeDataframe:
+    """Tests for decode_dataframe."""
+
+    def test_round_trip(self) -> None:
+        # Given
+        df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+        sink = pa.BufferOutputStream()
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+
+        # When
+        result = executor_arrow.decode_dataframe(sink.getvalue().to_pybytes())
+
+        # Then
+        pd.testing.assert_frame_equal(result, df)
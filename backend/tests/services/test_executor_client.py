@@ -1,13 +1,15 @@
 """Tests for executor client retry logic in CardExecutionService."""
+import json
+from contextlib import ExitStack
 from typing import Any
 from unittest.mock import MagicMock, AsyncMock, patch
 
 import httpx
+import pyarrow as pa
 import pytest
 
 from app.services.card_execution_service import (
     CardExecutionService,
-    CardCacheService,
     MAX_RETRIES,
 )
 
@@ -26,209 +28,191 @@ def execution_service(mock_dynamodb: Any) -> CardExecutionService:
     return CardExecutionService(dynamodb=mock_dynamodb)
 
 
+class _StubCacheService:
+    """Stand-in for CardCacheService that never hits the cache."""
+
+    def generate_cache_key(self, *args: Any, **kwargs: Any) -> str:
+        return "testcachekey1234"
+
+    async def get(self, cache_key: str) -> None:
+        return None
+
+    async def set(self, cache_key: str, html: str, dataset_id: str) -> None:
+        return None
+
+
 @pytest.fixture
-def mock_cache_service() -> MagicMock:
-    cache = MagicMock(spec=CardCacheService)
-    cache.get.return_value = None
-    cache.generate_cache_key.return_value = "testcachekey1234"
-    return cache
+def mock_cache_service() -> _StubCacheService:
+    return _StubCacheService()
+
+
+@pytest.fixture(autouse=True)
+def patched_sleep() -> Any:
+    """Skip real backoff delays between retries."""
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
 
 
 def _make_mock_client(responses):
     """Create mock httpx AsyncClient with a sequence of responses/exceptions."""
     mock_client = AsyncMock()
-    mock_client.post = AsyncMock(side_effect=responses)
-    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-    mock_client.__aexit__ = AsyncMock(return_value=None)
+    mock_client.post.side_effect = responses
+    mock_client.__aenter__.return_value = mock_client
     return mock_client
 
 
-class TestExecutorRetryLogic:
-    """Test retry logic in _execute_with_retry."""
+def _make_status_error_response(status_code: int, text: str) -> MagicMock:
+    """Create mock response whose raise_for_status raises HTTPStatusError."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        str(status_code), request=MagicMock(), response=response
+    )
+    return response
 
-    @pytest.mark.asyncio
-    async def test_success_on_first_try(self, execution_service):
-        """成功時はリトライなしで1回で完了"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "html": "<div>OK</div>",
-            "used_columns": [],
-            "filter_applicable": [],
-        }
-        mock_response.raise_for_status = MagicMock()
 
-        mock_client = _make_mock_client([mock_response])
+@pytest.fixture
+def ok_response() -> MagicMock:
+    """Create a successful executor response; tests override json as needed."""
+    response = MagicMock()
+    response.json.return_value = {
+        "html": "<div>OK</div>",
+        "used_columns": [],
+        "filter_applicable": [],
+    }
+    return response
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await execution_service._execute_with_retry(
-                card_id="c1", code="code", filters={}, dataset_id="ds1"
+
+@pytest.fixture
+def httpx_patch() -> Any:
+    """Yield an installer that patches httpx.AsyncClient with a mock client.
+
+    ``install(responses)`` builds the mock client from the given sequence of
+    responses/exceptions and returns it; the patch is undone at teardown.
+    """
+    with ExitStack() as stack:
+        def install(responses) -> AsyncMock:
+            mock_client = _make_mock_client(responses)
+            stack.enter_context(
+                patch("httpx.AsyncClient", return_value=mock_client)
             )
-            assert result["html"] == "<div>OK</div>"
-            assert mock_client.post.call_count == 1
+            return mock_client
 
-    @pytest.mark.asyncio
-    async def test_retry_on_timeout(self, execution_service):
-        """TimeoutExceptionでリトライし、最終的に成功"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "html": "<div>Retry OK</div>",
-            "used_columns": [],
-            "filter_applicable": [],
-        }
-        mock_response.raise_for_status = MagicMock()
+        yield install
 
-        mock_client = _make_mock_client([
-            httpx.TimeoutException("timeout"),
-            mock_response,
-        ])
 
-        with patch("httpx.AsyncClient", return_value=mock_client), \
-             patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await execution_service._execute_with_retry(
-                card_id="c1", code="code", filters={}, dataset_id="ds1"
-            )
-            assert result["html"] == "<div>Retry OK</div>"
-            assert mock_client.post.call_count == 2
+class TestExecutorRetryLogic:
+    """Test retry logic in _execute_with_retry."""
 
     @pytest.mark.asyncio
-    async def test_retry_on_5xx_error(self, execution_service):
-        """5xxエラーでリトライし、最終的に成功"""
-        mock_500_response = MagicMock()
-        mock_500_response.status_code = 500
-        mock_500_response.text = "Internal Server Error"
-        http_error = httpx.HTTPStatusError(
-            "500", request=MagicMock(), response=mock_500_response
-        )
-        mock_500_response.raise_for_status.side_effect = http_error
+    async def test_success_on_first_try(
+        self, execution_service, ok_response, httpx_patch
+    ):
+        """成功時はリトライなしで1回で完了"""
+        mock_client = httpx_patch([ok_response])
 
-        mock_ok_response = MagicMock()
-        mock_ok_response.json.return_value = {
-            "html": "<div>OK after 500</div>",
-            "used_columns": [],
-            "filter_applicable": [],
-        }
-        mock_ok_response.raise_for_status = MagicMock()
+        result = await execution_service._execute_with_retry(
+            card_id="c1", code="code", filters={}, dataset_id="ds1"
+        )
+        assert result["html"] == "<div>OK</div>"
+        assert mock_client.post.call_count == 1
 
-        mock_client = _make_mock_client([mock_500_response, mock_ok_response])
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "failure",
+        [
+            pytest.param(httpx.TimeoutException("timeout"), id="timeout"),
+            pytest.param(
+                _make_status_error_response(500, "Internal Server Error"),
+                id="5xx",
+            ),
+            pytest.param(
+                httpx.ConnectError("connection refused"), id="connect_error"
+            ),
+        ],
+    )
+    async def test_retry_then_success(
+        self, execution_service, ok_response, httpx_patch, failure
+    ):
+        """一時的なエラー(タイムアウト・5xx・接続エラー)でリトライし、最終的に成功"""
+        mock_client = httpx_patch([failure, ok_response])
 
-        with patch("httpx.AsyncClient", return_value=mock_client), \
-             patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await execution_service._execute_with_retry(
-                card_id="c1", code="code", filters={}, dataset_id="ds1"
-            )
-            assert result["html"] == "<div>OK after 500</div>"
+        result = await execution_service._execute_with_retry(
+            card_id="c1", code="code", filters={}, dataset_id="ds1"
+        )
+        assert result["html"] == "<div>OK</div>"
+        assert mock_client.post.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_no_retry_on_4xx_error(self, execution_service):
+    async def test_no_retry_on_4xx_error(self, execution_service, httpx_patch):
         """4xxエラーではリトライせず即座にRuntimeError"""
-        mock_400_response = MagicMock()
-        mock_400_response.status_code = 400
-        mock_400_response.text = "Bad Request"
-        http_error = httpx.HTTPStatusError(
-            "400", request=MagicMock(), response=mock_400_response
+        mock_client = httpx_patch(
+            [_make_status_error_response(400, "Bad Request")]
         )
-        mock_400_response.raise_for_status.side_effect = http_error
-
-        mock_client = _make_mock_client([mock_400_response])
 
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            with pytest.raises(RuntimeError, match="client error"):
-                await execution_service._execute_with_retry(
-                    card_id="c1", code="code", filters={}, dataset_id="ds1"
-                )
-            assert mock_client.post.call_count == 1
+        with pytest.raises(RuntimeError, match="client error"):
+            await execution_service._execute_with_retry(
+                card_id="c1", code="code", filters={}, dataset_id="ds1"
+            )
+        assert mock_client.post.call_count == 1
 
     @pytest.mark.asyncio
-    async def test_exhausted_retries_raises(self, execution_service):
+    async def test_exhausted_retries_raises(self, execution_service, httpx_patch):
         """MAX_RETRIES回全て失敗するとRuntimeError"""
-        mock_client = _make_mock_client(
+        mock_client = httpx_patch(
             [httpx.TimeoutException("timeout")] * MAX_RETRIES
         )
 
-        with patch("httpx.AsyncClient", return_value=mock_client), \
-             patch("asyncio.sleep", new_callable=AsyncMock):
-            with pytest.raises(RuntimeError, match=f"after {MAX_RETRIES} attempts"):
-                await execution_service._execute_with_retry(
-                    card_id="c1", code="code", filters={}, dataset_id="ds1"
-                )
-            assert mock_client.post.call_count == MAX_RETRIES
+        with pytest.raises(RuntimeError, match=f"after {MAX_RETRIES} attempts"):
+            await execution_service._execute_with_retry(
+                card_id="c1", code="code", filters={}, dataset_id="ds1"
+            )
+        assert mock_client.post.call_count == MAX_RETRIES
 
     @pytest.mark.asyncio
-    async def test_sends_code_field(self, execution_service):
+    async def test_sends_code_field(
+        self, execution_service, ok_response, httpx_patch
+    ):
         """リクエストにcodeフィールドが含まれる"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "html": "<div>OK</div>",
-            "used_columns": [],
-            "filter_applicable": [],
-        }
-        mock_response.raise_for_status = MagicMock()
+        mock_client = httpx_patch([ok_response])
 
-        mock_client = _make_mock_client([mock_response])
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            await execution_service._execute_with_retry(
-                card_id="c1",
-                code="def render(d,f,p): return '<div></div>'",
-                filters={"cat": "A"},
-                dataset_id="ds1",
-            )
+        await execution_service._execute_with_retry(
+            card_id="c1",
+            code="def render(d,f,p): return '<div></div>'",
+            filters={"cat": "A"},
+            dataset_id="ds1",
+        )
 
-            call_args = mock_client.post.call_args
-            sent_json = call_args[1]["json"]
-            assert "code" in sent_json
-            assert sent_json["code"] == "def render(d,f,p): return '<div></div>'"
-            assert sent_json["card_id"] == "c1"
-            assert sent_json["dataset_id"] == "ds1"
-            assert sent_json["filters"] == {"cat": "A"}
+        call_args = mock_client.post.call_args
+        stream = pa.ipc.open_stream(pa.BufferReader(call_args[1]["content"]))
+        sent_json = json.loads(stream.schema.metadata[b"request"])
+        assert "code" in sent_json
+        assert sent_json["code"] == "def render(d,f,p): return '<div></div>'"
+        assert sent_json["card_id"] == "c1"
+        assert sent_json["dataset_id"] == "ds1"
+        assert sent_json["filters"] == {"cat": "A"}
 
     @pytest.mark.asyncio
     async def test_execute_with_code_parameter(
-        self, execution_service, mock_cache_service
+        self, execution_service, mock_cache_service, ok_response, httpx_patch
     ):
         """execute() にcode引数を渡すと_execute_with_retryに渡される"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
+        ok_response.json.return_value = {
             "html": "<div>Code OK</div>",
             "used_columns": ["col1"],
             "filter_applicable": False,
         }
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = _make_mock_client([mock_response])
-
-        with patch("httpx.AsyncClient", return_value=mock_client):
-            result = await execution_service.execute(
-                card_id="c1",
-                filters={},
-                dataset_updated_at="2024-01-01",
-                dataset_id="ds1",
-                use_cache=False,
-                cache_service=mock_cache_service,
-                code="def render(d,f,p): return '<div>Code OK</div>'",
-            )
-            assert result.html == "<div>Code OK</div>"
-            assert result.cached is False
-
-    @pytest.mark.asyncio
-    async def test_retry_on_connect_error(self, execution_service):
-        """ConnectErrorでリトライ"""
-        mock_response = MagicMock()
-        mock_response.json.return_value = {
-            "html": "<div>Connected</div>",
-            "used_columns": [],
-            "filter_applicable": [],
-        }
-        mock_response.raise_for_status = MagicMock()
-
-        mock_client = _make_mock_client([
-            httpx.ConnectError("connection refused"),
-            mock_response,
-        ])
-
-        with patch("httpx.AsyncClient", return_value=mock_client), \
-             patch("asyncio.sleep", new_callable=AsyncMock):
-            result = await execution_service._execute_with_retry(
-                card_id="c1", code="code", filters={}, dataset_id="ds1"
-            )
-            assert result["html"] == "<div>Connected</div>"
+        httpx_patch([ok_response])
+
+        result = await execution_service.execute(
+            card_id="c1",
+            filters={},
+            dataset_updated_at="2024-01-01",
+            dataset_id="ds1",
+            use_cache=False,
+            cache_service=mock_cache_service,
+            code="def render(d,f,p): return '<div>Code OK</div>'",
+        )
+        assert result.html == "<div>Code OK</div>"
+        assert result.cached is False
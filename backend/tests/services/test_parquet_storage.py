@@ -1,36 +1,72 @@
 """Tests for Parquet Storage Service."""
+import asyncio
 import io
+import threading
+import uuid
+from unittest.mock import patch
 import pytest
 import pandas as pd
 import pyarrow.parquet as pq
 from moto import mock_aws
 import boto3
-from dataclasses import asdict
+from dataclasses import FrozenInstanceError, asdict
 
 from app.core.config import settings
 from app.services.parquet_storage import (
+    PARQUET_ROW_GROUP_SIZE,
     ParquetConverter,
     ParquetReader,
     StorageResult,
 )
 from app.exceptions import DatasetFileNotFoundError
 
+BUCKET = settings.s3_bucket_datasets
+REGION = settings.s3_region
 
-@pytest.fixture
+
+@pytest.fixture(scope="module")
 def s3_client():
-    """Create mock S3 client."""
+    """Create mock S3 client with a test bucket, shared by the module.
+
+    Every test writes under its own dataset_id prefix (see the dataset_id
+    fixture), so sharing is safe.
+    """
     with mock_aws():
-        s3 = boto3.client('s3', region_name=settings.s3_region)
+        s3 = boto3.client('s3', region_name=REGION)
         s3.create_bucket(
-            Bucket=settings.s3_bucket_datasets,
-            CreateBucketConfiguration={'LocationConstraint': settings.s3_region}
+            Bucket=BUCKET,
+            CreateBucketConfiguration={'LocationConstraint': REGION}
         )
         yield s3
 
 
 @pytest.fixture
+def dataset_id(request):
+    """Create a dataset id unique to the requesting test."""
+    return f"ds-{request.node.name}-{uuid.uuid4().hex[:8]}"
+
+
+@pytest.fixture(scope="module")
+def converter(s3_client):
+    """Create a ParquetConverter shared by the module."""
+    return ParquetConverter(s3_client, BUCKET)
+
+
+@pytest.fixture(scope="module")
+def reader(s3_client):
+    """Create a ParquetReader shared by the module.
+
+    Tests that replace reader methods with spies build their own.
+    """
+    return ParquetReader(s3_client, BUCKET)
+
+
+@pytest.fixture(scope="module")
 def sample_dataframe():
-    """Create sample DataFrame with various data types."""
+    """Create sample DataFrame with various data types.
+
+    Shared by the module; tests must treat it as read-only.
+    """
     return pd.DataFrame({
         'id': [1, 2, 3, 4, 5],
         'name': ['Alice', 'Bob', 'Charlie', 'David', 'Eve'],
@@ -40,9 +76,9 @@ def sample_dataframe():
     })
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def empty_dataframe():
-    """Create empty DataFrame."""
+    """Create empty DataFrame, shared by the module."""
     return pd.DataFrame({
         'id': pd.Series([], dtype='int64'),
         'name': pd.Series([], dtype='str'),
@@ -62,7 +98,7 @@ class TestStorageResult:
             partitions=[]
         )
 
-        with pytest.raises(Exception):
+        with pytest.raises(FrozenInstanceError):
             result.s3_path = 'new_path'
 
     def test_storage_result_to_dict(self):
@@ -85,13 +121,13 @@ class TestStorageResult:
 class TestParquetConverter:
     """Test ParquetConverter class."""
 
-    async def test_convert_and_save_non_partitioned(self, s3_client, sample_dataframe):
+    async def test_convert_and_save_non_partitioned(
+        self, converter, s3_client, sample_dataframe, dataset_id
+    ):
         """Test converting and saving DataFrame without partitioning."""
         # Given: a sample DataFrame and dataset id
         # When: converting and saving without partitioning
         # Then: storage result and S3 object are created
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-001'
 
         result = await converter.convert_and_save(
             df=sample_dataframe,
@@ -106,19 +142,19 @@ class TestParquetConverter:
 
         # Verify file exists in S3
         response = s3_client.list_objects_v2(
-            Bucket=settings.s3_bucket_datasets,
+            Bucket=BUCKET,
             Prefix=f'datasets/{dataset_id}/data/'
         )
         assert 'Contents' in response
         assert len(response['Contents']) == 1
 
-    async def test_convert_and_save_partitioned(self, s3_client, sample_dataframe):
+    async def test_convert_and_save_partitioned(
+        self, converter, s3_client, sample_dataframe, dataset_id
+    ):
         """Test converting and saving DataFrame with partitioning."""
         # Given: a sample DataFrame with partition column
         # When: converting and saving with partitioning
-        # Then: storage result shows partitions and S3 objects exist
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-002'
+        # Then: storage result shows partitions and keys carry partition values
 
         result = await converter.convert_and_save(
             df=sample_dataframe,
@@ -133,19 +169,60 @@ class TestParquetConverter:
 
         # Verify partition files exist in S3
         response = s3_client.list_objects_v2(
-            Bucket=settings.s3_bucket_datasets,
+            Bucket=BUCKET,
             Prefix=f'datasets/{dataset_id}/partitions/'
         )
         assert 'Contents' in response
         assert len(response['Contents']) == 3  # 3 departments
 
-    async def test_s3_path_format_non_partitioned(self, s3_client, sample_dataframe):
+        # Verify partition paths contain department values
+        keys = [obj['Key'] for obj in response['Contents']]
+        assert any('department=Sales' in key for key in keys)
+        assert any('department=Engineering' in key for key in keys)
+        assert any('department=HR' in key for key in keys)
+
+    async def test_partition_saves_are_bounded_and_cancelled_on_failure(
+        self, s3_client, dataset_id
+    ):
+        """Test partitions are saved a few at a time and a failure stops the rest."""
+        # Given: ten partitions, a concurrency of 2, and an upload that fails
+        # When: saving with partitioning
+        # Then: no more than 2 uploads overlap and the unstarted ones never run
+        df = pd.DataFrame({'part': [f'p{i}' for i in range(10)], 'v': range(10)})
+        converter = ParquetConverter(s3_client, BUCKET)
+        in_flight = 0
+        max_in_flight = 0
+        started = []
+
+        async def fake_upload(s3_path, parquet_bytes):
+            nonlocal in_flight, max_in_flight
+            started.append(s3_path)
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if 'part=p1/' in s3_path:
+                    raise RuntimeError('upload failed')
+            finally:
+                in_flight -= 1
+
+        with patch('app.services.parquet_storage.PARTITION_SAVE_CONCURRENCY', 2), \
+             patch.object(converter, '_upload_to_s3', side_effect=fake_upload):
+            with pytest.raises(RuntimeError, match='upload failed'):
+                await converter.convert_and_save(
+                    df=df, dataset_id=dataset_id, partition_column='part'
+                )
+
+        assert max_in_flight == 2
+        assert len(started) < 10
+
+    async def test_s3_path_format_non_partitioned(
+        self, converter, sample_dataframe, dataset_id
+    ):
         """Test S3 path format for non-partitioned data."""
         # Given: a sample DataFrame and dataset id
         # When: saving without partitioning
         # Then: S3 path matches expected format
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-003'
 
         result = await converter.convert_and_save(
             df=sample_dataframe,
@@ -156,65 +233,83 @@ class TestParquetConverter:
         expected_path = f'datasets/{dataset_id}/data/part-0000.parquet'
         assert result.s3_path == expected_path
 
-    async def test_s3_path_format_partitioned(self, s3_client, sample_dataframe):
-        """Test S3 path format for partitioned data."""
-        # Given: a sample DataFrame with partition column
-        # When: saving with partitioning
-        # Then: partitioned keys contain expected values
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-004'
+    async def test_compression_zstd(
+        self, converter, s3_client, sample_dataframe, dataset_id
+    ):
+        """Test that files are compressed with zstd by default."""
+        # Given: a sample DataFrame and dataset id
+        # When: saving to S3 as Parquet
+        # Then: Parquet compression is zstd
 
         await converter.convert_and_save(
             df=sample_dataframe,
             dataset_id=dataset_id,
-            partition_column='department'
+            partition_column=None
         )
 
-        # Check that partition paths contain department values
-        response = s3_client.list_objects_v2(
-            Bucket=settings.s3_bucket_datasets,
-            Prefix=f'datasets/{dataset_id}/partitions/'
+        # Read file from S3 and check compression
+        s3_key = f'datasets/{dataset_id}/data/part-0000.parquet'
+        response = s3_client.get_object(
+            Bucket=BUCKET,
+            Key=s3_key
         )
+        parquet_data = response['Body'].read()
 
-        keys = [obj['Key'] for obj in response['Contents']]
-        assert any('department=Sales' in key for key in keys)
-        assert any('department=Engineering' in key for key in keys)
-        assert any('department=HR' in key for key in keys)
+        # Read parquet footer metadata only
+        metadata = pq.read_metadata(io.BytesIO(parquet_data))
+        assert metadata.row_group(0).column(0).compression == 'ZSTD'
 
-    async def test_compression_snappy(self, s3_client, sample_dataframe):
-        """Test that files are compressed with snappy."""
-        # Given: a sample DataFrame and dataset id
+    async def test_compression_from_settings(
+        self, converter, s3_client, sample_dataframe, dataset_id
+    ):
+        """Test that the codec follows dataset_parquet_compression."""
+        # Given: compression configured as snappy (no level support)
+        # When: saving to S3 as Parquet
+        # Then: Parquet compression is snappy and the level is ignored
+        with patch.object(settings, 'dataset_parquet_compression', 'snappy'):
+            await converter.convert_and_save(
+                df=sample_dataframe,
+                dataset_id=dataset_id,
+                partition_column=None
+            )
+
+        response = s3_client.get_object(
+            Bucket=BUCKET,
+            Key=f'datasets/{dataset_id}/data/part-0000.parquet'
+        )
+        metadata = pq.read_metadata(io.BytesIO(response['Body'].read()))
+        assert metadata.row_group(0).column(0).compression == 'SNAPPY'
+
+    async def test_row_group_size(self, converter, s3_client, dataset_id):
+        """Test that large frames are split into bounded row groups."""
+        # Given: a DataFrame larger than one row group
         # When: saving to S3 as Parquet
-        # Then: Parquet compression is snappy
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-005'
+        # Then: rows are split into row groups with statistics
+        df = pd.DataFrame({'value': range(PARQUET_ROW_GROUP_SIZE + 10)})
 
         await converter.convert_and_save(
-            df=sample_dataframe,
+            df=df,
             dataset_id=dataset_id,
             partition_column=None
         )
 
-        # Read file from S3 and check compression
         s3_key = f'datasets/{dataset_id}/data/part-0000.parquet'
         response = s3_client.get_object(
-            Bucket=settings.s3_bucket_datasets,
+            Bucket=BUCKET,
             Key=s3_key
         )
-        parquet_data = response['Body'].read()
+        metadata = pq.read_metadata(io.BytesIO(response['Body'].read()))
+        assert metadata.num_row_groups == 2
+        assert metadata.row_group(0).num_rows == PARQUET_ROW_GROUP_SIZE
+        assert metadata.row_group(0).column(0).is_stats_set
 
-        # Read parquet metadata
-        parquet_file = pq.ParquetFile(io.BytesIO(parquet_data))
-        metadata = parquet_file.metadata
-        assert metadata.row_group(0).column(0).compression == 'SNAPPY'
-
-    async def test_empty_dataframe(self, s3_client, empty_dataframe):
+    async def test_empty_dataframe(
+        self, converter, s3_client, empty_dataframe, dataset_id
+    ):
         """Test handling of empty DataFrame."""
         # Given: an empty DataFrame and dataset id
         # When: saving to S3 as Parquet
         # Then: storage result exists and object is created
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-006'
 
         result = await converter.convert_and_save(
             df=empty_dataframe,
@@ -227,18 +322,18 @@ class TestParquetConverter:
 
         # Verify file exists
         response = s3_client.head_object(
-            Bucket=settings.s3_bucket_datasets,
+            Bucket=BUCKET,
             Key=result.s3_path
         )
         assert response['ResponseMetadata']['HTTPStatusCode'] == 200
 
-    async def test_data_type_preservation(self, s3_client, sample_dataframe):
+    async def test_data_type_preservation(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
         """Test that data types are preserved correctly."""
         # Given: a sample DataFrame with multiple dtypes
         # When: saving and reading back from S3
         # Then: column dtypes are preserved
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-007'
 
         await converter.convert_and_save(
             df=sample_dataframe,
@@ -247,7 +342,6 @@ class TestParquetConverter:
         )
 
         # Read back and verify types
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
         s3_path = f'datasets/{dataset_id}/data/part-0000.parquet'
         df_read = await reader.read_full(s3_path)
 
@@ -261,14 +355,14 @@ class TestParquetConverter:
 class TestParquetReader:
     """Test ParquetReader class."""
 
-    async def test_read_full_non_partitioned(self, s3_client, sample_dataframe):
+    async def test_read_full_non_partitioned(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
         """Test reading full non-partitioned dataset."""
         # Given: a saved non-partitioned dataset in S3
         # When: reading full dataset from S3
         # Then: DataFrame matches the original
         # First save data
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-008'
         result = await converter.convert_and_save(
             df=sample_dataframe,
             dataset_id=dataset_id,
@@ -276,19 +370,18 @@ class TestParquetReader:
         )
 
         # Read back
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
         df_read = await reader.read_full(result.s3_path)
 
         pd.testing.assert_frame_equal(df_read, sample_dataframe)
 
-    async def test_read_full_partitioned(self, s3_client, sample_dataframe):
+    async def test_read_full_partitioned(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
         """Test reading full partitioned dataset."""
         # Given: a saved partitioned dataset in S3
         # When: reading full dataset from base path
         # Then: DataFrame matches the original after sorting
         # First save data
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-009'
         await converter.convert_and_save(
             df=sample_dataframe,
             dataset_id=dataset_id,
@@ -296,7 +389,6 @@ class TestParquetReader:
         )
 
         # Read back
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
         # For partitioned data, read_full should handle the base path
         base_path = f'datasets/{dataset_id}/partitions/'
         df_read = await reader.read_full(base_path)
@@ -307,14 +399,14 @@ class TestParquetReader:
 
         pd.testing.assert_frame_equal(df_read_sorted, df_expected_sorted)
 
-    async def test_read_preview_limits_rows(self, s3_client, sample_dataframe):
+    async def test_read_preview_limits_rows(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
         """Test read_preview returns limited rows."""
         # Given: a saved dataset in S3
         # When: reading a preview with max_rows=3
         # Then: preview contains only 3 rows
         # First save data
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-010'
         result = await converter.convert_and_save(
             df=sample_dataframe,
             dataset_id=dataset_id,
@@ -322,7 +414,6 @@ class TestParquetReader:
         )
 
         # Read preview
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
         df_preview = await reader.read_preview(result.s3_path, max_rows=3)
 
         assert len(df_preview) == 3
@@ -331,14 +422,14 @@ class TestParquetReader:
             sample_dataframe.head(3)
         )
 
-    async def test_read_preview_max_rows_exceeds_total(self, s3_client, sample_dataframe):
+    async def test_read_preview_max_rows_exceeds_total(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
         """Test read_preview when max_rows exceeds total rows."""
         # Given: a saved dataset in S3
         # When: reading a preview with large max_rows
         # Then: preview returns all rows
         # First save data
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-011'
         result = await converter.convert_and_save(
             df=sample_dataframe,
             dataset_id=dataset_id,
@@ -346,20 +437,73 @@ class TestParquetReader:
         )
 
         # Read preview with large max_rows
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
         df_preview = await reader.read_preview(result.s3_path, max_rows=1000)
 
         assert len(df_preview) == len(sample_dataframe)
         pd.testing.assert_frame_equal(df_preview, sample_dataframe)
 
-    async def test_roundtrip_preserves_data(self, s3_client, sample_dataframe):
+    async def test_read_preview_partitioned_stops_after_max_rows(
+        self, converter, s3_client, sample_dataframe, dataset_id
+    ):
+        """Test read_preview on a partitioned path only reads needed partitions."""
+        # Given: a saved partitioned dataset in S3
+        # When: reading a preview smaller than the first partition
+        # Then: preview rows come from the first partition and later ones are skipped
+        await converter.convert_and_save(
+            df=sample_dataframe,
+            dataset_id=dataset_id,
+            partition_column='department'
+        )
+
+        reader = ParquetReader(s3_client, BUCKET)
+        base_path = f'datasets/{dataset_id}/partitions/'
+        parsed_keys = []
+        original_parse = reader._parse_parquet
+
+        def spy_parse(s3_path, parquet_data, **kwargs):
+            parsed_keys.append(s3_path)
+            return original_parse(s3_path, parquet_data, **kwargs)
+
+        reader._parse_parquet = spy_parse
+        df_preview = await reader.read_preview(base_path, max_rows=1)
+
+        assert len(df_preview) == 1
+        assert len(parsed_keys) == 1
+
+    async def test_read_full_partitioned_parses_off_event_loop(
+        self, converter, s3_client, sample_dataframe, dataset_id
+    ):
+        """Test partition files are parsed outside the event loop thread."""
+        # Given: a saved partitioned dataset in S3
+        # When: reading it in full
+        # Then: every partition is parsed on a worker thread
+        await converter.convert_and_save(
+            df=sample_dataframe,
+            dataset_id=dataset_id,
+            partition_column='department'
+        )
+
+        reader = ParquetReader(s3_client, BUCKET)
+        parse_threads = []
+        original_parse = reader._parse_parquet
+
+        def spy_parse(s3_path, parquet_data, **kwargs):
+            parse_threads.append(threading.get_ident())
+            return original_parse(s3_path, parquet_data, **kwargs)
+
+        reader._parse_parquet = spy_parse
+        await reader.read_full(f'datasets/{dataset_id}/partitions/')
+
+        assert len(parse_threads) == 3
+        assert threading.get_ident() not in parse_threads
+
+    async def test_roundtrip_preserves_data(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
         """Test complete roundtrip: convert, save, read back."""
         # Given: a sample DataFrame and empty S3 keyspace
         # When: saving and reading full/preview data
         # Then: read results match the original data
-        converter = ParquetConverter(s3_client, settings.s3_bucket_datasets)
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
-        dataset_id = 'test-dataset-012'
 
         # Save
         result = await converter.convert_and_save(
@@ -379,16 +523,59 @@ class TestParquetReader:
             sample_dataframe.head(2)
         )
 
+    async def test_read_preview_decodes_leading_row_groups_only(
+        self, converter, reader, dataset_id
+    ):
+        """Test that a preview decodes only the row groups it needs."""
+        # Given: a saved file with two row groups
+        # When: reading a preview smaller than the first row group
+        # Then: only the first row group is decoded
+        df = pd.DataFrame({'value': range(PARQUET_ROW_GROUP_SIZE + 10)})
+        result = await converter.convert_and_save(
+            df=df,
+            dataset_id=dataset_id,
+            partition_column=None
+        )
+
+        read_groups = []
+        original_read_row_groups = pq.ParquetFile.read_row_groups
+
+        def spy_read_row_groups(self, row_groups, *args, **kwargs):
+            read_groups.append(list(row_groups))
+            return original_read_row_groups(self, row_groups, *args, **kwargs)
+
+        with patch.object(pq.ParquetFile, 'read_row_groups', spy_read_row_groups):
+            df_preview = await reader.read_preview(result.s3_path, max_rows=5)
+
+        assert df_preview['value'].tolist() == [0, 1, 2, 3, 4]
+        assert read_groups == [[0]]
+
+    async def test_get_etag(
+        self, converter, reader, sample_dataframe, dataset_id
+    ):
+        """Test get_etag returns the object ETag, or None for directories."""
+        # Given: a saved single-file dataset
+        # When: fetching its ETag and that of a directory path
+        # Then: the file has an ETag and the directory has none
+
+        result = await converter.convert_and_save(
+            df=sample_dataframe,
+            dataset_id=dataset_id,
+            partition_column=None
+        )
+
+        assert await reader.get_etag(result.s3_path)
+        assert await reader.get_etag(f'datasets/{dataset_id}/') is None
+
 
 @pytest.mark.asyncio
 class TestParquetReaderFileNotFound:
     """Test ParquetReader raises DatasetFileNotFoundError for missing S3 keys."""
 
     async def test_no_such_key_error_is_converted_to_dataset_file_not_found_error(
-        self, s3_client
+        self, reader
     ):
         """S3 NoSuchKey ClientError is converted to DatasetFileNotFoundError."""
-        reader = ParquetReader(s3_client, settings.s3_bucket_datasets)
         missing_key = "datasets/missing-id-123/data/part-0000.parquet"
 
         with pytest.raises(DatasetFileNotFoundError) as exc_info:
@@ -399,3 +586,10 @@ class TestParquetReaderFileNotFound:
         assert error.s3_path == missing_key
         assert error.dataset_id is None
         assert missing_key in str(error)
+
+    async def test_get_etag_missing_key_raises(self, reader):
+        """get_etag converts a missing key to DatasetFileNotFoundError."""
+        missing_key = "datasets/missing-id-123/data/part-0000.parquet"
+
+        with pytest.raises(DatasetFileNotFoundError):
+            await reader.get_etag(missing_key)
@@ -1,9 +1,67 @@
 """Tests for DatasetService.import_s3_csv method."""
+import asyncio
+from typing import Any
+
 import pytest
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import MagicMock, patch
 from botocore.exceptions import ClientError
 
-from app.services.dataset_service import DatasetService
+from app.services.dataset_service import DatasetService, S3_FETCH_PART_SIZE
+
+CSV_BYTES = b"col1,col2\nval1,val2\nval3,val4"
+TSV_BYTES = b"col1\tcol2\nval1\tval2"
+
+
+@pytest.fixture(scope="module")
+def event_loop():
+    """Run every test in this module on one event loop.
+
+    Overrides pytest-asyncio's per-test loop; the fakes below hold no
+    loop-bound state, so nothing leaks between tests.
+    """
+    loop = asyncio.get_event_loop_policy().new_event_loop()
+    yield loop
+    loop.close()
+
+
+class _FakeS3Body:
+    """Async streaming body returning fixed bytes."""
+
+    def __init__(self, data: bytes) -> None:
+        self._data = data
+
+    async def read(self) -> bytes:
+        return self._data
+
+
+class _FakeS3Client:
+    """Async source S3 client serving one object, honouring Range like S3.
+
+    The kwargs of every get_object call are recorded in ``calls``. An empty
+    object is rejected with InvalidRange, as S3 does for any range on it;
+    ``error`` is raised instead of serving the object when given.
+    """
+
+    def __init__(self, data: bytes = b"", error: Exception | None = None) -> None:
+        self._data = data
+        self._error = error
+        self.calls: list[dict[str, Any]] = []
+
+    async def get_object(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls.append(kwargs)
+        if self._error is not None:
+            raise self._error
+        if not self._data:
+            error_response = {"Error": {"Code": "InvalidRange", "Message": "Range Not Satisfiable"}}
+            raise ClientError(error_response, "GetObject")
+
+        start, end = map(int, kwargs["Range"].removeprefix("bytes=").split("-"))
+        end = min(end, len(self._data) - 1)
+        return {
+            "Body": _FakeS3Body(self._data[start:end + 1]),
+            "ContentRange": f"bytes {start}-{end}/{len(self._data)}",
+            "ETag": '"etag-1"',
+        }
 
 
 class TestImportS3Csv:
@@ -15,22 +73,20 @@ class TestImportS3Csv:
 
     @pytest.fixture
     def mock_s3_client(self):
-        """Create a mock S3 client that returns CSV data."""
-        client = AsyncMock()
-        # Mock the get_object response
-        body_mock = AsyncMock()
-        body_mock.read = AsyncMock(return_value=b"col1,col2\nval1,val2\nval3,val4")
-        response = {"Body": body_mock}
-        client.get_object = AsyncMock(return_value=response)
-        return client
+        """Create a fake S3 client that returns CSV data."""
+        return _FakeS3Client(CSV_BYTES)
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_dynamodb(self):
         return MagicMock()
 
-    @pytest.fixture
+    @pytest.fixture(scope="class")
     def mock_storage_s3_client(self):
-        """S3 client for Parquet storage (separate from source S3)."""
+        """S3 client for Parquet storage (separate from source S3).
+
+        Shared by the class: tests patch out the storage calls and never
+        configure or inspect this client.
+        """
         return MagicMock()
 
     @pytest.mark.asyncio
@@ -52,18 +108,17 @@ class TestImportS3Csv:
             )
 
             # Verify S3 was called to get the object
-            mock_s3_client.get_object.assert_called_once_with(
-                Bucket="source-bucket", Key="data/file.csv"
-            )
+            assert mock_s3_client.calls == [{
+                "Bucket": "source-bucket",
+                "Key": "data/file.csv",
+                "Range": f"bytes=0-{S3_FETCH_PART_SIZE - 1}",
+            }]
             assert result is not None
 
     @pytest.mark.asyncio
     async def test_import_s3_csv_empty_file(self, service, mock_dynamodb, mock_storage_s3_client):
-        """Test import fails for empty CSV file."""
-        client = AsyncMock()
-        body_mock = AsyncMock()
-        body_mock.read = AsyncMock(return_value=b"")
-        client.get_object = AsyncMock(return_value={"Body": body_mock})
+        """Test import fails for empty CSV file (S3 rejects the range)."""
+        client = _FakeS3Client(b"")
 
         with pytest.raises(ValueError, match="empty"):
             await service.import_s3_csv(
@@ -79,11 +134,8 @@ class TestImportS3Csv:
     @pytest.mark.asyncio
     async def test_import_s3_csv_key_not_found(self, service, mock_dynamodb, mock_storage_s3_client):
         """Test import fails when S3 key doesn't exist."""
-        client = AsyncMock()
         error_response = {"Error": {"Code": "NoSuchKey", "Message": "Not found"}}
-        client.get_object = AsyncMock(
-            side_effect=ClientError(error_response, "GetObject")
-        )
+        client = _FakeS3Client(error=ClientError(error_response, "GetObject"))
 
         with pytest.raises(ValueError, match="S3"):
             await service.import_s3_csv(
@@ -138,10 +190,7 @@ class TestImportS3Csv:
     @pytest.mark.asyncio
     async def test_import_s3_csv_with_options(self, service, mock_dynamodb, mock_storage_s3_client):
         """Test import with custom delimiter and encoding."""
-        client = AsyncMock()
-        body_mock = AsyncMock()
-        body_mock.read = AsyncMock(return_value=b"col1\tcol2\nval1\tval2")
-        client.get_object = AsyncMock(return_value={"Body": body_mock})
+        client = _FakeS3Client(TSV_BYTES)
 
         with patch.object(service, '_save_to_s3') as mock_save, \
              patch.object(service, '_save_metadata') as mock_save_meta:
@@ -161,3 +210,176 @@ class TestImportS3Csv:
             )
 
             assert mock_save.called
+
+    @pytest.mark.asyncio
+    async def test_import_s3_csv_records_detected_delimiter(
+        self, service, mock_dynamodb, mock_storage_s3_client
+    ):
+        """Test an auto-detected delimiter is stored in source_config for reimports."""
+        client = _FakeS3Client(TSV_BYTES)
+
+        with patch.object(service, '_save_to_s3') as mock_save, \
+             patch.object(service, '_save_metadata') as mock_save_meta:
+            mock_save.return_value = MagicMock(s3_path="datasets/ds_test123/data.parquet")
+            mock_save_meta.return_value = MagicMock()
+
+            await service.import_s3_csv(
+                name="tsv-dataset",
+                s3_bucket="bucket",
+                s3_key="data.tsv",
+                owner_id="user_123",
+                dynamodb=mock_dynamodb,
+                s3_client=mock_storage_s3_client,
+                source_s3_client=client,
+                delimiter=None,
+            )
+
+            source_config = mock_save_meta.call_args[1]['source_config']
+            assert source_config == {
+                's3_bucket': 'bucket',
+                's3_key': 'data.tsv',
+                'delimiter': '\t',
+            }
+            assert list(mock_save.call_args[0][0].columns) == ['col1', 'col2']
+
+    @pytest.mark.asyncio
+    async def test_import_s3_csv_fetches_large_file_in_ranges(
+        self, service, mock_dynamodb, mock_storage_s3_client
+    ):
+        """Test a file larger than one part is fetched with parallel ranged GETs."""
+        csv_bytes = b"col1,col2\n" + b"".join(
+            f"val{i},{i}\n".encode() for i in range(20)
+        )
+        client = _FakeS3Client(csv_bytes)
+
+        with patch("app.services.dataset_service.S3_FETCH_PART_SIZE", 64), \
+             patch.object(service, '_save_to_s3') as mock_save, \
+             patch.object(service, '_save_metadata') as mock_save_meta:
+            mock_save.return_value = MagicMock(s3_path="datasets/ds_test123/data.parquet")
+            mock_save_meta.return_value = MagicMock()
+
+            await service.import_s3_csv(
+                name="large-dataset",
+                s3_bucket="bucket",
+                s3_key="large.csv",
+                owner_id="user_123",
+                dynamodb=mock_dynamodb,
+                s3_client=mock_storage_s3_client,
+                source_s3_client=client,
+            )
+
+            saved_df = mock_save.call_args[0][0]
+            assert len(saved_df) == 20
+            assert saved_df["col2"].tolist() == list(range(20))
+            assert len(client.calls) == -(-len(csv_bytes) // 64)
+            assert all(c["IfMatch"] == '"etag-1"' for c in client.calls[1:])
+
+    @pytest.mark.asyncio
+    async def test_fetch_s3_csv_writes_parts_into_one_buffer(self, service):
+        """Test ranged parts are assembled in place and short parts are rejected."""
+        csv_bytes = b"".join(f"row{i}\n".encode() for i in range(40))
+        client = _FakeS3Client(csv_bytes)
+
+        with patch("app.services.dataset_service.S3_FETCH_PART_SIZE", 64):
+            result = await service._fetch_s3_csv(client, "bucket", "large.csv")
+
+            assert isinstance(result, bytearray)
+            assert result == csv_bytes
+
+            get_object = client.get_object
+
+            async def truncating_get_object(**kwargs):
+                response = await get_object(**kwargs)
+                if kwargs["Range"] != "bytes=0-63":
+                    response["Body"] = _FakeS3Body(b"x")
+                return response
+
+            client.get_object = truncating_get_object
+            with pytest.raises(ValueError, match="short read"):
+                await service._fetch_s3_csv(client, "bucket", "large.csv")
+
+    @pytest.mark.asyncio
+    async def test_import_s3_csv_many_fetches_concurrently(
+        self, service, mock_dynamodb, mock_storage_s3_client
+    ):
+        """Test several keys are fetched concurrently and imported in order."""
+        client = _FakeS3Client(CSV_BYTES)
+        in_flight = 0
+        max_in_flight = 0
+        get_object = client.get_object
+
+        async def overlapping_get_object(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            await asyncio.sleep(0)
+            in_flight -= 1
+            return await get_object(**kwargs)
+
+        client.get_object = overlapping_get_object
+        keys = [f"data/file{i}.csv" for i in range(5)]
+
+        with patch.object(service, '_save_to_s3') as mock_save, \
+             patch.object(service, '_save_metadata') as mock_save_meta:
+            mock_save.return_value = MagicMock(s3_path="datasets/ds_test123/data.parquet")
+            mock_save_meta.side_effect = lambda **kwargs: kwargs["source_config"]["s3_key"]
+
+            result = await service.import_s3_csv_many(
+                sources=[(f"dataset-{i}", key) for i, key in enumerate(keys)],
+                s3_bucket="source-bucket",
+                owner_id="user_123",
+                dynamodb=mock_dynamodb,
+                s3_client=mock_storage_s3_client,
+                source_s3_client=client,
+            )
+
+        assert [r.key for r in result] == keys
+        assert [r.dataset for r in result] == keys
+        assert sorted(c["Key"] for c in client.calls) == keys
+        assert max_in_flight == len(keys)
+
+    @pytest.mark.asyncio
+    async def test_import_s3_csv_many_bounds_and_reports_each_source(
+        self, service, mock_dynamodb, mock_storage_s3_client
+    ):
+        """Test at most `concurrency` sources are in flight and failures are per source."""
+        client = _FakeS3Client(CSV_BYTES)
+        in_flight = 0
+        max_in_flight = 0
+        get_object = client.get_object
+
+        async def slow_get_object(**kwargs):
+            nonlocal in_flight, max_in_flight
+            in_flight += 1
+            max_in_flight = max(max_in_flight, in_flight)
+            try:
+                await asyncio.sleep(0.01)
+                if kwargs["Key"] == "data/missing.csv":
+                    error_response = {"Error": {"Code": "NoSuchKey", "Message": "Not found"}}
+                    raise ClientError(error_response, "GetObject")
+                return await get_object(**kwargs)
+            finally:
+                in_flight -= 1
+
+        client.get_object = slow_get_object
+        keys = ["data/a.csv", "data/missing.csv", "data/b.csv", "data/c.csv"]
+
+        with patch.object(service, '_save_to_s3') as mock_save, \
+             patch.object(service, '_save_metadata') as mock_save_meta:
+            mock_save.return_value = MagicMock(s3_path="datasets/ds_test123/data.parquet")
+            mock_save_meta.side_effect = lambda **kwargs: kwargs["source_config"]["s3_key"]
+
+            result = await service.import_s3_csv_many(
+                sources=[(f"dataset-{i}", key) for i, key in enumerate(keys)],
+                s3_bucket="source-bucket",
+                owner_id="user_123",
+                dynamodb=mock_dynamodb,
+                s3_client=mock_storage_s3_client,
+                source_s3_client=client,
+                concurrency=2,
+            )
+
+        assert max_in_flight == 2
+        assert [r.dataset for r in result] == ["data/a.csv", None, "data/b.csv", "data/c.csv"]
+        assert isinstance(result[1].error, ValueError)
+        assert "not found" in str(result[1].error)
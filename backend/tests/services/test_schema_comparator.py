@@ -6,6 +6,7 @@ from app.services.schema_comparator import (
     SchemaChangeType,
     SchemaCompareResult,
     compare_schemas,
+    schema_fingerprint,
 )
 
 
@@ -259,3 +260,33 @@ class TestSchemaComparatorEdgeCases:
         # Assert
         assert result.has_changes is False
         assert result.changes == []
+
+
+class TestSchemaFingerprint:
+    """Tests for schema_fingerprint function."""
+
+    def test_equal_schemas_have_equal_fingerprints(
+        self,
+        sample_schema: list[ColumnSchema],
+    ) -> None:
+        """Test that schemas with identical columns share a fingerprint."""
+        copy = [col.model_copy() for col in sample_schema]
+
+        assert schema_fingerprint(copy) == schema_fingerprint(sample_schema)
+
+    def test_fingerprint_reflects_type_and_nullable(
+        self,
+        sample_schema: list[ColumnSchema],
+    ) -> None:
+        """Test that type or nullable changes change the fingerprint."""
+        type_changed = [
+            ColumnSchema(name='id', data_type='string', nullable=False),
+            *sample_schema[1:],
+        ]
+        nullable_changed = [
+            ColumnSchema(name='id', data_type='int64', nullable=True),
+            *sample_schema[1:],
+        ]
+
+        assert schema_fingerprint(type_changed) != schema_fingerprint(sample_schema)
+        assert schema_fingerprint(nullable_changed) != schema_fingerprint(sample_schema)
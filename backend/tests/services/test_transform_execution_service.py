@@ -1,20 +1,40 @@
 """Tests for transform_execution_service module - TDD RED phase."""
+import json
+from collections.abc import Iterator
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
-from unittest.mock import MagicMock, AsyncMock, patch
+from unittest.mock import MagicMock, AsyncMock, Mock, patch
 
 import pandas as pd
+import pyarrow as pa
 import pytest
 import httpx
 
 from app.models.transform import Transform
 from app.models.dataset import Dataset, ColumnSchema
+from app.repositories.dataset_repository import DatasetRepository
+from app.repositories.transform_execution_repository import TransformExecutionRepository
+from app.repositories.transform_repository import TransformRepository
+from app.services.parquet_storage import ParquetConverter, ParquetReader
+from app.services.transform_execution_service import (
+    MAX_RETRIES,
+    TransformExecutionResult,
+    TransformExecutionService,
+)
 
 
 # ============================================================================
 # Test Fixtures
 # ============================================================================
 
+# Shared by the mock factories below; tests treat them as read-only
+MOCK_TIMESTAMP = datetime.now(timezone.utc)
+MOCK_DATASET_SCHEMA = [
+    ColumnSchema(name="col1", data_type="string", nullable=False),
+    ColumnSchema(name="col2", data_type="int64", nullable=True),
+]
+
 
 def create_mock_transform(
     transform_id: str = "transform_123",
@@ -27,7 +47,6 @@ def create_mock_transform(
     if input_dataset_ids is None:
         input_dataset_ids = ["dataset_input_1"]
 
-    now = datetime.now(timezone.utc)
     return Transform(
         id=transform_id,
         name="Test Transform",
@@ -35,70 +54,216 @@ def create_mock_transform(
         input_dataset_ids=input_dataset_ids,
         output_dataset_id=output_dataset_id,
         code=code,
-        created_at=now,
-        updated_at=now,
+        created_at=MOCK_TIMESTAMP,
+        updated_at=MOCK_TIMESTAMP,
     )
 
 
 def create_mock_dataset(
     dataset_id: str = "dataset_123",
     owner_id: str = "user_123",
-    s3_path: str = "datasets/dataset_123/data/part-0000.parquet",
+    s3_path: str | None = "datasets/dataset_123/data/part-0000.parquet",
     row_count: int = 100,
 ) -> Dataset:
     """Create a mock Dataset instance."""
-    now = datetime.now(timezone.utc)
     return Dataset(
         id=dataset_id,
         name="Test Dataset",
         source_type="csv",
         row_count=row_count,
-        schema=[
-            ColumnSchema(name="col1", data_type="string", nullable=False),
-            ColumnSchema(name="col2", data_type="int64", nullable=True),
-        ],
+        schema=MOCK_DATASET_SCHEMA,
         owner_id=owner_id,
         s3_path=s3_path,
         column_count=2,
-        created_at=now,
-        updated_at=now,
+        created_at=MOCK_TIMESTAMP,
+        updated_at=MOCK_TIMESTAMP,
     )
 
 
-def _create_exec_repo_mock() -> tuple[MagicMock, MagicMock]:
+def _create_exec_repo_mock() -> tuple[Mock, Mock]:
     """Create a mock TransformExecutionRepository class and instance.
 
     Returns:
         Tuple of (mock_class, mock_instance).
     """
-    mock_exec_repo = MagicMock()
-    mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-    mock_exec_repo.update_status = AsyncMock(return_value=None)
-    mock_exec_repo_cls = MagicMock(return_value=mock_exec_repo)
+    mock_exec_repo = Mock(spec=TransformExecutionRepository)
+    mock_exec_repo.create.return_value = MagicMock()
+    mock_exec_repo.update_status.return_value = None
+    mock_exec_repo_cls = Mock(return_value=mock_exec_repo)
     return mock_exec_repo_cls, mock_exec_repo
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_dynamodb() -> MagicMock:
-    """Create mock DynamoDB resource."""
+    """Create mock DynamoDB resource, shared by the module."""
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_s3_client() -> MagicMock:
-    """Create mock S3 client."""
+    """Create mock S3 client, shared by the module."""
     return MagicMock()
 
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks(mock_dynamodb: MagicMock, mock_s3_client: MagicMock) -> None:
+    """Clear recorded calls on the module-scoped mocks before each test."""
+    mock_dynamodb.reset_mock()
+    mock_s3_client.reset_mock()
+
+
+@pytest.fixture(autouse=True)
+def patched_sleep() -> Iterator[AsyncMock]:
+    """Skip real backoff delays between executor retries."""
+    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+        yield mock_sleep
+
+
+@pytest.fixture(scope="module")
+def service() -> TransformExecutionService:
+    """Shared service instance; it keeps no state between execute() calls."""
+    return TransformExecutionService()
+
+
+@pytest.fixture(scope="module")
 def sample_dataframe() -> pd.DataFrame:
-    """Create sample DataFrame for testing."""
+    """Create sample DataFrame for testing, shared by the module (read-only)."""
     return pd.DataFrame({
         "col1": ["a", "b", "c"],
         "col2": [1, 2, 3],
     })
 
 
+@pytest.fixture(scope="module")
+def default_input_dataset() -> Dataset:
+    """Input dataset served by patched_service_deps, shared by the module (read-only)."""
+    return create_mock_dataset(dataset_id="dataset_input_1")
+
+
+@pytest.fixture(scope="module")
+def sample_executor_response(sample_dataframe: pd.DataFrame) -> bytes:
+    """Executor Arrow response body for sample_dataframe, built once per module."""
+    table = pa.Table.from_pandas(sample_dataframe, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+# Only satisfies HTTPStatusError's constructor; never inspected by the service
+_EXECUTOR_REQUEST = httpx.Request("POST", "http://executor.local/execute/transform")
+
+
+def _read_streams(body: bytes) -> list[pa.Table]:
+    """Read the concatenated Arrow IPC streams of an executor request body."""
+    source = pa.BufferReader(body)
+    tables = []
+    while source.tell() < source.size():
+        tables.append(pa.ipc.open_stream(source).read_all())
+    return tables
+
+
+def _make_success_response(body: bytes) -> MagicMock:
+    """Create an executor response whose content is an Arrow IPC stream."""
+    response = MagicMock()
+    response.content = body
+    return response
+
+
+def _make_status_error_response(status_code: int, text: str) -> MagicMock:
+    """Create an executor response whose raise_for_status raises HTTPStatusError."""
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = text
+    response.raise_for_status.side_effect = httpx.HTTPStatusError(
+        f"{status_code} {text}",
+        request=_EXECUTOR_REQUEST,
+        response=response,
+    )
+    return response
+
+
+# Stands in for ServiceDeps.executor_response in parametrized response lists
+EXECUTOR_OK = object()
+
+
+def _make_mock_client(responses: list[Any]) -> AsyncMock:
+    """Create mock httpx AsyncClient returning responses/exceptions in order."""
+    mock_client = AsyncMock(spec_set=httpx.AsyncClient)
+    mock_client.post.side_effect = responses
+    mock_client.__aenter__.return_value = mock_client
+    return mock_client
+
+
+@dataclass
+class ServiceDeps:
+    """Mock instances installed by the patched_service_deps fixture."""
+
+    dataset_repo: Mock
+    reader: Mock
+    converter: Mock
+    transform_repo: Mock
+    exec_repo: Mock
+    client: AsyncMock
+    executor_response: MagicMock
+
+
+@pytest.fixture
+def patched_service_deps(
+    sample_dataframe: pd.DataFrame,
+    sample_executor_response: bytes,
+    default_input_dataset: Dataset,
+) -> Iterator[ServiceDeps]:
+    """Patch every collaborator of TransformExecutionService in one place.
+
+    The defaults describe a successful run over dataset_input_1 that returns
+    ``sample_dataframe``; tests override only the attributes they exercise
+    (e.g. ``deps.client.post.side_effect`` for executor failures, reusing
+    ``deps.executor_response`` as the successful reply).
+    """
+    # spec= makes the async methods AsyncMocks and rejects unknown attributes
+    dataset_repo = Mock(spec=DatasetRepository)
+    dataset_repo.get_by_id.return_value = default_input_dataset
+    dataset_repo.create.return_value = create_mock_dataset(dataset_id="dataset_output_1")
+
+    reader = Mock(spec=ParquetReader)
+    reader.read_full.return_value = sample_dataframe
+
+    converter = Mock(spec=ParquetConverter)
+    converter.convert_and_save.return_value = MagicMock(
+        s3_path="datasets/dataset_output_1/data/part-0000.parquet"
+    )
+
+    transform_repo = Mock(spec=TransformRepository)
+    transform_repo.update.return_value = None
+
+    mock_exec_repo_cls, exec_repo = _create_exec_repo_mock()
+
+    executor_response = _make_success_response(sample_executor_response)
+    client = _make_mock_client([executor_response])
+
+    with patch.multiple(
+        "app.services.transform_execution_service",
+        DatasetRepository=Mock(return_value=dataset_repo),
+        ParquetReader=Mock(return_value=reader),
+        ParquetConverter=Mock(return_value=converter),
+        TransformRepository=Mock(return_value=transform_repo),
+        TransformExecutionRepository=mock_exec_repo_cls,
+    ), patch("httpx.AsyncClient", spec_set=True) as mock_client_cls:
+        # Assigned after creation: with spec_set, patch() ignores a return_value
+        # kwarg and hands out a specced instance of its own
+        mock_client_cls.return_value = client
+        yield ServiceDeps(
+            dataset_repo=dataset_repo,
+            reader=reader,
+            converter=converter,
+            transform_repo=transform_repo,
+            exec_repo=exec_repo,
+            client=client,
+            executor_response=executor_response,
+        )
+
+
 # ============================================================================
 # TransformExecutionResult Tests
 # ============================================================================
@@ -109,8 +274,6 @@ class TestTransformExecutionResult:
 
     def test_result_creation(self) -> None:
         """Test TransformExecutionResult can be created with required fields."""
-        from app.services.transform_execution_service import TransformExecutionResult
-
         result = TransformExecutionResult(
             execution_id="exec_123",
             output_dataset_id="dataset_out_123",
@@ -127,8 +290,6 @@ class TestTransformExecutionResult:
 
     def test_result_immutability(self) -> None:
         """Test TransformExecutionResult is immutable (frozen dataclass)."""
-        from app.services.transform_execution_service import TransformExecutionResult
-
         result = TransformExecutionResult(
             execution_id="exec_123",
             output_dataset_id="dataset_out_123",
@@ -155,711 +316,235 @@ class TestTransformExecutionService:
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test successful transform execution with single input dataset."""
-        from app.services.transform_execution_service import (
-            TransformExecutionService,
-            TransformExecutionResult,
-        )
-
-        # Setup
         transform = create_mock_transform(
             input_dataset_ids=["dataset_input_1"],
         )
-        input_dataset = create_mock_dataset(
-            dataset_id="dataset_input_1",
-            s3_path="datasets/dataset_input_1/data/part-0000.parquet",
+
+        result = await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
         )
 
-        # Mock DatasetRepository
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(dataset_id="dataset_output_1")
-            )
-            mock_repo_cls.return_value = mock_repo
-
-            # Mock ParquetReader
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                # Mock Executor API call
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    # Mock ParquetConverter
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/dataset_output_1/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        # Mock TransformRepository
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            # Mock TransformExecutionRepository
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                # Execute
-                                service = TransformExecutionService()
-                                result = await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Verify
-                                assert isinstance(result, TransformExecutionResult)
-                                assert result.execution_id is not None
-                                assert result.output_dataset_id is not None
-                                assert result.row_count == 3
-                                assert result.column_names == ["col1", "col2"]
-                                assert result.execution_time_ms >= 0
+        # Verify
+        assert isinstance(result, TransformExecutionResult)
+        assert result.execution_id is not None
+        assert result.output_dataset_id is not None
+        assert result.row_count == 3
+        assert result.column_names == ["col1", "col2"]
+        assert result.execution_time_ms >= 0
 
     @pytest.mark.asyncio
     async def test_execute_input_dataset_not_found(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test execute raises error when input dataset not found."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform(
             input_dataset_ids=["nonexistent_dataset"],
         )
+        patched_service_deps.dataset_repo.get_by_id.return_value = None
 
-        # Mock DatasetRepository to return None
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=None)
-            mock_repo_cls.return_value = mock_repo
-
-            # Mock TransformExecutionRepository
-            with patch(
-                "app.services.transform_execution_service.TransformExecutionRepository"
-            ) as mock_exec_repo_cls:
-                mock_exec_repo = MagicMock()
-                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                service = TransformExecutionService()
-
-                with pytest.raises(ValueError, match="Input dataset .* not found"):
-                    await service.execute(
-                        transform=transform,
-                        dynamodb=mock_dynamodb,
-                        s3=mock_s3_client,
-                    )
+        with pytest.raises(ValueError, match="Input dataset .* not found"):
+            await service.execute(
+                transform=transform,
+                dynamodb=mock_dynamodb,
+                s3=mock_s3_client,
+            )
 
     @pytest.mark.asyncio
     async def test_execute_input_dataset_no_s3_path(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test execute raises error when input dataset has no s3_path."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform(
             input_dataset_ids=["dataset_no_path"],
         )
-        input_dataset = create_mock_dataset(
+        patched_service_deps.dataset_repo.get_by_id.return_value = create_mock_dataset(
             dataset_id="dataset_no_path",
-            s3_path=None,  # type: ignore
-        )
-        # Manually set s3_path to None
-        input_dataset = Dataset(
-            id="dataset_no_path",
-            name="Test Dataset",
-            source_type="csv",
-            row_count=100,
-            schema=[ColumnSchema(name="col1", data_type="string", nullable=False)],
-            owner_id="user_123",
             s3_path=None,
-            column_count=1,
-            created_at=datetime.now(timezone.utc),
-            updated_at=datetime.now(timezone.utc),
         )
 
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo_cls.return_value = mock_repo
-
-            # Mock TransformExecutionRepository
-            with patch(
-                "app.services.transform_execution_service.TransformExecutionRepository"
-            ) as mock_exec_repo_cls:
-                mock_exec_repo = MagicMock()
-                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                service = TransformExecutionService()
-
-                with pytest.raises(ValueError, match="Input dataset .* has no data"):
-                    await service.execute(
-                        transform=transform,
-                        dynamodb=mock_dynamodb,
-                        s3=mock_s3_client,
-                    )
+        with pytest.raises(ValueError, match="Input dataset .* has no data"):
+            await service.execute(
+                transform=transform,
+                dynamodb=mock_dynamodb,
+                s3=mock_s3_client,
+            )
 
     @pytest.mark.asyncio
     async def test_execute_multiple_input_datasets(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test execute with multiple input datasets."""
-        from app.services.transform_execution_service import (
-            TransformExecutionService,
-            TransformExecutionResult,
-        )
-
         transform = create_mock_transform(
             input_dataset_ids=["dataset_1", "dataset_2"],
             code="def transform(df1, df2): return df1.merge(df2)",
         )
-        dataset_1 = create_mock_dataset(
-            dataset_id="dataset_1",
-            s3_path="datasets/dataset_1/data/part-0000.parquet",
-        )
-        dataset_2 = create_mock_dataset(
-            dataset_id="dataset_2",
-            s3_path="datasets/dataset_2/data/part-0000.parquet",
-        )
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-
-            async def get_by_id_side_effect(dataset_id: str, dynamodb: Any) -> Dataset | None:
-                if dataset_id == "dataset_1":
-                    return dataset_1
-                elif dataset_id == "dataset_2":
-                    return dataset_2
-                return None
-
-            mock_repo.get_by_id = AsyncMock(side_effect=get_by_id_side_effect)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(dataset_id="dataset_output_1")
+        datasets_by_id = {
+            dataset_id: create_mock_dataset(
+                dataset_id=dataset_id,
+                s3_path=f"datasets/{dataset_id}/data/part-0000.parquet",
             )
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/dataset_output_1/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            # Mock TransformExecutionRepository
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                result = await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Verify
-                                assert isinstance(result, TransformExecutionResult)
-                                # Verify executor was called with multiple datasets
-                                call_args = mock_client.post.call_args
-                                assert call_args is not None
-                                json_body = call_args[1]["json"]
-                                assert "input_datasets" in json_body
-                                assert len(json_body["input_datasets"]) == 2
+            for dataset_id in ("dataset_1", "dataset_2")
+        }
+        # AsyncMock wraps a sync side_effect's return value in the awaitable
+        patched_service_deps.dataset_repo.get_by_id.side_effect = (
+            lambda dataset_id, dynamodb: datasets_by_id.get(dataset_id)
+        )
 
-    @pytest.mark.asyncio
-    async def test_execute_executor_retry_on_5xx(
-        self,
-        mock_dynamodb: MagicMock,
-        mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
-    ) -> None:
-        """Test execute retries on 5xx errors from Executor API."""
-        from app.services.transform_execution_service import TransformExecutionService
+        result = await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
+        )
 
-        transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls, \
-                     patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                    # First 2 calls fail with 500, third succeeds
-                    mock_500_response = MagicMock()
-                    mock_500_response.status_code = 500
-                    mock_500_response.text = "Internal Server Error"
-                    mock_500_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                        "500 Internal Server Error",
-                        request=MagicMock(),
-                        response=mock_500_response,
-                    )
-
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_success_response = MagicMock()
-                    mock_success_response.json.return_value = executor_response
-                    mock_success_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(
-                        side_effect=[
-                            mock_500_response,
-                            mock_500_response,
-                            mock_success_response,
-                        ]
-                    )
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/output/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            mock_repo.create = AsyncMock(
-                                return_value=create_mock_dataset(dataset_id="output")
-                            )
-
-                            # Mock TransformExecutionRepository
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                result = await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Should have succeeded after retries
-                                assert result is not None
-                                # Should have called post 3 times
-                                assert mock_client.post.call_count == 3
-                                # Should have slept between retries
-                                assert mock_sleep.call_count == 2
+        # Verify
+        assert isinstance(result, TransformExecutionResult)
+        # Verify executor was called with multiple datasets
+        call_args = patched_service_deps.client.post.call_args
+        assert call_args is not None
+        assert call_args[0][0].endswith("/execute/transform/arrow")
+        tables = _read_streams(call_args[1]["content"])
+        assert [t.schema.metadata[b"dataset_id"] for t in tables] == [b"dataset_1", b"dataset_2"]
+        assert json.loads(tables[0].schema.metadata[b"request"])["code"] == transform.code
+        assert call_args[1]["headers"]["Accept"] == "application/vnd.apache.arrow.stream"
 
     @pytest.mark.asyncio
-    async def test_execute_executor_fails_after_max_retries(
+    @pytest.mark.parametrize(
+        ("responses", "error_match", "expected_posts"),
+        [
+            pytest.param(
+                [_make_status_error_response(500, "Internal Server Error")] * 2
+                + [EXECUTOR_OK],
+                None,
+                3,
+                id="5xx_then_success",
+            ),
+            pytest.param(
+                [httpx.TimeoutException("Timeout")] * MAX_RETRIES,
+                "Executor failed after",
+                MAX_RETRIES,
+                id="fails_after_max_retries",
+            ),
+            pytest.param(
+                [_make_status_error_response(400, "Bad Request: Invalid transform code")],
+                "Executor returned client error",
+                1,
+                id="no_retry_on_4xx",
+            ),
+        ],
+    )
+    async def test_execute_executor_retry_behavior(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
+        patched_sleep: AsyncMock,
+        responses: list[Any],
+        error_match: str | None,
+        expected_posts: int,
     ) -> None:
-        """Test execute raises error after max retries exceeded."""
-        from app.services.transform_execution_service import TransformExecutionService
-
+        """Test execute retries transient executor errors but not 4xx."""
         transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls, \
-                     patch("asyncio.sleep", new_callable=AsyncMock):
-                    # All calls fail with timeout
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(
-                        side_effect=httpx.TimeoutException("Timeout")
-                    )
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    # Mock TransformExecutionRepository
-                    with patch(
-                        "app.services.transform_execution_service.TransformExecutionRepository"
-                    ) as mock_exec_repo_cls:
-                        mock_exec_repo = MagicMock()
-                        mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                        mock_exec_repo.update_status = AsyncMock(return_value=None)
-                        mock_exec_repo_cls.return_value = mock_exec_repo
-
-                        service = TransformExecutionService()
-
-                        with pytest.raises(RuntimeError, match="Executor failed after"):
-                            await service.execute(
-                                transform=transform,
-                                dynamodb=mock_dynamodb,
-                                s3=mock_s3_client,
-                            )
-
-    @pytest.mark.asyncio
-    async def test_execute_no_retry_on_4xx(
-        self,
-        mock_dynamodb: MagicMock,
-        mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
-    ) -> None:
-        """Test execute does not retry on 4xx errors (client errors)."""
-        from app.services.transform_execution_service import TransformExecutionService
+        patched_service_deps.client.post.side_effect = [
+            patched_service_deps.executor_response if r is EXECUTOR_OK else r
+            for r in responses
+        ]
+
+        if error_match is None:
+            result = await service.execute(
+                transform=transform,
+                dynamodb=mock_dynamodb,
+                s3=mock_s3_client,
+            )
+            assert result.row_count == 3
+        else:
+            with pytest.raises(RuntimeError, match=error_match):
+                await service.execute(
+                    transform=transform,
+                    dynamodb=mock_dynamodb,
+                    s3=mock_s3_client,
+                )
 
-        transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls, \
-                     patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-                    # Return 400 error (should not retry)
-                    mock_400_response = MagicMock()
-                    mock_400_response.status_code = 400
-                    mock_400_response.text = "Bad Request: Invalid transform code"
-                    mock_400_response.raise_for_status.side_effect = httpx.HTTPStatusError(
-                        "400 Bad Request",
-                        request=MagicMock(),
-                        response=mock_400_response,
-                    )
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_400_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    # Mock TransformExecutionRepository
-                    with patch(
-                        "app.services.transform_execution_service.TransformExecutionRepository"
-                    ) as mock_exec_repo_cls:
-                        mock_exec_repo = MagicMock()
-                        mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                        mock_exec_repo.update_status = AsyncMock(return_value=None)
-                        mock_exec_repo_cls.return_value = mock_exec_repo
-
-                        service = TransformExecutionService()
-
-                        with pytest.raises(RuntimeError, match="Executor returned client error"):
-                            await service.execute(
-                                transform=transform,
-                                dynamodb=mock_dynamodb,
-                                s3=mock_s3_client,
-                            )
-
-                    # Should have called post only once (no retry)
-                    assert mock_client.post.call_count == 1
-                    # Should not have slept
-                    mock_sleep.assert_not_called()
+        assert patched_service_deps.client.post.call_count == expected_posts
+        # Backoff sleeps once between consecutive attempts
+        assert patched_sleep.call_count == expected_posts - 1
 
     @pytest.mark.asyncio
     async def test_execute_updates_transform_output_dataset_id(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test execute updates Transform.output_dataset_id after success."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform(
             transform_id="transform_to_update",
             output_dataset_id=None,
         )
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(dataset_id="new_output_dataset")
-            )
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/new_output_dataset/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            # Mock TransformExecutionRepository
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                result = await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Verify TransformRepository.update was called
-                                mock_transform_repo.update.assert_called_once()
-                                call_args = mock_transform_repo.update.call_args
-                                assert call_args[0][0] == "transform_to_update"
-                                assert "output_dataset_id" in call_args[0][1]
-                                # Verify the output_dataset_id matches the result
-                                assert call_args[0][1]["output_dataset_id"] == result.output_dataset_id
+
+        result = await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
+        )
+
+        # Verify TransformRepository.update was called
+        mock_transform_repo = patched_service_deps.transform_repo
+        mock_transform_repo.update.assert_called_once()
+        call_args = mock_transform_repo.update.call_args
+        assert call_args[0][0] == "transform_to_update"
+        assert "output_dataset_id" in call_args[0][1]
+        # Verify the output_dataset_id matches the result
+        assert call_args[0][1]["output_dataset_id"] == result.output_dataset_id
 
     @pytest.mark.asyncio
     async def test_execute_creates_output_dataset_with_correct_owner(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test execute creates output dataset with Transform's owner_id."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform(
             owner_id="transform_owner_user",
         )
-        input_dataset = create_mock_dataset(
+        patched_service_deps.dataset_repo.get_by_id.return_value = create_mock_dataset(
             dataset_id="dataset_input_1",
             owner_id="different_owner",  # Different from transform owner
         )
 
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(
-                    dataset_id="output_dataset",
-                    owner_id="transform_owner_user",
-                )
-            )
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/output/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            # Mock TransformExecutionRepository
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Verify DatasetRepository.create was called with correct owner
-                                mock_repo.create.assert_called_once()
-                                create_call_args = mock_repo.create.call_args
-                                dataset_dict = create_call_args[0][0]
-                                assert dataset_dict["owner_id"] == "transform_owner_user"
+        await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
+        )
+
+        # Verify DatasetRepository.create was called with correct owner
+        mock_repo = patched_service_deps.dataset_repo
+        mock_repo.create.assert_called_once()
+        create_call_args = mock_repo.create.call_args
+        dataset_dict = create_call_args[0][0]
+        assert dataset_dict["owner_id"] == "transform_owner_user"
 
 
 # ============================================================================
@@ -875,319 +560,108 @@ class TestTransformExecutionHistoryIntegration:
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test that execute() creates a running record at start."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(dataset_id="output")
-            )
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/output/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Verify create was called with status="running"
-                                mock_exec_repo.create.assert_called_once()
-                                create_args = mock_exec_repo.create.call_args[0][0]
-                                assert create_args["status"] == "running"
-                                assert create_args["transform_id"] == "transform_123"
-                                assert "execution_id" in create_args
-                                assert "started_at" in create_args
-                                assert create_args["triggered_by"] == "manual"
+
+        await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
+        )
+
+        # Verify create was called with status="running"
+        mock_exec_repo = patched_service_deps.exec_repo
+        mock_exec_repo.create.assert_called_once()
+        create_args = mock_exec_repo.create.call_args[0][0]
+        assert create_args["status"] == "running"
+        assert create_args["transform_id"] == "transform_123"
+        assert "execution_id" in create_args
+        assert "started_at" in create_args
+        assert create_args["triggered_by"] == "manual"
 
     @pytest.mark.asyncio
     async def test_execute_updates_to_success_on_completion(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test that execute() updates record to success on completion."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(dataset_id="output")
-            )
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/output/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                result = await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                )
-
-                                # Verify update_status was called with status="success"
-                                mock_exec_repo.update_status.assert_called_once()
-                                update_args = mock_exec_repo.update_status.call_args
-                                # positional args: transform_id, started_at, updates_dict, dynamodb
-                                assert update_args[0][0] == "transform_123"
-                                updates_dict = update_args[0][2]
-                                assert updates_dict["status"] == "success"
-                                assert "finished_at" in updates_dict
-                                assert "duration_ms" in updates_dict
-                                assert updates_dict["output_row_count"] == 3
-                                assert updates_dict["output_dataset_id"] == result.output_dataset_id
+
+        result = await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
+        )
+
+        # Verify update_status was called with status="success"
+        mock_exec_repo = patched_service_deps.exec_repo
+        mock_exec_repo.update_status.assert_called_once()
+        update_args = mock_exec_repo.update_status.call_args
+        # positional args: transform_id, started_at, updates_dict, dynamodb
+        assert update_args[0][0] == "transform_123"
+        updates_dict = update_args[0][2]
+        assert updates_dict["status"] == "success"
+        assert "finished_at" in updates_dict
+        assert "duration_ms" in updates_dict
+        assert updates_dict["output_row_count"] == 3
+        assert updates_dict["output_dataset_id"] == result.output_dataset_id
 
     @pytest.mark.asyncio
     async def test_execute_updates_to_failed_on_error(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test that execute() updates record to failed on error."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls, \
-                     patch("asyncio.sleep", new_callable=AsyncMock):
-                    # All calls fail with timeout
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(
-                        side_effect=httpx.TimeoutException("Timeout")
-                    )
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.TransformExecutionRepository"
-                    ) as mock_exec_repo_cls:
-                        mock_exec_repo = MagicMock()
-                        mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                        mock_exec_repo.update_status = AsyncMock(return_value=None)
-                        mock_exec_repo_cls.return_value = mock_exec_repo
-
-                        service = TransformExecutionService()
-
-                        with pytest.raises(RuntimeError):
-                            await service.execute(
-                                transform=transform,
-                                dynamodb=mock_dynamodb,
-                                s3=mock_s3_client,
-                            )
-
-                        # Verify update_status was called with status="failed"
-                        mock_exec_repo.update_status.assert_called_once()
-                        update_args = mock_exec_repo.update_status.call_args
-                        updates_dict = update_args[0][2]
-                        assert updates_dict["status"] == "failed"
-                        assert "finished_at" in updates_dict
-                        assert "duration_ms" in updates_dict
-                        assert "error" in updates_dict
+        # All calls fail with timeout
+        patched_service_deps.client.post.side_effect = httpx.TimeoutException("Timeout")
+
+        with pytest.raises(RuntimeError):
+            await service.execute(
+                transform=transform,
+                dynamodb=mock_dynamodb,
+                s3=mock_s3_client,
+            )
+
+        # Verify update_status was called with status="failed"
+        mock_exec_repo = patched_service_deps.exec_repo
+        mock_exec_repo.update_status.assert_called_once()
+        update_args = mock_exec_repo.update_status.call_args
+        updates_dict = update_args[0][2]
+        assert updates_dict["status"] == "failed"
+        assert "finished_at" in updates_dict
+        assert "duration_ms" in updates_dict
+        assert "error" in updates_dict
 
     @pytest.mark.asyncio
     async def test_execute_with_triggered_by_schedule(
         self,
         mock_dynamodb: MagicMock,
         mock_s3_client: MagicMock,
-        sample_dataframe: pd.DataFrame,
+        patched_service_deps: ServiceDeps,
+        service: TransformExecutionService,
     ) -> None:
         """Test triggered_by='schedule' is recorded."""
-        from app.services.transform_execution_service import TransformExecutionService
-
         transform = create_mock_transform()
-        input_dataset = create_mock_dataset(dataset_id="dataset_input_1")
-
-        with patch(
-            "app.services.transform_execution_service.DatasetRepository"
-        ) as mock_repo_cls:
-            mock_repo = MagicMock()
-            mock_repo.get_by_id = AsyncMock(return_value=input_dataset)
-            mock_repo.create = AsyncMock(
-                return_value=create_mock_dataset(dataset_id="output")
-            )
-            mock_repo_cls.return_value = mock_repo
-
-            with patch(
-                "app.services.transform_execution_service.ParquetReader"
-            ) as mock_reader_cls:
-                mock_reader = MagicMock()
-                mock_reader.read_full.return_value = sample_dataframe
-                mock_reader_cls.return_value = mock_reader
-
-                with patch("httpx.AsyncClient") as mock_client_cls:
-                    executor_response = {
-                        "output_rows": sample_dataframe.to_dict(orient="records"),
-                        "column_names": ["col1", "col2"],
-                        "row_count": 3,
-                    }
-                    mock_response = MagicMock()
-                    mock_response.json.return_value = executor_response
-                    mock_response.raise_for_status = MagicMock()
-
-                    mock_client = AsyncMock()
-                    mock_client.post = AsyncMock(return_value=mock_response)
-                    mock_client.__aenter__ = AsyncMock(return_value=mock_client)
-                    mock_client.__aexit__ = AsyncMock(return_value=None)
-                    mock_client_cls.return_value = mock_client
-
-                    with patch(
-                        "app.services.transform_execution_service.ParquetConverter"
-                    ) as mock_converter_cls:
-                        mock_converter = MagicMock()
-                        mock_converter.convert_and_save.return_value = MagicMock(
-                            s3_path="datasets/output/data/part-0000.parquet"
-                        )
-                        mock_converter_cls.return_value = mock_converter
-
-                        with patch(
-                            "app.services.transform_execution_service.TransformRepository"
-                        ) as mock_transform_repo_cls:
-                            mock_transform_repo = MagicMock()
-                            mock_transform_repo.update = AsyncMock(return_value=transform)
-                            mock_transform_repo_cls.return_value = mock_transform_repo
-
-                            with patch(
-                                "app.services.transform_execution_service.TransformExecutionRepository"
-                            ) as mock_exec_repo_cls:
-                                mock_exec_repo = MagicMock()
-                                mock_exec_repo.create = AsyncMock(return_value=MagicMock())
-                                mock_exec_repo.update_status = AsyncMock(return_value=None)
-                                mock_exec_repo_cls.return_value = mock_exec_repo
-
-                                service = TransformExecutionService()
-                                await service.execute(
-                                    transform=transform,
-                                    dynamodb=mock_dynamodb,
-                                    s3=mock_s3_client,
-                                    triggered_by="schedule",
-                                )
-
-                                # Verify create was called with triggered_by="schedule"
-                                mock_exec_repo.create.assert_called_once()
-                                create_args = mock_exec_repo.create.call_args[0][0]
-                                assert create_args["triggered_by"] == "schedule"
+
+        await service.execute(
+            transform=transform,
+            dynamodb=mock_dynamodb,
+            s3=mock_s3_client,
+            triggered_by="schedule",
+        )
+
+        # Verify create was called with triggered_by="schedule"
+        mock_exec_repo = patched_service_deps.exec_repo
+        mock_exec_repo.create.assert_called_once()
+        create_args = mock_exec_repo.create.call_args[0][0]
+        assert create_args["triggered_by"] == "schedule"
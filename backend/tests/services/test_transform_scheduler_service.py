@@ -1,9 +1,11 @@
 """Tests for TransformSchedulerService."""
 import asyncio
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from croniter import croniter
+
 from app.services.transform_scheduler_service import TransformSchedulerService
 
 
@@ -35,6 +37,40 @@ class TestTransformSchedulerService:
             result = TransformSchedulerService._is_due("0 * * * *", now)
         assert result is False
 
+    @pytest.mark.parametrize("cron_expr", [
+        "* * * * *",
+        "*/5 * * * *",
+        "*/15 * * * *",
+        "0 * * * *",
+        "30 * * * *",
+        "0 */6 * * *",
+        "15 3 * * *",
+        # Not fixed-period: answered by croniter
+        "*/7 * * * *",
+        "0 9 * * 1-5",
+        "0 0 1 * *",
+    ])
+    def test_is_due_matches_croniter(self, cron_expr):
+        """Test _is_due fast path agrees with croniter across a day of ticks."""
+        start = datetime(2026, 2, 4, 0, 0, 0, tzinfo=timezone.utc)
+        with patch("app.services.transform_scheduler_service.settings") as mock_settings:
+            mock_settings.scheduler_interval_seconds = 60
+            for seconds in range(0, 86400 + 3600, 270):
+                now = start + timedelta(seconds=seconds)
+                prev_time = croniter(cron_expr, now).get_prev(datetime)
+                expected = (now - prev_time).total_seconds() < 60
+                assert TransformSchedulerService._is_due(cron_expr, now) is expected, now
+
+    def test_is_due_fixed_period_skips_croniter(self):
+        """Test common fixed-interval crons are evaluated without croniter."""
+        now = datetime(2026, 2, 4, 10, 0, 30, tzinfo=timezone.utc)
+        with patch("app.services.transform_scheduler_service.settings") as mock_settings, \
+             patch("app.services.transform_scheduler_service.croniter") as mock_croniter:
+            mock_settings.scheduler_interval_seconds = 60
+            assert TransformSchedulerService._is_due("0 * * * *", now) is True
+            assert TransformSchedulerService._is_due("15 3 * * *", now) is False
+        mock_croniter.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_check_skips_running_transforms(self):
         """Test scheduler skips transforms with running executions."""
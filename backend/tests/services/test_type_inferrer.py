@@ -122,6 +122,42 @@ class TestInferColumnType:
         result = infer_column_type(series)
         assert result == "int64"
 
+    def test_parser_typed_columns_use_dtype(self):
+        """Test columns already typed by the CSV parser are mapped from dtype."""
+        assert infer_column_type(pd.Series([True, False, True])) == "bool"
+        assert infer_column_type(pd.Series([0, 1, 1, 0])) == "bool"
+        assert infer_column_type(pd.Series([1.0, 2.0, None])) == "int64"
+        assert infer_column_type(pd.Series([1.5, float("inf")])) == "float64"
+
+    def test_whole_floats_outside_int64_stay_float(self):
+        """Test whole floats that cannot convert to int64 exactly stay float64."""
+        assert infer_column_type(pd.Series([1e20, 1.0])) == "float64"
+        assert infer_column_type(pd.Series([1.2e19, 2.0])) == "float64"
+        assert infer_column_type(pd.Series([2.0 ** 53, 1.0])) == "int64"
+        assert infer_column_type(pd.Series([float("inf"), 1.0])) == "float64"
+        assert infer_column_type(pd.Series([2 ** 63, 1], dtype="uint64")) == "float64"
+
+    def test_numeric_strings_are_parsed(self):
+        """Test numeric values read as strings are inferred as int64/float64."""
+        assert infer_column_type(pd.Series(["10", "-2", "1.0"])) == "int64"
+        assert infer_column_type(pd.Series(["1.5", "2", "inf"])) == "float64"
+        assert infer_column_type(pd.Series(["1", "2", "n/a"])) == "string"
+
+    def test_date_outside_timestamp_range(self):
+        """Test sentinel dates outside the Timestamp range still infer as date."""
+        assert infer_column_type(pd.Series(["9999-12-31", "2024-01-15"])) == "date"
+        assert infer_column_type(pd.Series(["0001-01-01", "2024-01-15"])) == "date"
+        assert infer_column_type(
+            pd.Series(["9999-12-31 23:59:59", "2024-01-15 10:30:00"])
+        ) == "datetime"
+        assert infer_column_type(pd.Series(["9999-12-32", "2024-01-15"])) == "string"
+
+    def test_integer_strings_beyond_uint64_stay_string(self):
+        """Test integer strings too large for any numeric dtype are not rounded."""
+        series = pd.Series(["99999999999999999999", "1"])
+        result = infer_column_type(series)
+        assert result == "string"
+
 
 class TestInferSchema:
     """Tests for infer_schema function."""
@@ -212,6 +248,26 @@ class TestApplyTypes:
         assert result["flag"].dtype == "bool"
         assert result["flag"].tolist() == [True, False, True]
 
+    def test_apply_types_casts_parser_typed_columns(self):
+        """Test columns already typed by the CSV parser are cast, not re-parsed."""
+        df = pd.DataFrame({
+            "flag": [1, 0, 1],
+            "done": [True, False, True],
+            "count": [1.0, 2.0, 3.0],
+        })
+        schema = [
+            ColumnSchema(name="flag", data_type="bool", nullable=False),
+            ColumnSchema(name="done", data_type="bool", nullable=False),
+            ColumnSchema(name="count", data_type="int64", nullable=False),
+        ]
+
+        result = apply_types(df, schema)
+
+        assert result["flag"].tolist() == [True, False, True]
+        assert result["done"].tolist() == [True, False, True]
+        assert result["count"].dtype == "int64"
+        assert df["count"].dtype == "float64"
+
     def test_apply_types_converts_date(self):
         """Test apply_types correctly converts to date."""
         df = pd.DataFrame({"date_col": ["2024-01-15", "2024-02-20", "2024-03-25"]})
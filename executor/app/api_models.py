@@ -28,14 +28,18 @@ class ExecuteErrorResponse(BaseModel):
     detail: Optional[str] = None
 
 
-class ExecuteTransformRequest(BaseModel):
-    """POST /execute/transform リクエストボディ"""
+class ExecuteTransformArrowRequest(BaseModel):
+    """POST /execute/transform/arrow のリクエストフィールド (入力は Arrow ストリーム)"""
     transform_id: str
     code: str
-    input_datasets: dict[str, list[dict[str, Any]]]  # {dataset_id: rows}
     params: dict[str, Any] = {}
 
 
+class ExecuteTransformRequest(ExecuteTransformArrowRequest):
+    """POST /execute/transform リクエストボディ"""
+    input_datasets: dict[str, list[dict[str, Any]]]  # {dataset_id: rows}
+
+
 class ExecuteTransformResponse(BaseModel):
     """POST /execute/transform レスポンスボディ"""
     output_rows: list[dict[str, Any]]
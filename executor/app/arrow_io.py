@@ -0,0 +1,77 @@
+"""Arrow IPC ストリームの読み書き
+
+/execute/*/arrow エンドポイントのボディは、1つ以上の Arrow IPC ストリームを
+連結したもの。JSON の行リストを経由せず、列指向のまま DataFrame を構築する。
+
+- 先頭ストリームのスキーマメタデータ ``request`` に、データ以外のリクエスト
+  フィールド (code, filters, params など) を JSON で格納する
+- Transform では ``dataset_id`` メタデータを持つストリームを入力として扱う
+  (入力が無い場合は、request のみを持つ空ストリームを1つ送る)
+"""
+import json
+from typing import Any
+
+import pandas as pd
+import pyarrow as pa
+
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+
+REQUEST_METADATA_KEY = b"request"
+DATASET_ID_METADATA_KEY = b"dataset_id"
+
+
+def write_stream(df: pd.DataFrame, metadata: dict[bytes, bytes] | None = None) -> bytes:
+    """DataFrame を1つの Arrow IPC ストリームに書き出す
+
+    Args:
+        df: 書き出すDataFrame (インデックスは含めない)
+        metadata: スキーマメタデータに追加するキーと値
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def read_streams(body: bytes) -> list[pa.Table]:
+    """連結された Arrow IPC ストリームを順に読み込む
+
+    Raises:
+        pa.ArrowInvalid: ボディが Arrow IPC ストリームでない
+    """
+    source = pa.BufferReader(body)
+    tables = []
+    while source.tell() < source.size():
+        tables.append(pa.ipc.open_stream(source).read_all())
+    if not tables:
+        raise pa.ArrowInvalid("Arrow IPC ストリームが空です")
+    return tables
+
+
+def request_fields(table: pa.Table) -> dict[str, Any]:
+    """スキーマメタデータからリクエストフィールドを取り出す
+
+    Raises:
+        ValueError: メタデータが無い、または JSON オブジェクトでない
+    """
+    raw = (table.schema.metadata or {}).get(REQUEST_METADATA_KEY)
+    if raw is None:
+        raise ValueError("スキーマメタデータに request がありません")
+    fields = json.loads(raw)
+    if not isinstance(fields, dict):
+        raise ValueError("request メタデータは JSON オブジェクトである必要があります")
+    return fields
+
+
+def dataset_id(table: pa.Table) -> str | None:
+    """スキーマメタデータから dataset_id を取り出す (無ければ None)"""
+    raw = (table.schema.metadata or {}).get(DATASET_ID_METADATA_KEY)
+    return raw.decode() if raw is not None else None
+
+
+def to_dataframe(table: pa.Table) -> pd.DataFrame:
+    """Arrow Table を DataFrame に変換 (変換後 table のバッファは解放される)"""
+    return table.to_pandas(split_blocks=True, self_destruct=True)
@@ -1,52 +1,56 @@
 """BI Executor - Python コード実行サービス"""
+import asyncio
 import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import asynccontextmanager, contextmanager
+from typing import Any, AsyncGenerator, Callable, Generator
 
 import pandas as pd
-from fastapi import FastAPI, HTTPException
+import pyarrow as pa
+from fastapi import Body, FastAPI, Header, HTTPException, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import ValidationError
 
+from app import arrow_io, worker
 from app.api_models import (
     ExecuteCardRequest,
     ExecuteCardResponse,
     ExecuteErrorResponse,
+    ExecuteTransformArrowRequest,
     ExecuteTransformRequest,
     ExecuteTransformResponse,
 )
-from app.runner import CardRunner
-from app.transform_runner import TransformRunner
 
-app = FastAPI(title="BI Executor")
+# ユーザーコードを実行するワーカープール (初回実行時に作成)
+_pool: ProcessPoolExecutor | None = None
 
-runner = CardRunner(timeout_seconds=10, max_memory_mb=2048)
-transform_runner = TransformRunner(timeout_seconds=300, max_memory_mb=4096)
+# ワーカー内の SIGALRM タイムアウトが効かなかった場合に待つ追加秒数
+WORKER_TIMEOUT_GRACE_SECONDS = 5
 
 
-@app.get("/health")
-def health():
-    return {"status": "ok"}
+@asynccontextmanager
+async def lifespan(_app: FastAPI) -> AsyncGenerator[None, None]:
+    yield
+    if _pool is not None:
+        # 実行中タスクの終了待ちでイベントループを止めない
+        await asyncio.to_thread(_pool.shutdown, cancel_futures=True)
 
 
-@app.post(
-    "/execute/card",
-    response_model=ExecuteCardResponse,
-    responses={400: {"model": ExecuteErrorResponse}, 408: {"model": ExecuteErrorResponse}},
-)
-def execute_card(request: ExecuteCardRequest):
-    """カードのPythonコードを実行してHTMLを返す"""
-    start_time = time.perf_counter()
+app = FastAPI(title="BI Executor", lifespan=lifespan)
+
+_ERROR_RESPONSES = {
+    400: {"model": ExecuteErrorResponse},
+    408: {"model": ExecuteErrorResponse},
+}
+_ARROW_BODY = Body(..., media_type=arrow_io.ARROW_STREAM_MEDIA_TYPE)
 
-    # DataFrameを構築
-    if request.dataset_rows:
-        dataset_df = pd.DataFrame(request.dataset_rows)
-    else:
-        dataset_df = pd.DataFrame()
 
+@contextmanager
+def _execution_errors() -> Generator[None, None, None]:
+    """ユーザーコード実行時の例外をHTTPエラーに変換"""
     try:
-        result = runner.execute(
-            code=request.code,
-            dataset_df=dataset_df,
-            filters=request.filters,
-            params=request.params,
-        )
+        yield
     except TimeoutError as e:
         raise HTTPException(status_code=408, detail=str(e))
     except ValueError as e:
@@ -56,6 +60,81 @@ def execute_card(request: ExecuteCardRequest):
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"実行エラー: {e}")
 
+
+@contextmanager
+def _arrow_request_errors() -> Generator[None, None, None]:
+    """Arrow リクエストの解析エラーを 400/422 に変換"""
+    try:
+        yield
+    except ValidationError as e:
+        raise RequestValidationError(e.errors())
+    except (pa.ArrowException, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"不正な Arrow リクエスト: {e}")
+
+
+def _discard_pool(pool: ProcessPoolExecutor, terminate: bool = False) -> None:
+    """プールを破棄し、次回の実行で作り直させる
+
+    terminate=True の場合はワーカープロセスを強制終了する
+    (同じプールで実行中の他のタスクも BrokenProcessPool で失敗する)。
+    """
+    global _pool
+    # 他のリクエストが作り直した新しいプールは残す
+    if _pool is pool:
+        _pool = None
+    if terminate:
+        # ProcessPoolExecutor には実行中のワーカーを止める公開 API が無い
+        for process in list(pool._processes.values()):
+            process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+async def _run_in_worker(func: Callable[..., Any], *args: Any, timeout: float) -> Any:
+    """ワーカープロセスで実行し、イベントループは他のリクエストに空けておく
+
+    ユーザーコードが SIGALRM を無視したり C 拡張内でブロックしたりすると
+    ワーカー内のタイムアウトは効かないため、timeout + 猶予で打ち切り、
+    ワーカーを止めてプールを作り直す。
+    """
+    global _pool
+    if _pool is None:
+        _pool = worker.create_pool()
+    pool = _pool
+    try:
+        return await asyncio.wait_for(
+            asyncio.get_running_loop().run_in_executor(pool, func, *args),
+            timeout + WORKER_TIMEOUT_GRACE_SECONDS,
+        )
+    except TimeoutError:
+        _discard_pool(pool, terminate=True)
+        raise TimeoutError(f"実行が{timeout}秒を超えました")
+    except BrokenProcessPool:
+        # ワーカーが異常終了したプールは再利用できないため次回作り直す
+        _discard_pool(pool)
+        raise
+
+
+@app.get("/health")
+def health():
+    return {"status": "ok"}
+
+
+async def _run_card(
+    request: ExecuteCardRequest,
+    dataset_df: pd.DataFrame,
+    start_time: float,
+) -> ExecuteCardResponse:
+    """カードを実行してレスポンスを構築"""
+    with _execution_errors():
+        result = await _run_in_worker(
+            worker.run_card,
+            request.code,
+            dataset_df,
+            request.filters,
+            request.params,
+            timeout=worker.CARD_TIMEOUT_SECONDS,
+        )
+
     elapsed_ms = int((time.perf_counter() - start_time) * 1000)
 
     return ExecuteCardResponse(
@@ -67,32 +146,73 @@ def execute_card(request: ExecuteCardRequest):
 
 
 @app.post(
-    "/execute/transform",
-    response_model=ExecuteTransformResponse,
-    responses={400: {"model": ExecuteErrorResponse}, 408: {"model": ExecuteErrorResponse}},
+    "/execute/card",
+    response_model=ExecuteCardResponse,
+    responses=_ERROR_RESPONSES,
 )
-def execute_transform(request: ExecuteTransformRequest):
-    """TransformのPythonコードを実行してDataFrameを返す"""
-    # 入力データセットをDataFrameに変換
-    input_dfs = {
-        dataset_id: pd.DataFrame(rows)
-        for dataset_id, rows in request.input_datasets.items()
-    }
+async def execute_card(request: ExecuteCardRequest):
+    """カードのPythonコードを実行してHTMLを返す"""
+    start_time = time.perf_counter()
 
-    try:
-        result = transform_runner.execute(
-            code=request.code,
-            inputs=input_dfs,
-            params=request.params,
+    # DataFrameを構築
+    if request.dataset_rows:
+        dataset_df = pd.DataFrame(request.dataset_rows)
+    else:
+        dataset_df = pd.DataFrame()
+
+    return await _run_card(request, dataset_df, start_time)
+
+
+@app.post(
+    "/execute/card/arrow",
+    response_model=ExecuteCardResponse,
+    responses=_ERROR_RESPONSES,
+)
+async def execute_card_arrow(body: bytes = _ARROW_BODY):
+    """/execute/card の Arrow IPC 版 (データセットを列指向のまま受け取る)"""
+    start_time = time.perf_counter()
+
+    with _arrow_request_errors():
+        table = arrow_io.read_streams(body)[0]
+        request = ExecuteCardRequest.model_validate(arrow_io.request_fields(table))
+
+    return await _run_card(request, arrow_io.to_dataframe(table), start_time)
+
+
+async def _run_transform(
+    request: ExecuteTransformArrowRequest,
+    input_dfs: dict[str, pd.DataFrame],
+    accept: str | None,
+) -> ExecuteTransformResponse | Response:
+    """Transformを実行してレスポンスを構築
+
+    Accept に Arrow IPC ストリームを含む場合は、出力を行の辞書に展開せず
+    Arrow IPC で返す (件数と実行時間はヘッダーで返す)。
+    """
+    with _execution_errors():
+        result = await _run_in_worker(
+            worker.run_transform,
+            request.code,
+            input_dfs,
+            request.params,
+            timeout=worker.TRANSFORM_TIMEOUT_SECONDS,
+        )
+
+    if accept and arrow_io.ARROW_STREAM_MEDIA_TYPE in accept:
+        try:
+            content = arrow_io.write_stream(result.df)
+        except (pa.ArrowException, ValueError) as e:
+            # Parquet 保存も Arrow 変換を経るため、ここで失敗する出力は保存できない
+            # (列名の重複は pyarrow が ValueError で報告する)
+            raise HTTPException(status_code=400, detail=f"出力を Arrow に変換できません: {e}")
+        return Response(
+            content=content,
+            media_type=arrow_io.ARROW_STREAM_MEDIA_TYPE,
+            headers={
+                "X-Row-Count": str(len(result.df)),
+                "X-Execution-Time-Ms": str(result.execution_time_ms),
+            },
         )
-    except TimeoutError as e:
-        raise HTTPException(status_code=408, detail=str(e))
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except (ImportError, PermissionError, SyntaxError) as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        raise HTTPException(status_code=500, detail=f"実行エラー: {e}")
 
     # DataFrameを辞書のリストに変換
     output_rows = result.df.to_dict(orient='records')
@@ -103,3 +223,47 @@ def execute_transform(request: ExecuteTransformRequest):
         column_names=list(result.df.columns),
         execution_time_ms=result.execution_time_ms,
     )
+
+
+@app.post(
+    "/execute/transform",
+    response_model=ExecuteTransformResponse,
+    responses=_ERROR_RESPONSES,
+)
+async def execute_transform(
+    request: ExecuteTransformRequest,
+    accept: str | None = Header(None),
+):
+    """TransformのPythonコードを実行してDataFrameを返す"""
+    # 入力データセットをDataFrameに変換
+    input_dfs = {
+        dataset_id: pd.DataFrame(rows)
+        for dataset_id, rows in request.input_datasets.items()
+    }
+
+    return await _run_transform(request, input_dfs, accept)
+
+
+@app.post(
+    "/execute/transform/arrow",
+    response_model=ExecuteTransformResponse,
+    responses=_ERROR_RESPONSES,
+)
+async def execute_transform_arrow(
+    body: bytes = _ARROW_BODY,
+    accept: str | None = Header(None),
+):
+    """/execute/transform の Arrow IPC 版 (入力データセットを列指向のまま受け取る)"""
+    with _arrow_request_errors():
+        tables = arrow_io.read_streams(body)
+        request = ExecuteTransformArrowRequest.model_validate(
+            arrow_io.request_fields(tables[0])
+        )
+
+    input_dfs = {
+        dataset_id: arrow_io.to_dataframe(table)
+        for table in tables
+        if (dataset_id := arrow_io.dataset_id(table)) is not None
+    }
+
+    return await _run_transform(request, input_dfs, accept)
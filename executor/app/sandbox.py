@@ -1,7 +1,22 @@
 """SecureExecutor - 安全なPythonコード実行環境"""
 import builtins
+from functools import lru_cache
+from types import CodeType
 from typing import Any
 
+# コンパイル済みコードのキャッシュ上限 (同じTransform/Cardの再実行で再パースを省く)
+CODE_CACHE_SIZE = 256
+
+
+@lru_cache(maxsize=CODE_CACHE_SIZE)
+def _compile_user_code(code: str) -> CodeType:
+    """ユーザーコードをコンパイル (ソース文字列をキーにキャッシュ)
+
+    コードオブジェクトは不変で、実行ごとに新しい名前空間で exec するため
+    共有しても安全。ソースが変われば別キーになるので更新時の無効化は不要。
+    """
+    return compile(code, '<user_code>', 'exec')
+
 
 class SecureExecutor:
     """安全なPythonコード実行"""
@@ -128,7 +143,7 @@ class SecureExecutor:
 
         locals_dict: dict[str, Any] = {}
 
-        compiled = compile(code, '<user_code>', 'exec')
+        compiled = _compile_user_code(code)
         exec(compiled, globals_dict, locals_dict)
 
         return locals_dict
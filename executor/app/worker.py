@@ -0,0 +1,58 @@
+"""ワーカープロセスでのユーザーコード実行
+
+ユーザーコードは CPU を占有するため、API プロセスのイベントループから切り離して
+ProcessPoolExecutor のワーカーで実行する。ワーカーはタスクをメインスレッドで
+処理するので、ResourceLimiter の SIGALRM タイムアウトとメモリ制限がワーカー単位で効く。
+"""
+import multiprocessing as mp
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any
+
+import pandas as pd
+
+from app.models import HTMLResult
+from app.runner import CardRunner
+from app.transform_runner import TransformResult, TransformRunner
+
+# 同時実行数 (未設定時は CPU コア数)
+EXECUTOR_WORKERS = int(os.environ.get("EXECUTOR_WORKERS", os.cpu_count() or 1))
+
+CARD_TIMEOUT_SECONDS = 10
+TRANSFORM_TIMEOUT_SECONDS = 300
+
+# 各ワーカープロセスで import 時に1度だけ構築される
+_card_runner = CardRunner(timeout_seconds=CARD_TIMEOUT_SECONDS, max_memory_mb=2048)
+_transform_runner = TransformRunner(
+    timeout_seconds=TRANSFORM_TIMEOUT_SECONDS, max_memory_mb=4096,
+)
+
+
+def run_card(
+    code: str,
+    dataset_df: pd.DataFrame,
+    filters: dict[str, Any],
+    params: dict[str, Any],
+) -> HTMLResult:
+    """ワーカー内でカードを実行"""
+    return _card_runner.execute(
+        code=code, dataset_df=dataset_df, filters=filters, params=params,
+    )
+
+
+def run_transform(
+    code: str,
+    inputs: dict[str, pd.DataFrame],
+    params: dict[str, Any],
+) -> TransformResult:
+    """ワーカー内でTransformを実行"""
+    return _transform_runner.execute(code=code, inputs=inputs, params=params)
+
+
+def create_pool() -> ProcessPoolExecutor:
+    """ワーカープール作成 (forkserver が使えればスレッドを含む API プロセスを fork しない)"""
+    method = "forkserver" if "forkserver" in mp.get_all_start_methods() else "spawn"
+    return ProcessPoolExecutor(
+        max_workers=EXECUTOR_WORKERS,
+        mp_context=mp.get_context(method),
+    )
@@ -259,3 +259,146 @@ def test_execute_transform_syntax_error():
     })
 
     assert response.status_code == 400
+
+
+# Arrow IPC API Tests
+
+def _arrow_body(df, request_fields=None, dataset_id=None):
+    """Arrow IPC ストリームのリクエストボディを構築"""
+    import json
+    import pandas as pd
+    from app import arrow_io
+
+    metadata = {}
+    if request_fields is not None:
+        metadata[arrow_io.REQUEST_METADATA_KEY] = json.dumps(request_fields).encode()
+    if dataset_id is not None:
+        metadata[arrow_io.DATASET_ID_METADATA_KEY] = dataset_id.encode()
+    return arrow_io.write_stream(df if df is not None else pd.DataFrame(), metadata)
+
+
+def _post_arrow(client, path, body):
+    from app.arrow_io import ARROW_STREAM_MEDIA_TYPE
+    return client.post(path, content=body, headers={"Content-Type": ARROW_STREAM_MEDIA_TYPE})
+
+
+def test_execute_card_arrow_with_dataset():
+    """Arrow IPC で渡したデータセットでカードを実行できる"""
+    import pandas as pd
+    from app.main import app
+    client = TestClient(app)
+
+    body = _arrow_body(
+        pd.DataFrame({"name": ["Alice", "Bob"], "age": [30, 25]}),
+        request_fields={
+            "card_id": "card_arrow",
+            "code": 'def render(dataset, filters, params):\n    return f"<div>{dataset[\'age\'].sum()}</div>"',
+            "dataset_id": "ds_001",
+        },
+    )
+    response = _post_arrow(client, "/execute/card/arrow", body)
+
+    assert response.status_code == 200
+    assert response.json()["html"] == "<div>55</div>"
+
+
+def test_execute_card_arrow_missing_request_metadata():
+    """request メタデータが無いと400エラー"""
+    import pandas as pd
+    from app.main import app
+    client = TestClient(app)
+
+    response = _post_arrow(client, "/execute/card/arrow", _arrow_body(pd.DataFrame({"a": [1]})))
+
+    assert response.status_code == 400
+
+
+def test_execute_card_arrow_invalid_body():
+    """Arrow IPC でないボディは400エラー"""
+    from app.main import app
+    client = TestClient(app)
+
+    response = _post_arrow(client, "/execute/card/arrow", b"not arrow")
+
+    assert response.status_code == 400
+
+
+def test_execute_card_arrow_invalid_request_fields():
+    """request の必須フィールド欠落は422エラー"""
+    from app.main import app
+    client = TestClient(app)
+
+    response = _post_arrow(
+        client, "/execute/card/arrow", _arrow_body(None, request_fields={"card_id": "c"})
+    )
+
+    assert response.status_code == 422
+
+
+def test_execute_transform_arrow_multiple_inputs():
+    """Arrow IPC で渡した複数入力でTransformを実行できる"""
+    import pandas as pd
+    from app.main import app
+    client = TestClient(app)
+
+    body = _arrow_body(
+        pd.DataFrame({"product_id": [1, 2], "quantity": [10, 20]}),
+        request_fields={
+            "transform_id": "tf_arrow",
+            "code": "def transform(inputs, params):\n    return inputs['sales'].merge(inputs['products'], on='product_id')",
+        },
+        dataset_id="sales",
+    ) + _arrow_body(
+        pd.DataFrame({"product_id": [1, 2], "name": ["A", "B"]}),
+        dataset_id="products",
+    )
+    response = _post_arrow(client, "/execute/transform/arrow", body)
+
+    assert response.status_code == 200
+    data = response.json()
+    assert data["row_count"] == 2
+    assert set(data["column_names"]) == {"product_id", "quantity", "name"}
+
+
+def test_execute_transform_arrow_response():
+    """Accept に Arrow IPC を指定すると出力を Arrow IPC で返す"""
+    import pyarrow as pa
+    from app.arrow_io import ARROW_STREAM_MEDIA_TYPE
+    from app.main import app
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute/transform",
+        json={
+            "transform_id": "tf_arrow_out",
+            "code": "def transform(inputs, params):\n    df = inputs['data'].copy()\n    df['doubled'] = df['value'] * 2\n    return df",
+            "input_datasets": {"data": [{"value": 10}, {"value": 20}]},
+        },
+        headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 200
+    assert response.headers["content-type"] == ARROW_STREAM_MEDIA_TYPE
+    assert response.headers["x-row-count"] == "2"
+    assert "x-execution-time-ms" in response.headers
+    table = pa.ipc.open_stream(response.content).read_all()
+    assert table.column("doubled").to_pylist() == [20, 40]
+
+
+def test_execute_transform_arrow_response_duplicate_columns():
+    """Arrow IPC に変換できない出力 (列名の重複) は400エラー"""
+    from app.arrow_io import ARROW_STREAM_MEDIA_TYPE
+    from app.main import app
+    client = TestClient(app)
+
+    response = client.post(
+        "/execute/transform",
+        json={
+            "transform_id": "tf_arrow_dup",
+            "code": "import pandas as pd\n\ndef transform(inputs, params):\n    return pd.concat([inputs['data'], inputs['data']], axis=1)",
+            "input_datasets": {"data": [{"value": 10}, {"value": 20}]},
+        },
+        headers={"Accept": ARROW_STREAM_MEDIA_TYPE},
+    )
+
+    assert response.status_code == 400
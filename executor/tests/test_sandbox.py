@@ -124,3 +124,28 @@ result = {
         executor = self._make_executor()
         with pytest.raises(ImportError, match="許可されていません"):
             executor.execute("import os.path", {}, {})
+
+    def test_compiled_code_is_cached(self):
+        """同じコードの再実行ではコンパイル結果を再利用する"""
+        from app.sandbox import _compile_user_code
+        executor = self._make_executor()
+        code = "x = 40 + 2"
+        _compile_user_code.cache_clear()
+
+        first = executor.execute(code, {}, {})
+        second = executor.execute(code, {}, {})
+
+        assert first["x"] == second["x"] == 42
+        info = _compile_user_code.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
+    def test_cached_code_does_not_share_namespace(self):
+        """キャッシュされたコードでも実行ごとに名前空間は独立"""
+        executor = self._make_executor()
+        code = "items = []\nitems.append(1)"
+        first = executor.execute(code, {}, {})
+        second = executor.execute(code, {}, {})
+        assert first["items"] == [1]
+        assert second["items"] == [1]
+        assert first["items"] is not second["items"]
@@ -0,0 +1,78 @@
+"""ワーカープール実行のテスト"""
+import asyncio
+import os
+import time
+from concurrent.futures import Executor
+from concurrent.futures.process import BrokenProcessPool
+
+import pytest
+
+
+class _BrokenExecutor(Executor):
+    """submit が常に BrokenProcessPool を送出するプール"""
+
+    def __init__(self):
+        self.shutdown_calls = []
+
+    def submit(self, fn, /, *args, **kwargs):
+        raise BrokenProcessPool("worker died")
+
+    def shutdown(self, wait=True, *, cancel_futures=False):
+        self.shutdown_calls.append({"wait": wait, "cancel_futures": cancel_futures})
+
+
+@pytest.fixture(autouse=True)
+def _shutdown_pool():
+    """テストで作成されたグローバルプールを後始末する"""
+    from app import main
+
+    yield
+    if main._pool is not None:
+        main._pool.shutdown(cancel_futures=True)
+        main._pool = None
+
+
+def test_run_in_worker_uses_separate_process():
+    """ユーザーコードは API プロセスとは別のプロセスで実行される"""
+    from app import main
+
+    worker_pid = asyncio.run(main._run_in_worker(os.getpid, timeout=10))
+
+    assert worker_pid != os.getpid()
+
+
+def test_broken_pool_is_recreated(monkeypatch):
+    """ワーカーが異常終了したプールは破棄され、次回作り直される"""
+    from app import main
+
+    broken = _BrokenExecutor()
+    monkeypatch.setattr(main, "_pool", broken)
+
+    with pytest.raises(BrokenProcessPool):
+        asyncio.run(main._run_in_worker(os.getpid, timeout=10))
+
+    assert main._pool is None
+    assert broken.shutdown_calls == [{"wait": False, "cancel_futures": True}]
+
+
+def test_hung_worker_is_terminated(monkeypatch):
+    """ワーカー内のタイムアウトが効かない場合もタイムアウトし、ワーカーを止める"""
+    from app import main
+
+    monkeypatch.setattr(main, "WORKER_TIMEOUT_GRACE_SECONDS", 0)
+
+    async def run():
+        task = asyncio.create_task(main._run_in_worker(time.sleep, 60, timeout=2))
+        await asyncio.sleep(1)
+        processes = list(main._pool._processes.values())
+        with pytest.raises(TimeoutError):
+            await task
+        return processes
+
+    processes = asyncio.run(run())
+
+    assert main._pool is None
+    assert processes
+    for process in processes:
+        process.join(timeout=5)
+        assert not process.is_alive()